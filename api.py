@@ -0,0 +1,174 @@
+"""
+Read-only JSON API for ZjadowRealm content
+
+Versioned list and detail endpoints for game reviews, movie reviews, music
+tracks and recipes. Lists use keyset pagination and optional field
+selection, and recipes can be filtered with ``?ingredient=``. Every
+response carries an ETag derived from the newest ``updated_at`` (plus the
+row count for lists) so unchanged data revalidates with a 304 before any
+rows are loaded. Detail responses also carry Last-Modified; lists do not,
+because a date alone cannot tell that a row was deleted.
+"""
+import hashlib
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import login_required
+from sqlalchemy import func
+
+from models import db, Recipe, GameReview, MovieReview, MusicTrack
+from pagination import keyset_paginate
+from recipes import recipes_containing
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is the fallback
+    orjson = None
+    import json
+
+api = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# URL name -> (model, public fields)
+RESOURCES = {
+    'game-reviews': (GameReview, ('id', 'title', 'rating', 'review_text', 'image_url',
+                                  'platform', 'genre', 'created_at', 'updated_at')),
+    'movie-reviews': (MovieReview, ('id', 'title', 'rating', 'review_text', 'image_url',
+                                    'year', 'genre', 'created_at', 'updated_at')),
+    'music': (MusicTrack, ('id', 'title', 'video_id', 'description', 'artist',
+                           'created_at', 'updated_at')),
+    'recipes': (Recipe, ('id', 'title', 'icon', 'color', 'prep_time', 'cook_time',
+                         'servings', 'ingredients', 'instructions',
+                         'created_at', 'updated_at')),
+}
+
+MAX_PAGE_SIZE = 100
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Cannot serialize {type(value).__name__}')
+
+
+def dumps(payload):
+    """Encode ``payload`` as JSON bytes with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=_default, separators=(',', ':')).encode('utf-8')
+
+
+def _error(message, status):
+    response = jsonify(error=message)
+    response.status_code = status
+    return response
+
+
+def _selected_fields(fields):
+    """Fields requested via ``?fields=`` (all public fields by default)"""
+    requested = request.args.get('fields')
+    if not requested:
+        return fields
+    selected = tuple(name.strip() for name in requested.split(',') if name.strip())
+    unknown = [name for name in selected if name not in fields]
+    if unknown:
+        return None
+    return selected
+
+
+def _json_response(payload, etag, last_modified):
+    response = current_app.response_class(dumps(payload), mimetype='application/json')
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add('Cookie')
+    return response.make_conditional(request)
+
+
+def _not_modified(etag, last_modified):
+    """True if the client's validators still match"""
+    if request.if_none_match:
+        # Weak comparison: compressed responses carry a weak ETag
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since.replace(tzinfo=None)
+    return False
+
+
+def _not_modified_response(etag, last_modified):
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    return response
+
+
+@api.route('/<resource>')
+@login_required
+def list_items(resource):
+    """List one content type, newest first"""
+    if resource not in RESOURCES:
+        return _error(f'Unknown resource "{resource}"', 404)
+    model, fields = RESOURCES[resource]
+    selected = _selected_fields(fields)
+    if selected is None:
+        return _error(f'Unknown field; choose from: {", ".join(fields)}', 400)
+    try:
+        limit = min(max(int(request.args.get('limit', 20)), 1), MAX_PAGE_SIZE)
+    except ValueError:
+        return _error('limit must be an integer', 400)
+
+    # Cheap validators first: one aggregate instead of loading any rows
+    last_modified, total = db.session.query(
+        func.max(model.updated_at), func.count(model.id)).one()
+    validator = f'{resource}|{last_modified}|{total}|{request.query_string.decode()}'
+    etag = hashlib.sha1(validator.encode('utf-8')).hexdigest()
+    # No Last-Modified on lists: a deleted older row leaves max(updated_at)
+    # unchanged, so If-Modified-Since would answer 304 with stale data. The
+    # ETag covers deletes through the row count.
+    if _not_modified(etag, None):
+        return _not_modified_response(etag, None)
+
+    # Keyset pagination needs the ordering key even if it was not requested
+    columns = dict.fromkeys(selected + ('id', 'created_at'))
+    query = db.session.query(*[getattr(model, name) for name in columns])
+    if model is Recipe and request.args.get('ingredient'):
+        try:
+            containing = recipes_containing(request.args['ingredient'])
+        except ValueError:
+            return _error('ingredient must name an ingredient', 400)
+        query = query.filter(Recipe.id.in_(containing.order_by(None).with_entities(Recipe.id)))
+    page = keyset_paginate(query, model, request.args.get('cursor'), limit)
+
+    payload = {
+        'data': [{name: getattr(row, name) for name in selected} for row in page],
+        'next_cursor': page.next_cursor,
+        'total': total,
+    }
+    return _json_response(payload, etag, None)
+
+
+@api.route('/<resource>/<int:item_id>')
+@login_required
+def get_item(resource, item_id):
+    """Fetch a single item"""
+    if resource not in RESOURCES:
+        return _error(f'Unknown resource "{resource}"', 404)
+    model, fields = RESOURCES[resource]
+    selected = _selected_fields(fields)
+    if selected is None:
+        return _error(f'Unknown field; choose from: {", ".join(fields)}', 400)
+
+    last_modified = db.session.query(model.updated_at).filter(model.id == item_id).scalar()
+    if last_modified is None and db.session.get(model, item_id) is None:
+        return _error(f'{resource} {item_id} not found', 404)
+    validator = f'{resource}|{item_id}|{last_modified}|{request.query_string.decode()}'
+    etag = hashlib.sha1(validator.encode('utf-8')).hexdigest()
+    if _not_modified(etag, last_modified):
+        return _not_modified_response(etag, last_modified)
+
+    row = db.session.query(*[getattr(model, name) for name in selected]) \
+        .filter(model.id == item_id).one()
+    return _json_response({'data': {name: getattr(row, name) for name in selected}},
+                          etag, last_modified)
@@ -1,11 +1,40 @@
-from flask import Flask, render_template, redirect, url_for, request, flash, jsonify
+from flask import Flask, render_template, redirect, url_for, request, flash, jsonify, abort, stream_with_context
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+import click
 from datetime import datetime
+import csv
+import io
 import os
 import json
+import hashlib
+import hmac
+import tempfile
+import threading
 
-from models import db, User, Recipe, GameReview, MovieReview, MusicTrack
+from api import api, RESOURCES
+from assets import asset_manifest, build_assets, DIST_DIR, PRECACHE
+from bulk import FORMATS, export_rows, format_for, import_rows, read_rows
+from chess_ai import chess_engine, describe_move, parse_state, EngineBusy
+from content_pages import content_pages, review_stats
+from content_stats import content_stats
+from database import engine_options, query_stats
+from hashing import password_hasher, HashingBusy
+from metrics import request_metrics
+from models import db, ensure_indexes, User, Recipe, GameReview, MovieReview, MusicTrack
+from pagination import keyset_paginate
+from recipes import backfill as backfill_recipes, sync_structure
+from scores import scores, score_buffer
+from search import search_index
+from sessions import session_store
+from static_files import static_files
+from tasks import task_queue
+from page_cache import page_cache, content_page
+from puzzles import puzzles, puzzle_pool
+from ratelimit import rate_limiter, RateLimitExceeded
+from user_cache import UserIdentityCache
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -16,17 +45,166 @@ if database_url.startswith('postgres://'):
     database_url = database_url.replace('postgres://', 'postgresql://', 1)
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(database_url)
+
+# Query instrumentation (slow-request threshold in ms, repeats flagged as N+1)
+app.config['SLOW_SQL_MS'] = float(os.environ.get('SLOW_SQL_MS', 200))
+app.config['N_PLUS_ONE_THRESHOLD'] = int(os.environ.get('N_PLUS_ONE_THRESHOLD', 5))
+app.config['SQL_TIMING_HEADERS'] = os.environ.get('SQL_TIMING_HEADERS', '0') == '1'
+
+# Identity cache for load_user (seconds / number of entries)
+app.config['USER_CACHE_TTL'] = int(os.environ.get('USER_CACHE_TTL', 60))
+app.config['USER_CACHE_SIZE'] = int(os.environ.get('USER_CACHE_SIZE', 1024))
+
+# Rows per page on the admin content listings
+app.config['ADMIN_PAGE_SIZE'] = int(os.environ.get('ADMIN_PAGE_SIZE', 24))
+
+# Password hashing pool (PBKDF2 cost is part of the method string)
+app.config['PASSWORD_HASH_METHOD'] = os.environ.get('PASSWORD_HASH_METHOD', 'pbkdf2:sha256:600000')
+app.config['HASH_POOL_SIZE'] = int(os.environ.get('HASH_POOL_SIZE', 2))
+app.config['HASH_QUEUE_SIZE'] = int(os.environ.get('HASH_QUEUE_SIZE', 8))
+app.config['HASH_RETRY_AFTER'] = int(os.environ.get('HASH_RETRY_AFTER', 2))
+
+# Rendered-page cache for the static content routes
+app.config['PAGE_CACHE_ENABLED'] = os.environ.get('PAGE_CACHE_ENABLED', '1') == '1'
+app.config['PAGE_CACHE_SIZE'] = int(os.environ.get('PAGE_CACHE_SIZE', 512))
+# Serve those page shells to anyone, cacheable by shared proxies (seconds)
+app.config['PUBLIC_PAGES'] = os.environ.get('PUBLIC_PAGES', '0') == '1'
+app.config['PUBLIC_PAGE_MAX_AGE'] = int(os.environ.get('PUBLIC_PAGE_MAX_AGE', 300))
+# Reviews, tracks and recipes per listing page, and rendered item cards kept per worker
+app.config['CONTENT_PAGE_SIZE'] = int(os.environ.get('CONTENT_PAGE_SIZE', 20))
+app.config['FRAGMENT_CACHE_SIZE'] = int(os.environ.get('FRAGMENT_CACHE_SIZE', 2048))
+
+# Seconds between full recounts of the dashboard content counters
+app.config['CONTENT_STATS_RECONCILE'] = int(os.environ.get('CONTENT_STATS_RECONCILE', 600))
+
+# Per-route metrics: shared directory for worker snapshots, optional scrape token
+app.config['METRICS_DIR'] = os.environ.get('METRICS_DIR', os.path.join(tempfile.gettempdir(), 'zjadowrealm-metrics'))
+app.config['METRICS_FLUSH_INTERVAL'] = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+app.config['METRICS_TOKEN'] = os.environ.get('METRICS_TOKEN')
+
+# Leaderboard score buffering (rows / seconds) and ranking cache lifetime
+app.config['SCORE_FLUSH_SIZE'] = int(os.environ.get('SCORE_FLUSH_SIZE', 200))
+app.config['SCORE_FLUSH_INTERVAL'] = float(os.environ.get('SCORE_FLUSH_INTERVAL', 5))
+app.config['SCORE_BUFFER_MAX'] = int(os.environ.get('SCORE_BUFFER_MAX', 10000))
+app.config['LEADERBOARD_TTL'] = int(os.environ.get('LEADERBOARD_TTL', 30))
+
+# Server-side chess AI: search time per move (seconds), depth cap, process pool
+app.config['CHESS_AI_TIME_BUDGET'] = float(os.environ.get('CHESS_AI_TIME_BUDGET', 1.0))
+app.config['CHESS_AI_MAX_DEPTH'] = int(os.environ.get('CHESS_AI_MAX_DEPTH', 8))
+app.config['CHESS_POOL_SIZE'] = int(os.environ.get('CHESS_POOL_SIZE', 2))
+app.config['CHESS_QUEUE_SIZE'] = int(os.environ.get('CHESS_QUEUE_SIZE', 4))
+
+# Ready-made Strands/Word Guess puzzles kept per worker
+app.config['PUZZLE_POOL_SIZE'] = int(os.environ.get('PUZZLE_POOL_SIZE', 16))
+
+# Login/signup/change-password and admin write throttling: 'N/second|minute|hour|day'
+# buckets shared by workers through a SQLite file ('memory' keeps them per worker)
+app.config['RATELIMIT_ENABLED'] = os.environ.get('RATELIMIT_ENABLED', '1') == '1'
+app.config['RATELIMIT_STORAGE'] = os.environ.get('RATELIMIT_STORAGE', os.path.join(tempfile.gettempdir(), 'zjadowrealm-ratelimit.sqlite3'))
+app.config['RATELIMIT_PROXY_COUNT'] = int(os.environ.get('RATELIMIT_PROXY_COUNT', 1 if os.environ.get('RENDER') else 0))
+app.config['RATELIMIT_AUTH_PER_IP'] = os.environ.get('RATELIMIT_AUTH_PER_IP', '20/minute')
+app.config['RATELIMIT_AUTH_PER_USER'] = os.environ.get('RATELIMIT_AUTH_PER_USER', '5/minute')
+app.config['RATELIMIT_ADMIN'] = os.environ.get('RATELIMIT_ADMIN', '60/minute')
+app.config['RATELIMIT_SCORES'] = os.environ.get('RATELIMIT_SCORES', '30/minute')
+
+# Background job worker: jobs per batch, retries (base delay doubles each
+# attempt), idle poll interval and seconds before a stuck job is retried
+app.config['JOB_BATCH_SIZE'] = int(os.environ.get('JOB_BATCH_SIZE', 100))
+app.config['JOB_MAX_ATTEMPTS'] = int(os.environ.get('JOB_MAX_ATTEMPTS', 5))
+app.config['JOB_RETRY_DELAY'] = float(os.environ.get('JOB_RETRY_DELAY', 10))
+app.config['JOB_POLL_INTERVAL'] = float(os.environ.get('JOB_POLL_INTERVAL', 1))
+app.config['JOB_LEASE'] = int(os.environ.get('JOB_LEASE', 300))
+
+# Session storage: 'cookie' (signed cookie) or 'database' (the cookie only
+# holds an id); decoded sessions cached per worker, idle expiry refresh
+# interval and seconds between sweeps of expired sessions
+app.config['SESSION_STORE'] = os.environ.get('SESSION_STORE', 'cookie')
+app.config['SESSION_CACHE_SIZE'] = int(os.environ.get('SESSION_CACHE_SIZE', 10000))
+app.config['SESSION_CACHE_TTL'] = float(os.environ.get('SESSION_CACHE_TTL', 60))
+app.config['SESSION_TOUCH_INTERVAL'] = int(os.environ.get('SESSION_TOUCH_INTERVAL', 300))
+app.config['SESSION_ANON_LIFETIME'] = int(os.environ.get('SESSION_ANON_LIFETIME', 600))
+app.config['SESSION_SWEEP_INTERVAL'] = int(os.environ.get('SESSION_SWEEP_INTERVAL', 3600))
+
+# Rows per transaction for bulk content imports
+app.config['BULK_CHUNK_SIZE'] = int(os.environ.get('BULK_CHUNK_SIZE', 500))
+
+# Build fingerprinted static bundles on boot when the manifest is stale
+app.config['ASSETS_BUILD_ON_STARTUP'] = os.environ.get('ASSETS_BUILD_ON_STARTUP', '1') == '1'
+
+# Static files: cache lifetime for unversioned files (seconds); dynamic
+# responses smaller than COMPRESS_MIN_SIZE bytes go out uncompressed
+app.config['STATIC_MAX_AGE'] = int(os.environ.get('STATIC_MAX_AGE', 86400))
+app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+app.config['COMPRESS_LEVEL'] = int(os.environ.get('COMPRESS_LEVEL', 6))
 
 # Initialize extensions
 db.init_app(app)
+session_store.init_app(app)
+password_hasher.init_app(app)
+rate_limiter.init_app(app)
+page_cache.init_app(app)
+content_pages.init_app(app)
+asset_manifest.init_app(app)
+content_stats.init_app(app)
+query_stats.init_app(app)
+search_index.init_app(app)
+task_queue.init_app(app)
+score_buffer.init_app(app)
+chess_engine.init_app(app)
+puzzle_pool.init_app(app)
+request_metrics.init_app(app)
+# Registered last so its after_request runs first and metrics see wire sizes
+static_files.init_app(app)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
+app.register_blueprint(api)
+app.register_blueprint(scores)
+app.register_blueprint(puzzles)
+user_cache = UserIdentityCache(ttl=app.config['USER_CACHE_TTL'],
+                               maxsize=app.config['USER_CACHE_SIZE'])
+
+# Templates served through page_cache by the public routes below; the
+# database-backed listings go through content_pages instead
+CACHED_PAGE_TEMPLATES = (
+    'index.html',
+    'about.html',
+    'discord.html',
+    'steam.html',
+    'games_hub.html',
+    'game_snake.html',
+    'game_pong.html',
+    'game_memory.html',
+    'game_tetris.html',
+    'game_platformer.html',
+    'game_pirates.html',
+    'game_chess.html',
+    'game_tictactoe.html',
+    'game_wordguess.html',
+    'game_strands.html',
+    'training.html',
+    'food.html',
+    'tutorials.html',
+    'tools.html',
+    'game_blog.html',
+    'minecraft.html',
+)
 
-# Create tables on startup
-with app.app_context():
+def init_db():
+    """Create tables, indexes, content counters and the search index (idempotent)"""
     db.create_all()
-    # Create admin user if it doesn't exist
+    ensure_indexes()
+    # The listing pages' cache version reads these counters
+    content_stats.reconcile()
+    content_stats.schedule_reconcile()
+    session_store.schedule_sweep()
+    db.session.commit()
+    if search_index.create_tables():
+        search_index.rebuild()
+
+def seed_admin():
+    """Create the admin user if it doesn't exist (idempotent)"""
     admin = User.query.filter_by(username='ZjadowPotato').first()
     if not admin:
         # Check if email already exists (from old admin account)
@@ -47,15 +225,115 @@ with app.app_context():
         db.session.commit()
         print("Admin user created: username='ZjadowPotato', password='ZjadowPotato'")
 
+def seed_content():
+    """Import the starter recipes and music tracks into empty tables (idempotent)"""
+    for resource, model in (('recipes', Recipe), ('music', MusicTrack)):
+        if db.session.query(model.id).first() is not None:
+            continue
+        path = os.path.join(app.root_path, 'seed', f'{resource}.jsonl')
+        with open(path, encoding='utf-8') as f:
+            report = import_rows(resource, read_rows(f, 'jsonl'))
+        print(f"Seeded {resource}: {report.summary()}")
+
+def warm_page_cache():
+    """Pre-render the cached page shells"""
+    page_cache.warm(app, CACHED_PAGE_TEMPLATES)
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return user_cache.get(int(user_id), lambda uid: User.query.get(uid))
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create the database schema; run once per release, not per worker"""
+    init_db()
+    print("Database initialized")
+
+@app.cli.command('seed-admin')
+def seed_admin_command():
+    """Create the admin account if it is missing"""
+    seed_admin()
+
+@app.cli.command('seed-content')
+def seed_content_command():
+    """Add the starter recipes and music tracks if those tables are empty"""
+    seed_content()
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Minify and fingerprint the static bundles into static/dist"""
+    manifest = build_assets(app.static_folder)
+    print(f"Built {len(manifest)} assets into static/dist")
+
+@app.cli.command('rebuild-search')
+def rebuild_search_command():
+    """Re-index all content for /search"""
+    search_index.create_tables()
+    print(f"Indexed {search_index.rebuild()} items")
+
+@app.cli.command('backfill-recipes')
+def backfill_recipes_command():
+    """Split existing recipe text into ingredient and step rows"""
+    print(f"Backfilled {backfill_recipes()} recipes")
+
+@app.cli.command('run-worker')
+def run_worker_command():
+    """Process background jobs (search indexing, counter recounts, session sweeps) until stopped"""
+    print("Job worker started")
+    task_queue.work()
+
+@app.cli.command('import-content')
+@click.argument('resource', type=click.Choice(sorted(RESOURCES)))
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def import_content_command(resource, path):
+    """Bulk-import content from a CSV or JSON Lines (.jsonl) file"""
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        report = import_rows(resource, read_rows(f, format_for(path)),
+                             chunk_size=app.config['BULK_CHUNK_SIZE'])
+    for line, message in report.errors:
+        print(f"  line {line}: {message}")
+    print(report.summary())
+
+@app.cli.command('export-content')
+@click.argument('resource', type=click.Choice(sorted(RESOURCES)))
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+def export_content_command(resource, path):
+    """Export content to a CSV or JSON Lines (.jsonl) file"""
+    with open(path, 'wb') as f:
+        for chunk in export_rows(resource, format_for(path)):
+            f.write(chunk)
+    print(f"Exported {resource} to {path}")
+
+@app.errorhandler(HashingBusy)
+def hashing_busy(error):
+    """Shed login/signup load while the hashing pool is saturated"""
+    response = app.response_class('Server is busy, please try again in a moment.',
+                                  status=503, mimetype='text/plain')
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+@app.errorhandler(RateLimitExceeded)
+def rate_limited(error):
+    """Turn away clients over their login, admin or score request budget"""
+    response = app.response_class('Too many requests, please slow down and try again later.',
+                                  status=429, mimetype='text/plain')
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
+@app.errorhandler(EngineBusy)
+def engine_busy(error):
+    """Tell the chess client to fall back to its local AI for now"""
+    response = jsonify(error='Chess engine is busy')
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
 
 # Updated: Force deployment refresh with authentication v3.0
 print("Starting Zjadow Realm Flask application v3.0 with authentication...")
 
 # Authentication routes
 @app.route('/login', methods=['GET', 'POST'])
+@rate_limiter.limit('auth', account=lambda: request.form.get('username'), methods=('POST',))
 def login():
     """Login page"""
     if current_user.is_authenticated:
@@ -73,6 +351,11 @@ def login():
                 flash('Your account is pending approval. Please wait for admin approval.', 'warning')
                 return redirect(url_for('login'))
             
+            # Transparently upgrade hashes made with an older method or cost
+            if user.password_needs_rehash():
+                user.set_password(password)
+                db.session.commit()
+            
             login_user(user, remember=remember)
             next_page = request.args.get('next')
             return redirect(next_page) if next_page else redirect(url_for('home'))
@@ -82,6 +365,7 @@ def login():
     return render_template('login.html')
 
 @app.route('/signup', methods=['GET', 'POST'])
+@rate_limiter.limit('auth', account=lambda: request.form.get('username'), methods=('POST',))
 def signup():
     """Signup page"""
     if current_user.is_authenticated:
@@ -127,6 +411,7 @@ def logout():
 
 @app.route('/change-password', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('auth', account=lambda: current_user.username, methods=('POST',))
 def change_password():
     """Change user password"""
     if request.method == 'POST':
@@ -134,8 +419,11 @@ def change_password():
         new_password = request.form.get('new_password')
         confirm_password = request.form.get('confirm_password')
         
+        # current_user is a cached identity; password work needs the real row
+        user = User.query.get_or_404(current_user.id)
+        
         # Verify current password
-        if not current_user.check_password(current_password):
+        if not user.check_password(current_password):
             flash('Current password is incorrect', 'danger')
             return redirect(url_for('change_password'))
         
@@ -145,8 +433,9 @@ def change_password():
             return redirect(url_for('change_password'))
         
         # Update password
-        current_user.set_password(new_password)
+        user.set_password(new_password)
         db.session.commit()
+        user_cache.invalidate(user.id)
         
         flash('Password changed successfully!', 'success')
         return redirect(url_for('home'))
@@ -162,28 +451,26 @@ def admin_dashboard():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('home'))
     
-    # Get pending users
-    pending_users = User.query.filter_by(is_approved=False, is_admin=False).all()
-    
-    # Get approved users (excluding admin)
-    approved_users = User.query.filter_by(is_approved=True, is_admin=False).all()
+    # All content counts from the maintained counters (read-only, no commit)
+    counts = content_stats.counts()
     
-    # Get all content counts
-    recipes_count = Recipe.query.count()
-    game_reviews_count = GameReview.query.count()
-    movie_reviews_count = MovieReview.query.count()
-    music_tracks_count = MusicTrack.query.count()
+    # Non-admin users in one query, split by approval state in Python
+    pending_users = []
+    approved_users = []
+    for user in User.query.filter_by(is_admin=False).order_by(User.id).all():
+        (approved_users if user.is_approved else pending_users).append(user)
     
     return render_template('admin_dashboard.html', 
                          pending_users=pending_users,
                          approved_users=approved_users,
-                         recipes_count=recipes_count,
-                         game_reviews_count=game_reviews_count,
-                         movie_reviews_count=movie_reviews_count,
-                         music_tracks_count=music_tracks_count)
+                         recipes_count=counts['recipes'],
+                         game_reviews_count=counts['game_reviews'],
+                         movie_reviews_count=counts['movie_reviews'],
+                         music_tracks_count=counts['music_tracks'])
 
 @app.route('/admin/approve-user/<int:user_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def approve_user(user_id):
     """Approve a pending user"""
     if not current_user.is_admin:
@@ -193,12 +480,14 @@ def approve_user(user_id):
     user = User.query.get_or_404(user_id)
     user.is_approved = True
     db.session.commit()
+    user_cache.invalidate(user_id)
     
     flash(f'User {user.username} has been approved!', 'success')
     return redirect(url_for('admin_dashboard'))
 
 @app.route('/admin/reject-user/<int:user_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def reject_user(user_id):
     """Reject and delete a pending user"""
     if not current_user.is_admin:
@@ -209,12 +498,15 @@ def reject_user(user_id):
     username = user.username
     db.session.delete(user)
     db.session.commit()
+    user_cache.invalidate(user_id)
+    session_store.revoke_user(user_id)
     
     flash(f'User {username} has been rejected and removed.', 'info')
     return redirect(url_for('admin_dashboard'))
 
 @app.route('/admin/delete-user/<int:user_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def delete_user(user_id):
     """Delete an approved user"""
     if not current_user.is_admin:
@@ -231,10 +523,77 @@ def delete_user(user_id):
     username = user.username
     db.session.delete(user)
     db.session.commit()
+    user_cache.invalidate(user_id)
+    session_store.revoke_user(user_id)
     
     flash(f'User {username} has been deleted.', 'success')
     return redirect(url_for('admin_dashboard'))
 
+@app.route('/admin/stats/user-cache')
+@login_required
+def admin_user_cache_stats():
+    """Hit/miss counters for the load_user identity cache"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    
+    return jsonify(user_cache.stats())
+
+@app.route('/admin/stats/sessions')
+@login_required
+def admin_session_stats():
+    """Hit/miss counters for the server-side session cache"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    
+    return jsonify(session_store.stats())
+
+@app.route('/admin/stats/page-cache')
+@login_required
+def admin_page_cache_stats():
+    """Hit/miss counters for the rendered-page and item fragment caches"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    
+    return jsonify(dict(page_cache.stats(), fragments=content_pages.stats()))
+
+@app.route('/admin/stats/queries')
+@login_required
+def admin_query_stats():
+    """Per-route query counts and SQL time"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    
+    return jsonify(query_stats.stats())
+
+@app.route('/admin/stats/jobs')
+@login_required
+def admin_job_stats():
+    """Background job queue depth and failures"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    
+    return jsonify(task_queue.stats())
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for admins or scrapers holding METRICS_TOKEN"""
+    token = app.config['METRICS_TOKEN']
+    authorization = request.headers.get('Authorization', '')
+    if not (token and hmac.compare_digest(authorization, f'Bearer {token}')):
+        if not current_user.is_authenticated:
+            return login_manager.unauthorized()
+        if not current_user.is_admin:
+            flash('Access denied. Admin privileges required.', 'danger')
+            return redirect(url_for('home'))
+    
+    return app.response_class(request_metrics.render_prometheus(),
+                              mimetype='text/plain; version=0.0.4')
+
 # Admin content management routes
 @app.route('/admin/recipes')
 @login_required
@@ -244,11 +603,17 @@ def admin_recipes():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('home'))
     
-    recipes = Recipe.query.order_by(Recipe.created_at.desc()).all()
+    # Only the columns shown on the cards; ingredients/instructions stay on disk
+    query = db.session.query(Recipe.id, Recipe.title, Recipe.icon, Recipe.color,
+                             Recipe.prep_time, Recipe.cook_time, Recipe.servings,
+                             Recipe.created_at)
+    recipes = keyset_paginate(query, Recipe, request.args.get('cursor'),
+                              app.config['ADMIN_PAGE_SIZE'])
     return render_template('admin_recipes.html', recipes=recipes)
 
 @app.route('/admin/recipes/add', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_add_recipe():
     """Add new recipe"""
     if not current_user.is_admin:
@@ -276,7 +641,10 @@ def admin_add_recipe():
             instructions=instructions,
             created_by=current_user.id
         )
+        sync_structure(recipe)
         db.session.add(recipe)
+        db.session.flush()
+        search_index.queue_update(recipe)
         db.session.commit()
         
         flash(f'Recipe "{title}" added successfully!', 'success')
@@ -286,6 +654,7 @@ def admin_add_recipe():
 
 @app.route('/admin/recipes/edit/<int:recipe_id>', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_edit_recipe(recipe_id):
     """Edit existing recipe"""
     if not current_user.is_admin:
@@ -303,7 +672,9 @@ def admin_edit_recipe(recipe_id):
         recipe.servings = request.form.get('servings')
         recipe.ingredients = request.form.get('ingredients')
         recipe.instructions = request.form.get('instructions')
+        sync_structure(recipe)
         
+        search_index.queue_update(recipe)
         db.session.commit()
         
         flash(f'Recipe "{recipe.title}" updated successfully!', 'success')
@@ -313,6 +684,7 @@ def admin_edit_recipe(recipe_id):
 
 @app.route('/admin/recipes/delete/<int:recipe_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def admin_delete_recipe(recipe_id):
     """Delete recipe"""
     if not current_user.is_admin:
@@ -322,6 +694,7 @@ def admin_delete_recipe(recipe_id):
     recipe = Recipe.query.get_or_404(recipe_id)
     title = recipe.title
     db.session.delete(recipe)
+    search_index.queue_remove(Recipe, recipe_id)
     db.session.commit()
     
     flash(f'Recipe "{title}" deleted successfully!', 'info')
@@ -335,11 +708,18 @@ def admin_game_reviews():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('home'))
     
-    reviews = GameReview.query.order_by(GameReview.created_at.desc()).all()
+    # Cards show a 100-character excerpt, so never load the full review_text
+    query = db.session.query(GameReview.id, GameReview.title, GameReview.rating,
+                             GameReview.image_url, GameReview.platform, GameReview.genre,
+                             func.substr(GameReview.review_text, 1, 101).label('review_text'),
+                             GameReview.created_at)
+    reviews = keyset_paginate(query, GameReview, request.args.get('cursor'),
+                              app.config['ADMIN_PAGE_SIZE'])
     return render_template('admin_game_reviews.html', reviews=reviews)
 
 @app.route('/admin/game-reviews/add', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_add_game_review():
     """Add new game review"""
     if not current_user.is_admin:
@@ -357,6 +737,8 @@ def admin_add_game_review():
             created_by=current_user.id
         )
         db.session.add(review)
+        db.session.flush()
+        search_index.queue_update(review)
         db.session.commit()
         
         flash(f'Game review for "{review.title}" added successfully!', 'success')
@@ -366,6 +748,7 @@ def admin_add_game_review():
 
 @app.route('/admin/game-reviews/edit/<int:review_id>', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_edit_game_review(review_id):
     """Edit game review"""
     if not current_user.is_admin:
@@ -382,6 +765,7 @@ def admin_edit_game_review(review_id):
         review.platform = request.form.get('platform')
         review.genre = request.form.get('genre')
         
+        search_index.queue_update(review)
         db.session.commit()
         
         flash(f'Game review for "{review.title}" updated successfully!', 'success')
@@ -391,6 +775,7 @@ def admin_edit_game_review(review_id):
 
 @app.route('/admin/game-reviews/delete/<int:review_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def admin_delete_game_review(review_id):
     """Delete game review"""
     if not current_user.is_admin:
@@ -400,6 +785,7 @@ def admin_delete_game_review(review_id):
     review = GameReview.query.get_or_404(review_id)
     title = review.title
     db.session.delete(review)
+    search_index.queue_remove(GameReview, review_id)
     db.session.commit()
     
     flash(f'Game review for "{title}" deleted successfully!', 'info')
@@ -413,11 +799,18 @@ def admin_movie_reviews():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('home'))
     
-    reviews = MovieReview.query.order_by(MovieReview.created_at.desc()).all()
+    # Cards show a 100-character excerpt, so never load the full review_text
+    query = db.session.query(MovieReview.id, MovieReview.title, MovieReview.rating,
+                             MovieReview.image_url, MovieReview.year, MovieReview.genre,
+                             func.substr(MovieReview.review_text, 1, 101).label('review_text'),
+                             MovieReview.created_at)
+    reviews = keyset_paginate(query, MovieReview, request.args.get('cursor'),
+                              app.config['ADMIN_PAGE_SIZE'])
     return render_template('admin_movie_reviews.html', reviews=reviews)
 
 @app.route('/admin/movie-reviews/add', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_add_movie_review():
     """Add new movie review"""
     if not current_user.is_admin:
@@ -435,6 +828,8 @@ def admin_add_movie_review():
             created_by=current_user.id
         )
         db.session.add(review)
+        db.session.flush()
+        search_index.queue_update(review)
         db.session.commit()
         
         flash(f'Movie review for "{review.title}" added successfully!', 'success')
@@ -444,6 +839,7 @@ def admin_add_movie_review():
 
 @app.route('/admin/movie-reviews/edit/<int:review_id>', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_edit_movie_review(review_id):
     """Edit movie review"""
     if not current_user.is_admin:
@@ -460,6 +856,7 @@ def admin_edit_movie_review(review_id):
         review.year = int(request.form.get('year')) if request.form.get('year') else None
         review.genre = request.form.get('genre')
         
+        search_index.queue_update(review)
         db.session.commit()
         
         flash(f'Movie review for "{review.title}" updated successfully!', 'success')
@@ -469,6 +866,7 @@ def admin_edit_movie_review(review_id):
 
 @app.route('/admin/movie-reviews/delete/<int:review_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def admin_delete_movie_review(review_id):
     """Delete movie review"""
     if not current_user.is_admin:
@@ -478,6 +876,7 @@ def admin_delete_movie_review(review_id):
     review = MovieReview.query.get_or_404(review_id)
     title = review.title
     db.session.delete(review)
+    search_index.queue_remove(MovieReview, review_id)
     db.session.commit()
     
     flash(f'Movie review for "{title}" deleted successfully!', 'info')
@@ -491,11 +890,18 @@ def admin_music():
         flash('Access denied. Admin privileges required.', 'danger')
         return redirect(url_for('home'))
     
-    tracks = MusicTrack.query.order_by(MusicTrack.created_at.desc()).all()
+    # Cards show an 80-character excerpt of the description
+    query = db.session.query(MusicTrack.id, MusicTrack.title, MusicTrack.video_id,
+                             MusicTrack.artist,
+                             func.substr(MusicTrack.description, 1, 81).label('description'),
+                             MusicTrack.created_at)
+    tracks = keyset_paginate(query, MusicTrack, request.args.get('cursor'),
+                             app.config['ADMIN_PAGE_SIZE'])
     return render_template('admin_music.html', tracks=tracks)
 
 @app.route('/admin/music/add', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_add_music():
     """Add new music track"""
     if not current_user.is_admin:
@@ -511,6 +917,8 @@ def admin_add_music():
             created_by=current_user.id
         )
         db.session.add(track)
+        db.session.flush()
+        search_index.queue_update(track)
         db.session.commit()
         
         flash(f'Music track "{track.title}" added successfully!', 'success')
@@ -520,6 +928,7 @@ def admin_add_music():
 
 @app.route('/admin/music/edit/<int:track_id>', methods=['GET', 'POST'])
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
 def admin_edit_music(track_id):
     """Edit music track"""
     if not current_user.is_admin:
@@ -534,6 +943,7 @@ def admin_edit_music(track_id):
         track.description = request.form.get('description')
         track.artist = request.form.get('artist', '-bAStIAN-')
         
+        search_index.queue_update(track)
         db.session.commit()
         
         flash(f'Music track "{track.title}" updated successfully!', 'success')
@@ -543,6 +953,7 @@ def admin_edit_music(track_id):
 
 @app.route('/admin/music/delete/<int:track_id>')
 @login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id())
 def admin_delete_music(track_id):
     """Delete music track"""
     if not current_user.is_admin:
@@ -552,164 +963,287 @@ def admin_delete_music(track_id):
     track = MusicTrack.query.get_or_404(track_id)
     title = track.title
     db.session.delete(track)
+    search_index.queue_remove(MusicTrack, track_id)
     db.session.commit()
     
     flash(f'Music track "{title}" deleted successfully!', 'info')
     return redirect(url_for('admin_music'))
 
-# Public routes (all require login)
-@app.route('/')
+# Bulk import/export: resource URL name -> admin listing endpoint
+BULK_LIST_ENDPOINTS = {
+    'recipes': 'admin_recipes',
+    'game-reviews': 'admin_game_reviews',
+    'movie-reviews': 'admin_movie_reviews',
+    'music': 'admin_music',
+}
+
+@app.route('/admin/<resource>/import', methods=['GET', 'POST'])
+@login_required
+@rate_limiter.limit('admin', account=lambda: current_user.get_id(), methods=('POST',))
+def admin_import(resource):
+    """Bulk-add content from an uploaded CSV or JSON Lines file"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    if resource not in BULK_LIST_ENDPOINTS:
+        abort(404)
+    
+    report = None
+    if request.method == 'POST':
+        upload = request.files.get('file')
+        if not upload or not upload.filename:
+            flash('Choose a CSV or JSON Lines file to import.', 'danger')
+            return redirect(url_for('admin_import', resource=resource))
+        
+        # Rows are parsed straight off the upload, never read into memory whole
+        stream = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        try:
+            report = import_rows(resource, read_rows(stream, format_for(upload.filename)),
+                                 current_user.id, app.config['BULK_CHUNK_SIZE'])
+        except (UnicodeDecodeError, csv.Error) as exc:
+            flash(f'Could not read the file: {exc}', 'danger')
+            return redirect(url_for('admin_import', resource=resource))
+        flash(report.summary(), 'warning' if report.failed else 'success')
+    
+    return render_template('admin_import.html', resource=resource,
+                           list_endpoint=BULK_LIST_ENDPOINTS[resource], report=report)
+
+@app.route('/admin/<resource>/export')
 @login_required
+def admin_export(resource):
+    """Download all content of one type as CSV or JSON Lines"""
+    if not current_user.is_admin:
+        flash('Access denied. Admin privileges required.', 'danger')
+        return redirect(url_for('home'))
+    fmt = request.args.get('format', 'csv')
+    if resource not in BULK_LIST_ENDPOINTS or fmt not in FORMATS:
+        abort(404)
+    
+    response = app.response_class(stream_with_context(export_rows(resource, fmt)),
+                                  mimetype=FORMATS[fmt])
+    filename = f'{resource}-{datetime.utcnow():%Y%m%d}.{fmt}'
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+@app.route('/fragments/user')
+def user_fragment():
+    """Per-user navbar menu and flash messages for the cached page shells"""
+    response = jsonify(nav=render_template('_user_menu.html').strip(),
+                       flashes=render_template('_flashes.html').strip())
+    response.cache_control.private = True
+    response.cache_control.no_store = True
+    response.vary.add('Cookie')
+    return response
+
+# Public routes (login required unless PUBLIC_PAGES is set)
+@app.route('/')
+@content_page
 def home():
     """Home page with overview"""
-    return render_template('index.html')
+    return page_cache.render('index.html')
 
 @app.route('/about')
-@login_required
+@content_page
 def about():
     """Personal description page"""
-    return render_template('about.html')
+    return page_cache.render('about.html')
 
 @app.route('/discord')
-@login_required
+@content_page
 def discord():
     """Discord community and server information page"""
-    return render_template('discord.html')
+    return page_cache.render('discord.html')
 
 @app.route('/steam')
-@login_required
+@content_page
 def steam():
     """Steam profile page"""
-    return render_template('steam.html')
+    return page_cache.render('steam.html')
 
 @app.route('/game-reviews')
-@login_required
+@content_page
 def game_reviews():
-    """Game reviews page"""
-    return render_template('game_reviews.html')
+    """Game reviews page, optionally filtered by ``?genre=``"""
+    return content_pages.render('game_reviews.html', GameReview,
+                                genre=request.args.get('genre') or None,
+                                cursor=request.args.get('cursor'))
 
 @app.route('/movie-reviews')
-@login_required
+@content_page
 def movie_reviews():
-    """Movie reviews page"""
-    return render_template('movie_reviews.html')
+    """Movie reviews page, optionally filtered by ``?genre=``"""
+    return content_pages.render('movie_reviews.html', MovieReview,
+                                genre=request.args.get('genre') or None,
+                                cursor=request.args.get('cursor'),
+                                extra=lambda: {'stats': review_stats(MovieReview)})
 
 @app.route('/music')
-@login_required
+@content_page
 def music():
     """Music page"""
-    return render_template('music.html')
+    return content_pages.render('music.html', MusicTrack, cursor=request.args.get('cursor'))
 
 @app.route('/games')
-@login_required
+@content_page
 def games():
     """Games hub page"""
-    return render_template('games_hub.html')
+    return page_cache.render('games_hub.html')
 
 @app.route('/games/snake')
-@login_required
+@content_page
 def game_snake():
     """Snake game"""
-    return render_template('game_snake.html')
+    return page_cache.render('game_snake.html')
 
 @app.route('/games/pong')
-@login_required
+@content_page
 def game_pong():
     """Pong game"""
-    return render_template('game_pong.html')
+    return page_cache.render('game_pong.html')
 
 @app.route('/games/memory')
-@login_required
+@content_page
 def game_memory():
     """Memory game"""
-    return render_template('game_memory.html')
+    return page_cache.render('game_memory.html')
+
+@app.route('/sw.js')
+def service_worker():
+    """Service worker precaching the game bundles (served from / so it can control /games)"""
+    urls = sorted({url for game in PRECACHE for url in asset_manifest.precache_urls(game)})
+    version = hashlib.sha1('\n'.join(urls).encode('utf-8')).hexdigest()[:12]
+    body = render_template('sw.js', urls=urls, version=version,
+                           dist_prefix=url_for('static', filename=DIST_DIR + '/'))
+    response = app.response_class(body, mimetype='application/javascript')
+    # Browsers must re-check the worker script to pick up new fingerprints
+    response.cache_control.no_cache = True
+    return response
 
 @app.route('/games/tetris')
-@login_required
+@content_page
 def game_tetris():
     """Zjadow Block Drop game"""
-    return render_template('game_tetris.html')
+    return page_cache.render('game_tetris.html')
 @app.route('/games/blockdrop')
 
 @app.route('/games/platformer')
-@login_required
+@content_page
 def game_platformer():
     """Infinite Rhythm Platformer"""
-    return render_template('game_platformer.html')
+    return page_cache.render('game_platformer.html')
 
 @app.route('/games/pirates')
-@login_required
+@content_page
 def game_pirates():
     """Pirate Adventure game"""
-    return render_template('game_pirates.html')
+    return page_cache.render('game_pirates.html')
 
 @app.route('/games/chess')
-@login_required
+@content_page
 def game_chess():
     """Chess game"""
-    return render_template('game_chess.html')
+    return page_cache.render('game_chess.html')
 
-@app.route('/games/tictactoe')
+@app.route('/games/chess/ai-move', methods=['POST'])
 @login_required
+def chess_ai_move():
+    """Search the posted Zjadow War position and return the AI's move"""
+    try:
+        board, walls = parse_state(request.get_json(silent=True))
+    except ValueError as error:
+        return jsonify(error=str(error)), 400
+    result = chess_engine.best_move(board, walls)
+    return jsonify(move=describe_move(result['move']), depth=result['depth'],
+                   score=result['score'], nodes=result['nodes'])
+
+@app.route('/games/tictactoe')
+@content_page
 def game_tictactoe():
     """Tic Tac Toe game"""
-    return render_template('game_tictactoe.html')
+    return page_cache.render('game_tictactoe.html')
 
 @app.route('/games/wordguess')
-@login_required
+@content_page
 def game_wordguess():
     """Word Guess game"""
-    return render_template('game_wordguess.html')
+    return page_cache.render('game_wordguess.html')
 
 @app.route('/games/strands')
-@login_required
+@content_page
 def game_strands():
     """Strands game"""
-    return render_template('game_strands.html')
+    return page_cache.render('game_strands.html')
 
 @app.route('/training')
-@login_required
+@content_page
 def training():
     """Training programs and fitness routines"""
-    return render_template('training.html')
+    return page_cache.render('training.html')
 
 @app.route('/food')
-@login_required
+@content_page
 def food():
     """Nutrition and dietary recommendations"""
-    return render_template('food.html')
+    return page_cache.render('food.html')
 
 @app.route('/tutorials')
-@login_required
+@content_page
 def tutorials():
     """Educational tutorials on various subjects"""
-    return render_template('tutorials.html')
+    return page_cache.render('tutorials.html')
 
 @app.route('/tools')
-@login_required
+@content_page
 def tools():
     """Utility tools and calculators"""
-    return render_template('tools.html')
+    return page_cache.render('tools.html')
 
 @app.route('/game-blog')
-@login_required
+@content_page
 def game_blog():
     """Game development blog and documentation"""
-    return render_template('game_blog.html')
+    return page_cache.render('game_blog.html')
 
 @app.route('/minecraft')
-@login_required
+@content_page
 def minecraft():
     """Minecraft blog page"""
-    return render_template('minecraft.html')
+    return page_cache.render('minecraft.html')
 
-@app.route('/dinner-recipes')
+@app.route('/search')
 @login_required
+def search():
+    """Full-text search across reviews, recipes and music"""
+    query = request.args.get('q', '').strip()
+    results = search_index.search(query) if query else []
+    if request.args.get('format') == 'json':
+        return jsonify(query=query, results=[dict(result, snippet=str(result['snippet']))
+                                             for result in results])
+    return render_template('search.html', query=query, results=results)
+
+@app.route('/dinner-recipes')
+@content_page
 def dinner_recipes():
     """Simple dinner recipes for everyday cooking"""
-    return render_template('dinner_recipes.html')
+    return content_pages.render('dinner_recipes.html', Recipe, cursor=request.args.get('cursor'),
+                                options=(selectinload(Recipe.ingredient_items),
+                                         selectinload(Recipe.steps)))
+
+# Warm the page cache in the background so worker boot doesn't wait on it
+if app.config['PAGE_CACHE_ENABLED']:
+    threading.Thread(target=warm_page_cache, name='page-cache-warmup', daemon=True).start()
 
 if __name__ == '__main__':
+    # Local development: make sure the schema and admin account exist
+    with app.app_context():
+        init_db()
+        seed_admin()
+        seed_content()
+    
+    # No separate worker process locally: run background jobs in the reloaded child
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        task_queue.start_thread()
+    
     # For deployment, use environment variables
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV', 'development') == 'development'
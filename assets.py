@@ -0,0 +1,209 @@
+"""
+Static asset pipeline for ZjadowRealm
+
+The game engines live in ``static/js/games`` and ``static/css/games``.
+``build_assets`` minifies them into content-hashed copies under
+``static/dist`` and writes a manifest; templates reference the sources via
+``asset_url()`` and get the fingerprinted URL, which can be cached forever.
+Each bundle also gets gzip/brotli siblings for ``static_files`` to serve.
+
+Game sound effects are packed into audio sprites: the clips concatenated
+into one file plus a JSON map of each clip's byte range, so a game fetches
+all of its sounds in a single request. ``PRECACHE`` lists the bundles a
+game's service worker stores for offline and repeat visits.
+"""
+import hashlib
+import json
+import os
+
+from flask import url_for
+
+from static_files import precompress
+
+try:
+    import rjsmin
+except ImportError:  # minification is optional, files are copied as-is
+    rjsmin = None
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# Sources (relative to the static folder) that get fingerprinted bundles
+ASSET_SOURCES = (
+    'css/style.css',
+    'js/script.js',
+    'css/games/chess.css',
+    'css/games/games.css',
+    'css/games/pirates.css',
+    'css/games/platformer.css',
+    'css/games/pong.css',
+    'css/games/strands.css',
+    'css/games/tetris.css',
+    'css/games/wordguess.css',
+    'js/games/chess.js',
+    'js/games/games.js',
+    'js/games/pirates.js',
+    'js/games/platformer.js',
+    'js/games/pong.js',
+    'js/games/strands.js',
+    'js/games/tetris.js',
+    'js/games/wordguess.js',
+)
+
+# Sprite path -> clips (relative to the static folder) packed into it
+AUDIO_SPRITES = {
+    'audio/tetris-sprite.mp3': (
+        'audio/bomb_piece_landing_sound.mp3',
+        'audio/clear_row_sound.mp3',
+        'audio/coin_clear_sound.mp3',
+        'audio/coin_use_sound.mp3',
+        'audio/cure_bar_sound.mp3',
+        'audio/curse_piece_landing_sound.mp3',
+        'audio/fire_piece_sound.mp3',
+        'audio/glass_break_sound.mp3',
+        'audio/ice_piece_sound.mp3',
+        'audio/piece_landing_sound.mp3',
+        'audio/rock_piece_landing_sound.mp3',
+        'audio/rotate_piece_sound.mp3',
+        'audio/saw_piece_sound.mp3',
+    ),
+}
+
+# Game -> manifest entries its service worker precaches
+PRECACHE = {
+    'tetris': ('css/style.css', 'js/script.js', 'css/games/tetris.css', 'js/games/tetris.js',
+               'audio/tetris-sprite.mp3', 'audio/tetris-sprite.json'),
+}
+
+
+def _sprite_map_path(sprite):
+    return os.path.splitext(sprite)[0] + '.json'
+
+
+def _source_paths():
+    """Every source file that feeds the manifest"""
+    paths = list(ASSET_SOURCES)
+    for clips in AUDIO_SPRITES.values():
+        paths.extend(clips)
+    return paths
+
+
+def _manifest_keys():
+    keys = set(ASSET_SOURCES)
+    for sprite in AUDIO_SPRITES:
+        keys.update((sprite, _sprite_map_path(sprite)))
+    return keys
+
+
+def minify(path, source):
+    """Minify ``source`` based on the file extension"""
+    if path.endswith('.js') and rjsmin is not None:
+        return rjsmin.jsmin(source)
+    if path.endswith('.css') and rcssmin is not None:
+        return rcssmin.cssmin(source)
+    return source
+
+
+def build_audio_sprite(static_folder, clips):
+    """Concatenate ``clips``; returns the sprite bytes and each clip's byte range
+
+    Each range is a complete MP3 the client decodes on its own, so clips
+    with different sample rates can share one sprite.
+    """
+    data = bytearray()
+    ranges = {}
+    for path in clips:
+        with open(os.path.join(static_folder, path), 'rb') as f:
+            clip = f.read()
+        ranges[os.path.basename(path)] = [len(data), len(clip)]
+        data += clip
+    return bytes(data), ranges
+
+
+def _write_hashed(static_folder, path, data, compress=True):
+    """Write ``data`` as the fingerprinted copy of ``path``; returns its dist path"""
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    stem, ext = os.path.splitext(path)
+    hashed = f'{DIST_DIR}/{stem}.{digest}{ext}'
+    target = os.path.join(static_folder, hashed)
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        _atomic_write(target, data)
+    if compress and not os.path.exists(target + '.gz'):
+        precompress(target)
+    return hashed
+
+
+def build_assets(static_folder, sources=ASSET_SOURCES, sprites=AUDIO_SPRITES):
+    """Write minified, content-hashed bundles and return the manifest"""
+    manifest = {}
+    for path in sources:
+        with open(os.path.join(static_folder, path), encoding='utf-8') as f:
+            data = minify(path, f.read()).encode('utf-8')
+        manifest[path] = _write_hashed(static_folder, path, data)
+
+    for sprite, clips in sprites.items():
+        data, ranges = build_audio_sprite(static_folder, clips)
+        # MP3 is already compressed; only the JSON map gets .gz/.br siblings
+        manifest[sprite] = _write_hashed(static_folder, sprite, data, compress=False)
+        sprite_map = {'src': os.path.basename(manifest[sprite]), 'clips': ranges}
+        map_path = _sprite_map_path(sprite)
+        manifest[map_path] = _write_hashed(
+            static_folder, map_path, json.dumps(sprite_map, sort_keys=True).encode('utf-8'))
+
+    _atomic_write(os.path.join(static_folder, DIST_DIR, MANIFEST_NAME),
+                  json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    return manifest
+
+
+def _atomic_write(target, data):
+    # Several gunicorn workers may build at once; rename keeps readers safe
+    tmp = f'{target}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, target)
+
+
+class AssetManifest:
+    """Maps source asset paths to their fingerprinted bundle paths"""
+
+    def __init__(self, app=None):
+        self.manifest = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Load (or build) the manifest and register the template helper"""
+        app.config.setdefault('ASSETS_BUILD_ON_STARTUP', True)
+        manifest_path = os.path.join(app.static_folder, DIST_DIR, MANIFEST_NAME)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+        if app.config['ASSETS_BUILD_ON_STARTUP'] and self._is_stale(app.static_folder):
+            self.manifest = build_assets(app.static_folder)
+
+        app.add_template_global(self.asset_url, 'asset_url')
+
+    def _is_stale(self, static_folder):
+        if set(self.manifest) != _manifest_keys():
+            return True
+        manifest_path = os.path.join(static_folder, DIST_DIR, MANIFEST_NAME)
+        built_at = os.path.getmtime(manifest_path)
+        return any(os.path.getmtime(os.path.join(static_folder, path)) > built_at
+                   for path in _source_paths())
+
+    def asset_url(self, path):
+        """URL of the fingerprinted bundle for ``path`` (source path as fallback)"""
+        return url_for('static', filename=self.manifest.get(path, path))
+
+    def precache_urls(self, game):
+        """Fingerprinted URLs a game's service worker should precache"""
+        return [self.asset_url(path) for path in PRECACHE.get(game, ())]
+
+
+asset_manifest = AssetManifest()
@@ -0,0 +1,411 @@
+"""
+Load-testing and latency benchmark for ZjadowRealm
+
+Seeds a fresh database, boots the app under gunicorn, drives a weighted mix
+of logins, authenticated page views, admin listings, API reads and content
+CRUD from concurrent clients, and reports p50/p95/p99 latency, throughput
+and queries per request for each route. Results are written as JSON so two
+commits can be compared:
+
+    python bench/run_bench.py --duration 30 --output bench/results/before.json
+    python bench/run_bench.py --duration 30 --compare bench/results/before.json
+
+Queries per request come from the ``X-Query-Count`` header, which the app
+emits when ``SQL_TIMING_HEADERS=1`` (set automatically here).
+
+``--slow-clients`` adds connections that trickle their request out over
+``--slow-seconds``; comparing worker classes under that load shows whether
+slow clients starve the fast routes:
+
+    python bench/run_bench.py --slow-clients 4 --gunicorn-arg=--worker-class=sync
+    python bench/run_bench.py --slow-clients 4 --gunicorn-arg=--worker-class=gevent
+"""
+import argparse
+import gzip
+import http.client
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only gzip is requested
+    brotli = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADMIN = ('ZjadowPotato', 'ZjadowPotato')
+USER_PASSWORD = 'bench-password'
+
+CONTENT_PAGES = ('/', '/about', '/discord', '/steam', '/game-reviews', '/movie-reviews',
+                 '/music', '/games', '/games/snake', '/games/tetris', '/games/chess',
+                 '/training', '/food', '/tutorials', '/tools', '/game-blog', '/minecraft',
+                 '/dinner-recipes')
+ADMIN_PAGES = ('/admin', '/admin/recipes', '/admin/game-reviews', '/admin/movie-reviews',
+               '/admin/music')
+API_PAGES = ('/api/v1/game-reviews', '/api/v1/movie-reviews', '/api/v1/music',
+             '/api/v1/recipes?fields=id,title', '/search?q=game')
+
+# Scenario -> weight in the request mix
+MIX = {'login': 5, 'page': 55, 'admin': 15, 'api': 15, 'crud': 10}
+
+# Ask for compression like a browser would, so compressed sizes are measured
+ACCEPT_ENCODING = 'gzip, br' if brotli is not None else 'gzip'
+
+
+def seed(database_url, users, reviews, recipes, tracks):
+    """Create the schema and bulk-load synthetic content"""
+    os.environ['DATABASE_URL'] = database_url
+    os.environ.setdefault('PAGE_CACHE_ENABLED', '1')
+    sys.path.insert(0, ROOT)
+    from app import app
+    from models import db, User, Recipe, GameReview, MovieReview, MusicTrack
+    from hashing import password_hasher
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    words = ('epic', 'quiet', 'brutal', 'cozy', 'retro', 'neon', 'souls', 'pixel',
+             'story', 'combat', 'puzzle', 'open', 'world', 'chicken', 'rice', 'spicy')
+
+    def text(n):
+        return ' '.join(rng.choice(words) for _ in range(n))
+
+    def stamp(i):
+        return now - timedelta(minutes=i)
+
+    runner = app.test_cli_runner()
+    runner.invoke(args=['init-db'])
+    runner.invoke(args=['seed-admin'])
+    with app.app_context():
+        pwhash = password_hasher.hash(USER_PASSWORD)
+        db.session.bulk_insert_mappings(User, [
+            {'username': f'bench{i}', 'email': f'bench{i}@example.com', 'password_hash': pwhash,
+             'is_approved': True, 'is_admin': False, 'created_at': stamp(i)}
+            for i in range(users)])
+        db.session.bulk_insert_mappings(GameReview, [
+            {'title': f'Game {i} {text(2)}', 'rating': rng.randint(1, 10), 'review_text': text(200),
+             'genre': rng.choice(('RPG', 'Action', 'Indie')), 'platform': 'PC',
+             'created_at': stamp(i), 'updated_at': stamp(i)} for i in range(reviews)])
+        db.session.bulk_insert_mappings(MovieReview, [
+            {'title': f'Movie {i} {text(2)}', 'rating': rng.randint(1, 10), 'review_text': text(150),
+             'genre': rng.choice(('Drama', 'Comedy')), 'year': 1990 + i % 35,
+             'created_at': stamp(i), 'updated_at': stamp(i)} for i in range(reviews)])
+        db.session.bulk_insert_mappings(Recipe, [
+            {'title': f'Recipe {i}', 'ingredients': '\n'.join(text(2) for _ in range(8)),
+             'instructions': '\n'.join(text(12) for _ in range(6)),
+             'created_at': stamp(i), 'updated_at': stamp(i)} for i in range(recipes)])
+        db.session.bulk_insert_mappings(MusicTrack, [
+            {'title': f'Track {i}', 'video_id': 'dQw4w9WgXcQ', 'description': text(30),
+             'created_at': stamp(i), 'updated_at': stamp(i)} for i in range(tracks)])
+        db.session.commit()
+        if 'rebuild-search' in app.cli.commands:
+            runner.invoke(args=['rebuild-search'])
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(database_url, port, workers, extra_args):
+    # Every bench client logs in from 127.0.0.1, so the login rate limit would dominate
+    env = dict(os.environ, DATABASE_URL=database_url, SQL_TIMING_HEADERS='1',
+               WEB_CONCURRENCY=str(workers), RATELIMIT_ENABLED='0')
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', '-b', f'127.0.0.1:{port}',
+         '-w', str(workers), '--log-level', 'warning'] + extra_args + ['app:app'],
+        cwd=ROOT, env=env)
+    # The socket is bound before workers finish booting, so wait for a real response
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            conn.request('GET', '/login')
+            if conn.getresponse().status == 200:
+                return proc
+        except (http.client.HTTPException, OSError):
+            time.sleep(0.2)
+    proc.kill()
+    raise SystemExit('gunicorn did not start')
+
+
+class Client:
+    """Minimal keep-alive HTTP client with a cookie jar"""
+
+    def __init__(self, port):
+        self.port = port
+        self.cookies = {}
+        self.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+
+    def request(self, method, path, form=None):
+        """Send one request; returns the response and its decoded body"""
+        headers = {'Accept-Encoding': ACCEPT_ENCODING}
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{k}={v}' for k, v in self.cookies.items())
+        body = None
+        if form is not None:
+            body = urlencode(form)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        for attempt in range(2):
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                self.conn.close()
+                self.conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=30)
+                if attempt:
+                    raise
+        for header, value in response.getheaders():
+            if header.lower() == 'set-cookie':
+                name, _, rest = value.partition('=')
+                self.cookies[name] = rest.split(';', 1)[0]
+        encoding = (response.getheader('Content-Encoding') or '').strip().lower()
+        if encoding == 'gzip':
+            data = gzip.decompress(data)
+        elif encoding == 'br':
+            data = brotli.decompress(data)
+        return response, data
+
+    def login(self, username, password):
+        response, _ = self.request('POST', '/login', {'username': username, 'password': password})
+        return response
+
+
+class Recorder:
+    """Thread-safe per-route latency and query-count samples"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.failures = []
+        self._lock = threading.Lock()
+
+    def record(self, route, seconds, response):
+        queries = response.getheader('X-Query-Count')
+        with self._lock:
+            self.samples[route].append((seconds, int(queries) if queries else None))
+            if response.status >= 500:
+                self.errors[route] += 1
+
+    def fail(self, message):
+        with self._lock:
+            self.failures.append(message)
+
+
+def timed(client, recorder, route, method, path, form=None):
+    start = time.perf_counter()
+    response, data = client.request(method, path, form)
+    recorder.record(route, time.perf_counter() - start, response)
+    return response, data
+
+
+def client_thread(recorder, target, *args):
+    """Run ``target``, keeping its exception so ``main`` can fail the run"""
+    try:
+        target(*args)
+    except Exception as exc:
+        recorder.fail(f'{type(exc).__name__}: {exc}')
+        raise
+
+
+def worker(port, users, recorder, stop_at, seed_value):
+    rng = random.Random(seed_value)
+    scenarios = list(MIX)
+    weights = [MIX[name] for name in scenarios]
+    user = Client(port)
+    user.login(f'bench{rng.randrange(users)}', USER_PASSWORD)
+    admin = Client(port)
+    admin.login(*ADMIN)
+
+    while time.time() < stop_at:
+        scenario = rng.choices(scenarios, weights)[0]
+        if scenario == 'login':
+            fresh = Client(port)
+            start = time.perf_counter()
+            response = fresh.login(f'bench{rng.randrange(users)}', USER_PASSWORD)
+            recorder.record('POST /login', time.perf_counter() - start, response)
+        elif scenario == 'page':
+            path = rng.choice(CONTENT_PAGES)
+            timed(user, recorder, f'GET {path}', 'GET', path)
+        elif scenario == 'admin':
+            path = rng.choice(ADMIN_PAGES)
+            timed(admin, recorder, f'GET {path}', 'GET', path)
+        elif scenario == 'api':
+            path = rng.choice(API_PAGES)
+            timed(user, recorder, f'GET {path.split("?")[0]}', 'GET', path)
+        else:
+            form = {'title': f'Bench {rng.random():.6f}', 'rating': '7', 'review_text': 'bench ' * 50,
+                    'genre': 'RPG', 'platform': 'PC'}
+            timed(admin, recorder, 'POST /admin/game-reviews/add', 'POST',
+                  '/admin/game-reviews/add', form)
+            _, data = admin.request('GET', '/admin/game-reviews')
+            marker = b'/admin/game-reviews/edit/'
+            index = data.find(marker)
+            if index == -1:
+                # Skipping edit/delete would quietly turn CRUD into add-only
+                raise RuntimeError('CRUD scenario: no edit link on /admin/game-reviews')
+            review_id = data[index + len(marker):].split(b'"', 1)[0].decode()
+            timed(admin, recorder, 'POST /admin/game-reviews/edit/<id>', 'POST',
+                  f'/admin/game-reviews/edit/{review_id}', form)
+            timed(admin, recorder, 'GET /admin/game-reviews/delete/<id>', 'GET',
+                  f'/admin/game-reviews/delete/{review_id}')
+
+
+def slow_client(port, stop_at, trickle_seconds):
+    """Hold a connection open by trickling a request out over ``trickle_seconds``
+
+    A sync worker is stuck with such a client until the request completes;
+    cooperative (gevent) workers keep serving other requests meanwhile.
+    """
+    request_bytes = b'GET /login HTTP/1.1\r\nHost: 127.0.0.1\r\nX-Slow: ' + b'x' * 40 + b'\r\n\r\n'
+    delay = trickle_seconds / len(request_bytes)
+    while time.time() < stop_at:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=trickle_seconds + 30) as sock:
+                for byte in request_bytes:
+                    if time.time() >= stop_at:
+                        break
+                    sock.sendall(bytes([byte]))
+                    time.sleep(delay)
+                sock.recv(65536)
+        except OSError:
+            time.sleep(0.1)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(recorder, elapsed):
+    routes = {}
+    for route, samples in sorted(recorder.samples.items()):
+        latencies = sorted(seconds * 1000 for seconds, _ in samples)
+        queries = [count for _, count in samples if count is not None]
+        routes[route] = {
+            'requests': len(samples),
+            'errors': recorder.errors.get(route, 0),
+            'throughput_rps': round(len(samples) / elapsed, 2),
+            'p50_ms': round(percentile(latencies, 0.50), 2),
+            'p95_ms': round(percentile(latencies, 0.95), 2),
+            'p99_ms': round(percentile(latencies, 0.99), 2),
+            'queries_per_request': round(sum(queries) / len(queries), 2) if queries else None,
+        }
+    total = sum(route['requests'] for route in routes.values())
+    return {'total_requests': total, 'throughput_rps': round(total / elapsed, 2), 'routes': routes}
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_report(result, baseline=None):
+    print(f"\n{'route':45} {'reqs':>6} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'q/req':>6}")
+    for route, stats in result['routes'].items():
+        line = (f"{route[:45]:45} {stats['requests']:>6} {stats['throughput_rps']:>8} "
+                f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8} "
+                f"{stats['queries_per_request'] if stats['queries_per_request'] is not None else '-':>6}")
+        old = (baseline or {}).get('routes', {}).get(route)
+        if old and old['p95_ms']:
+            line += f"  p95 {100 * (stats['p95_ms'] - old['p95_ms']) / old['p95_ms']:+.1f}%"
+        print(line)
+    print(f"\nTotal: {result['total_requests']} requests, {result['throughput_rps']} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--database-url', help='Database to seed (default: temporary SQLite file)')
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--reviews', type=int, default=2000)
+    parser.add_argument('--recipes', type=int, default=500)
+    parser.add_argument('--tracks', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=2, help='gunicorn workers')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent clients')
+    parser.add_argument('--duration', type=float, default=20, help='seconds of load')
+    parser.add_argument('--slow-clients', type=int, default=0,
+                        help='connections that trickle their request out slowly')
+    parser.add_argument('--slow-seconds', type=float, default=5,
+                        help='seconds each slow client takes to send one request')
+    parser.add_argument('--gunicorn-arg', action='append', default=[],
+                        help='extra gunicorn argument (repeatable)')
+    parser.add_argument('--output', help='JSON results path (default: bench/results/<rev>.json)')
+    parser.add_argument('--compare', help='baseline JSON to diff against')
+    args = parser.parse_args()
+
+    tmpdir = None
+    database_url = args.database_url
+    if database_url is None:
+        tmpdir = tempfile.mkdtemp(prefix='zjadow-bench-')
+        database_url = f'sqlite:///{os.path.join(tmpdir, "bench.db")}'
+
+    seeder = subprocess.run(
+        [sys.executable, __file__, '--seed-only', database_url, str(args.users),
+         str(args.reviews), str(args.recipes), str(args.tracks)], cwd=ROOT)
+    if seeder.returncode:
+        raise SystemExit('Seeding failed')
+
+    port = free_port()
+    server = start_server(database_url, port, args.workers, args.gunicorn_arg)
+    try:
+        recorder = Recorder()
+        started = time.time()
+        stop_at = started + args.duration
+        threads = [threading.Thread(target=client_thread,
+                                    args=(recorder, worker, port, args.users, recorder, stop_at, n))
+                   for n in range(args.clients)]
+        threads += [threading.Thread(target=slow_client, args=(port, stop_at, args.slow_seconds))
+                    for _ in range(args.slow_clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.time() - started
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+    if recorder.failures:
+        raise SystemExit(f'{len(recorder.failures)} client(s) failed; first: {recorder.failures[0]}')
+
+    result = summarize(recorder, elapsed)
+    result['config'] = {key: value for key, value in vars(args).items()
+                        if key not in ('output', 'compare')}
+    result['config']['database'] = database_url.split(':', 1)[0]
+    result['revision'] = git_revision()
+    result['timestamp'] = datetime.utcnow().isoformat()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+
+    output = args.output or os.path.join(ROOT, 'bench', 'results', f"{result['revision']}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, sort_keys=True)
+    print(f'Results written to {output}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 7 and sys.argv[1] == '--seed-only':
+        seed(sys.argv[2], *(int(value) for value in sys.argv[3:]))
+    else:
+        main()
@@ -0,0 +1,214 @@
+"""
+Bulk import and export of ZjadowRealm content
+
+Imports read CSV or JSON Lines one row at a time, validate each row against
+the model's columns and insert valid rows with ``bulk_insert_mappings`` in
+chunks of ``BULK_CHUNK_SIZE``, one transaction per chunk. Each chunk also
+writes its search index entries and, for recipes, the ingredient and step
+rows. Bulk inserts skip the ORM events that keep the dashboard counters up
+to date, so a recount is queued for the job worker at the end. Exports
+stream rows through ``yield_per`` and never hold a whole table in memory.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from api import RESOURCES, dumps
+from content_stats import content_stats
+from models import db, Recipe, RecipeIngredient, RecipeStep
+from recipes import structure_mappings
+from search import search_index
+
+FORMATS = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+
+# Validation messages kept for the report; the rest are only counted
+MAX_REPORTED_ERRORS = 50
+
+# Rows fetched per round trip while exporting
+EXPORT_BATCH_SIZE = 500
+
+# Fields written by exports that an import must not copy (new ids are assigned)
+IGNORED_FIELDS = {'id'}
+
+
+class ImportReport:
+    """Outcome of one import: inserted rows and per-line errors"""
+
+    def __init__(self):
+        self.inserted = 0
+        self.failed = 0
+        self.errors = []
+
+    def error(self, line, message, rows=1):
+        """Record rejected rows (one line, or a whole chunk)"""
+        self.failed += rows
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+    def summary(self):
+        """One-line description for flash messages and the CLI"""
+        text = f'Imported {self.inserted} rows'
+        if self.failed:
+            text += f', {self.failed} rejected'
+        return text
+
+
+def format_for(filename, default='csv'):
+    """Pick the format from a file name's extension"""
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension in ('jsonl', 'ndjson'):
+        return 'jsonl'
+    return 'csv' if extension == 'csv' else default
+
+
+def read_rows(stream, fmt):
+    """Yield ``(line number, dict)`` from a text stream; malformed lines yield a string"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            if None in row:
+                yield reader.line_num, 'more values than header columns'
+            else:
+                yield reader.line_num, row
+        return
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_number, f'invalid JSON ({exc})'
+            continue
+        yield line_number, row if isinstance(row, dict) else 'expected a JSON object'
+
+
+def _convert(column, value):
+    if value is None or value == '':
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if python_type is str:
+        # JSON Lines may carry recipe ingredients/instructions as real lists
+        value = json.dumps(value) if isinstance(value, (list, dict)) else str(value)
+        length = getattr(column.type, 'length', None)
+        if length and len(value) > length:
+            raise ValueError(f'longer than {length} characters')
+        return value
+    return python_type(value)
+
+
+def validate(resource, row, created_by, now):
+    """Turn an input row into an insert mapping; raises ValueError on bad data"""
+    model, fields = RESOURCES[resource]
+    unknown = set(row) - set(fields)
+    if unknown:
+        raise ValueError(f'unknown field(s): {", ".join(sorted(unknown))}')
+
+    columns = model.__table__.columns
+    mapping = {}
+    for field in fields:
+        if field in IGNORED_FIELDS:
+            continue
+        column = columns[field]
+        try:
+            value = _convert(column, row.get(field))
+        except ValueError as exc:
+            raise ValueError(f'{field}: {exc}') from None
+        if value is None and column.default is not None and column.default.is_scalar:
+            value = column.default.arg
+        if value is None and not column.nullable:
+            raise ValueError(f'{field} is required')
+        mapping[field] = value
+    # Every mapping carries the same keys so each chunk is a single executemany
+    mapping['created_at'] = mapping.get('created_at') or now
+    mapping['updated_at'] = mapping.get('updated_at') or mapping['created_at']
+    mapping['created_by'] = created_by
+    return mapping
+
+
+def _write_chunk(model, mappings):
+    # return_defaults fills in each mapping's new id (RETURNING where supported)
+    db.session.bulk_insert_mappings(model, mappings, return_defaults=True)
+    if model is Recipe:
+        ingredient_rows, step_rows = [], []
+        for mapping in mappings:
+            ingredients, steps = structure_mappings(mapping['id'], mapping['ingredients'],
+                                                    mapping['instructions'])
+            ingredient_rows.extend(ingredients)
+            step_rows.extend(steps)
+        db.session.bulk_insert_mappings(RecipeIngredient, ingredient_rows)
+        db.session.bulk_insert_mappings(RecipeStep, step_rows)
+    search_index.index_rows(model, mappings)
+
+
+def import_rows(resource, rows, created_by=None, chunk_size=500):
+    """Validate and insert ``(line, row)`` pairs in chunked transactions"""
+    model, _ = RESOURCES[resource]
+    report = ImportReport()
+    now = datetime.utcnow()
+    chunk, first_line = [], None
+
+    def flush(last_line):
+        try:
+            _write_chunk(model, chunk)
+            db.session.commit()
+            report.inserted += len(chunk)
+        except SQLAlchemyError as exc:
+            db.session.rollback()
+            report.error(f'{first_line}-{last_line}',
+                         f'chunk rolled back: {exc.__class__.__name__}', rows=len(chunk))
+
+    line = None
+    for line, row in rows:
+        if isinstance(row, str):
+            report.error(line, row)
+            continue
+        try:
+            mapping = validate(resource, row, created_by, now)
+        except ValueError as exc:
+            report.error(line, str(exc))
+            continue
+        if not chunk:
+            first_line = line
+        chunk.append(mapping)
+        if len(chunk) >= chunk_size:
+            flush(line)
+            chunk = []
+    if chunk:
+        flush(line)
+
+    if report.inserted:
+        content_stats.queue_reconcile()
+        db.session.commit()
+    return report
+
+
+def _iso(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def export_rows(resource, fmt):
+    """Yield encoded chunks of every row of ``resource``, oldest first"""
+    model, fields = RESOURCES[resource]
+    query = db.session.query(*[getattr(model, field) for field in fields]) \
+        .order_by(model.id).yield_per(EXPORT_BATCH_SIZE)
+
+    if fmt == 'jsonl':
+        for row in query:
+            yield dumps(dict(zip(fields, row))) + b'\n'
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    for index, row in enumerate(query, 1):
+        writer.writerow([_iso(value) for value in row])
+        if index % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
@@ -0,0 +1,563 @@
+"""
+Server-side opponent for Zjadow War (the 15x15 chess variant)
+
+A port of the rules in ``static/js/games/chess.js`` (``getValidMoves`` and
+``makeWarMove``) over a compact board: one int per square packing piece
+kind, side, health and a per-piece flag (a thief's stolen moves or a
+protector's spent wall), plus a dict of walls. Positions carry an
+incrementally updated Zobrist key and material score.
+
+``choose_move`` runs an alpha-beta (negamax) search with a transposition
+table, capture quiescence and iterative deepening under a time budget.
+``ChessEngine`` runs it in a bounded process pool so searches never block
+a web worker; callers get ``EngineBusy`` once the pool and queue are full.
+"""
+import os
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+SIZE = 15
+SQUARES = SIZE * SIZE
+
+PLAYER, AI = 0, 1
+SIDE_PREFIXES = ('p_', 'ai_')
+
+# Piece kinds; index 0 is the empty square
+KINDS = ('', 'peasant', 'peasant_elite', 'knight', 'cavalry', 'wizard', 'archer', 'tower',
+         'witch', 'king', 'queen', 'prince', 'princess', 'thief', 'giant', 'protector')
+(PEASANT, ELITE, KNIGHT, CAVALRY, WIZARD, ARCHER, TOWER, WITCH, KING, QUEEN,
+ PRINCE, PRINCESS, THIEF, GIANT, PROTECTOR) = range(1, 16)
+KIND_BY_NAME = {name: kind for kind, name in enumerate(KINDS) if name}
+
+# Square encoding: kind | side << 4 | health << 5 | flag << 7
+KIND_MASK = 0x0F
+SIDE_SHIFT = 4
+HEALTH_SHIFT = 5
+FLAG = 1 << 7
+
+# Actions
+MOVE, ATTACK, SHOOT, SUMMON, WALL = range(5)
+ACTION_NAMES = ('move', 'attack', 'shoot', 'summon', 'wall')
+WALL_HEALTH = 3
+SUMMONS = (CAVALRY, ELITE)
+
+# Material in centipawns; losing the king or queen ends the game outright
+VALUES = (0, 100, 180, 260, 320, 330, 300, 450, 400, 300, 900, 400, 400, 220, 350, 160)
+ADVANCE_BONUS = {PEASANT: 6, ELITE: 6, KNIGHT: 4, PROTECTOR: 4, GIANT: 3, THIEF: 3}
+WIN = 1_000_000
+INFINITY = WIN + 1
+
+EXACT, LOWER, UPPER = range(3)
+QUIESCENCE_DEPTH = 4
+TT_MAX_ENTRIES = 400_000
+
+
+def encode(kind, side, health=1, flag=False):
+    """Pack a piece into its square value"""
+    return kind | side << SIDE_SHIFT | health << HEALTH_SHIFT | (FLAG if flag else 0)
+
+
+def _side(cell):
+    return cell >> SIDE_SHIFT & 1
+
+
+def _health(cell):
+    return cell >> HEALTH_SHIFT & 3
+
+
+# Zobrist keys, seeded so every process (and the persistent TT) agrees
+_rng = random.Random(0x5A4A)
+ZOBRIST = [_rng.getrandbits(64) for _ in range(SQUARES * 256)]
+WALL_KEYS = [_rng.getrandbits(64) for _ in range(SQUARES * (WALL_HEALTH + 1))]
+SIDE_KEY = _rng.getrandbits(64)
+
+
+def _piece_square_value(cell, sq):
+    """Material plus advancement, from the player's point of view"""
+    if not cell:
+        return 0
+    kind, side = cell & KIND_MASK, _side(cell)
+    value = VALUES[kind]
+    if kind == KNIGHT:
+        value = value * _health(cell) // 2
+    row = sq // SIZE
+    advanced = (SIZE - 1 - row) if side == PLAYER else row
+    value += ADVANCE_BONUS.get(kind, 1) * advanced
+    return value if side == PLAYER else -value
+
+
+PSQ = [_piece_square_value(cell, sq) for sq in range(SQUARES) for cell in range(256)]
+
+
+def _square(row, col):
+    return row * SIZE + col if 0 <= row < SIZE and 0 <= col < SIZE else None
+
+
+# Step patterns per (side, kind, flag): (dr, dc, may move, may attack, may shoot)
+def _step_patterns(side, kind, flag):
+    d = -1 if side == PLAYER else 1
+    if kind == PEASANT:
+        return [(d, 0, 1, 1, 0), (2 * d, 0, 1, 0, 0), (d, -1, 0, 1, 0), (d, 1, 0, 1, 0)]
+    if kind == ELITE:
+        return [(d, 0, 1, 0, 0), (2 * d, 0, 1, 0, 0), (d, -1, 1, 1, 0), (d, 1, 1, 1, 0),
+                (-d, -1, 0, 1, 0), (-d, 1, 0, 1, 0)]
+    if kind == KNIGHT:
+        return [(d, 0, 1, 1, 0)]
+    if kind == CAVALRY:
+        return [(dr, dc, 1, 1, 0) for dr, dc in
+                ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2))]
+    if kind == WIZARD:
+        return [(d, 0, 1, 0, 1), (d, -1, 1, 0, 0), (d, 1, 1, 0, 0), (2 * d, 0, 0, 0, 1),
+                (3 * d, 0, 0, 0, 1)]
+    if kind == ARCHER:
+        return [(d, 0, 1, 0, 1), (2 * d, 0, 1, 0, 1), (d, -1, 1, 0, 1), (d, 1, 1, 0, 1)]
+    if kind == KING:
+        return [(dr, dc, 1, 1, 0) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+    if kind == PRINCE:
+        return [(dr, dc, 1, 1, 0) for i in (1, 2, 3) for dr, dc in ((d * i, 0), (0, i), (0, -i))]
+    if kind == PRINCESS:
+        return [(dr, dc, 1, 1, 0) for i in (1, 2) for dr, dc in
+                ((d * i, 0), (0, i), (0, -i), (i, i), (i, -i), (-i, i), (-i, -i))]
+    if kind == GIANT:
+        return [(d, 0, 1, 1, 0), (0, 1, 1, 1, 0), (0, -1, 1, 1, 0)]
+    if kind == THIEF:
+        if flag:
+            return [(d, 0, 1, 1, 0), (d, -1, 0, 1, 0), (d, 1, 0, 1, 0)]
+        return [(d, 0, 1, 0, 0), (d, -1, 0, 1, 0), (d, 1, 0, 1, 0)]
+    return []
+
+
+def _build_steps():
+    steps = {}
+    for side in (PLAYER, AI):
+        for kind in range(1, len(KINDS)):
+            for flag in (False, True):
+                patterns = _step_patterns(side, kind, flag)
+                table = []
+                for sq in range(SQUARES):
+                    row, col = divmod(sq, SIZE)
+                    targets = []
+                    for dr, dc, may_move, may_attack, may_shoot in patterns:
+                        to = _square(row + dr, col + dc)
+                        if to is not None:
+                            targets.append((to, may_move, may_attack, may_shoot))
+                    table.append(tuple(targets))
+                steps[side, kind, flag] = table
+    return steps
+
+
+STEPS = _build_steps()
+
+DIAGONALS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+ALL_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1)) + DIAGONALS
+ORTHOGONAL = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _rays(directions):
+    table = []
+    for sq in range(SQUARES):
+        row, col = divmod(sq, SIZE)
+        rays = []
+        for dr, dc in directions:
+            ray, r, c = [], row + dr, col + dc
+            while 0 <= r < SIZE and 0 <= c < SIZE:
+                ray.append(r * SIZE + c)
+                r, c = r + dr, c + dc
+            rays.append(tuple(ray))
+        table.append(tuple(rays))
+    return table
+
+
+SLIDES = {WITCH: _rays(DIAGONALS), QUEEN: _rays(ALL_DIRECTIONS)}
+ADJACENT = [tuple(ray[0] for ray in rays if ray) for rays in _rays(ORTHOGONAL)]
+
+
+class Position:
+    """Board, walls and side to move, with Zobrist key and material score"""
+
+    __slots__ = ('board', 'walls', 'side', 'key', 'score', 'winner')
+
+    def __init__(self, board, walls, side):
+        self.board = board
+        self.walls = walls
+        self.side = side
+        self.winner = None
+        self.key = SIDE_KEY if side == AI else 0
+        self.score = 0
+        for sq, cell in enumerate(board):
+            if cell:
+                self.key ^= ZOBRIST[sq * 256 + cell]
+                self.score += PSQ[sq * 256 + cell]
+        for sq, health in walls.items():
+            self.key ^= WALL_KEYS[sq * (WALL_HEALTH + 1) + health]
+
+    def moves(self):
+        """All legal moves for the side to move as (action, from, to, summon) tuples"""
+        board, walls, side = self.board, self.walls, self.side
+        moves = []
+        append = moves.append
+        for sq, cell in enumerate(board):
+            if not cell or _side(cell) != side:
+                continue
+            kind = cell & KIND_MASK
+            if kind in SLIDES:
+                for ray in SLIDES[kind][sq]:
+                    for to in ray:
+                        if to in walls:
+                            break
+                        target = board[to]
+                        if not target:
+                            append((MOVE, sq, to, 0))
+                            continue
+                        if _side(target) != side and target & KIND_MASK != GIANT:
+                            append((ATTACK, sq, to, 0))
+                        break
+            elif kind == TOWER:
+                for to in ADJACENT[sq]:
+                    if not board[to] and to not in walls:
+                        for summon in SUMMONS:
+                            append((SUMMON, sq, to, summon))
+            elif kind == PROTECTOR:
+                to = _square(sq // SIZE + (-1 if side == PLAYER else 1), sq % SIZE)
+                if to is None or to in walls:
+                    continue
+                target = board[to]
+                if not target:
+                    append((MOVE, sq, to, 0))
+                    if not cell & FLAG:
+                        append((WALL, sq, to, 0))
+                elif _side(target) != side and target & KIND_MASK != GIANT:
+                    append((ATTACK, sq, to, 0))
+            else:
+                for to, may_move, may_attack, may_shoot in STEPS[side, kind, bool(cell & FLAG)][sq]:
+                    target = board[to]
+                    if not target:
+                        if may_move:
+                            append((MOVE, sq, to, 0))
+                    elif _side(target) != side and target & KIND_MASK != GIANT:
+                        # Giants cannot be killed, so they are never targets
+                        if may_attack:
+                            append((ATTACK, sq, to, 0))
+                        if may_shoot:
+                            append((SHOOT, sq, to, 0))
+        return moves
+
+    def _set(self, sq, cell):
+        old = self.board[sq]
+        if old:
+            self.key ^= ZOBRIST[sq * 256 + old]
+            self.score -= PSQ[sq * 256 + old]
+        if cell:
+            self.key ^= ZOBRIST[sq * 256 + cell]
+            self.score += PSQ[sq * 256 + cell]
+        self.board[sq] = cell
+
+    def _set_wall(self, sq, health):
+        old = self.walls.pop(sq, 0)
+        if old:
+            self.key ^= WALL_KEYS[sq * (WALL_HEALTH + 1) + old]
+        if health > 0:
+            self.walls[sq] = health
+            self.key ^= WALL_KEYS[sq * (WALL_HEALTH + 1) + health]
+
+    def play(self, move):
+        """Return the position after ``move`` (mirrors ``makeWarMove``)"""
+        action, frm, to, summon = move
+        child = Position.__new__(Position)
+        child.board = self.board[:]
+        child.walls = self.walls
+        child.side = self.side ^ 1
+        child.key = self.key ^ SIDE_KEY
+        child.score = self.score
+        child.winner = None
+        mover = child.board[frm]
+
+        if action in (ATTACK, SHOOT):
+            if to in child.walls:
+                # Hitting a wall only chips it; nobody moves
+                child.walls = dict(child.walls)
+                child._set_wall(to, child.walls[to] - 1)
+                return child
+            defender = child.board[to]
+            health = _health(defender) - 1
+            if health <= 0:
+                if defender & KIND_MASK in (KING, QUEEN):
+                    child.winner = self.side
+                if mover & KIND_MASK == THIEF:
+                    mover |= FLAG
+                child._set(to, 0)
+            else:
+                child._set(to, defender & ~(3 << HEALTH_SHIFT) | health << HEALTH_SHIFT)
+            if action == ATTACK:
+                child._set(frm, 0)
+                child._set(to, mover)
+        elif action == MOVE:
+            child._set(frm, 0)
+            child._set(to, mover)
+        elif action == SUMMON:
+            child._set(to, encode(summon, self.side))
+        elif action == WALL:
+            child.walls = dict(child.walls)
+            child._set_wall(to, WALL_HEALTH)
+            child._set(frm, mover | FLAG)
+        return child
+
+    def evaluate(self):
+        """Static score for the side to move"""
+        return self.score if self.side == PLAYER else -self.score
+
+
+def _capture_value(board, move):
+    action, frm, to, _ = move
+    if action not in (ATTACK, SHOOT):
+        return -1
+    victim = board[to] & KIND_MASK
+    if victim in (KING, QUEEN):
+        return WIN
+    return VALUES[victim] * 16 - VALUES[board[frm] & KIND_MASK] // 16
+
+
+class _Timeout(Exception):
+    pass
+
+
+# One table per pool process; it persists between moves of the same game
+_TABLE = {}
+
+
+class _Search:
+
+    def __init__(self, deadline, table):
+        self.deadline = deadline
+        self.table = table
+        self.nodes = 0
+        self.armed = False
+
+    def _tick(self):
+        self.nodes += 1
+        if self.armed and not self.nodes & 1023 and time.monotonic() > self.deadline:
+            raise _Timeout
+
+    def ordered(self, pos, moves, first=None):
+        board = pos.board
+        moves.sort(key=lambda move: _capture_value(board, move), reverse=True)
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def quiesce(self, pos, alpha, beta, ply, depth):
+        self._tick()
+        if pos.winner is not None:
+            return -WIN + ply
+        stand = pos.evaluate()
+        if stand >= beta or depth == 0:
+            return stand
+        alpha = max(alpha, stand)
+        board = pos.board
+        captures = [move for move in pos.moves() if move[0] in (ATTACK, SHOOT)]
+        captures.sort(key=lambda move: _capture_value(board, move), reverse=True)
+        for move in captures:
+            score = -self.quiesce(pos.play(move), -beta, -alpha, ply + 1, depth - 1)
+            if score >= beta:
+                return score
+            alpha = max(alpha, score)
+        return alpha
+
+    def negamax(self, pos, depth, alpha, beta, ply):
+        self._tick()
+        if pos.winner is not None:
+            return -WIN + ply
+        if depth <= 0:
+            return self.quiesce(pos, alpha, beta, ply, QUIESCENCE_DEPTH)
+
+        entry = self.table.get(pos.key)
+        first = None
+        if entry is not None:
+            entry_depth, entry_score, entry_flag, first = entry
+            if entry_depth >= depth:
+                if entry_flag == EXACT:
+                    return entry_score
+                if entry_flag == LOWER:
+                    alpha = max(alpha, entry_score)
+                elif entry_flag == UPPER:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        moves = pos.moves()
+        if not moves:
+            return -WIN + ply
+        original_alpha = alpha
+        best_score, best_move = -INFINITY, None
+        for move in self.ordered(pos, moves, first):
+            score = -self.negamax(pos.play(move), depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score, best_move = score, move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        flag = UPPER if best_score <= original_alpha else LOWER if best_score >= beta else EXACT
+        if len(self.table) >= TT_MAX_ENTRIES:
+            self.table.clear()
+        self.table[pos.key] = (depth, best_score, flag, best_move)
+        return best_score
+
+    def root(self, pos, depth, moves):
+        """Search every root move; returns (score, best move, moves best-first)"""
+        alpha, scored = -INFINITY, []
+        for move in moves:
+            score = -self.negamax(pos.play(move), depth - 1, -INFINITY, -alpha, 1)
+            scored.append((score, move))
+            alpha = max(alpha, score)
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return scored[0][0], scored[0][1], [move for _, move in scored]
+
+
+def choose_move(board, walls, side, time_budget, max_depth):
+    """Iteratively deepen until ``time_budget`` seconds pass; returns a result dict"""
+    started = time.monotonic()
+    pos = Position(list(board), dict(walls), side)
+    moves = pos.moves()
+    if not moves:
+        return {'move': None, 'depth': 0, 'score': -WIN, 'nodes': 0}
+
+    search = _Search(started + time_budget, _TABLE)
+    moves = search.ordered(pos, moves)
+    best_move, best_score, completed = moves[0], 0, 0
+    for depth in range(1, max_depth + 1):
+        try:
+            best_score, best_move, moves = search.root(pos, depth, moves)
+        except _Timeout:
+            break
+        completed = depth
+        # Depth 1 always finishes so there is a considered move to return
+        search.armed = True
+        if abs(best_score) > WIN // 2 or time.monotonic() > search.deadline:
+            break
+
+    return {'move': best_move, 'depth': completed, 'score': best_score, 'nodes': search.nodes,
+            'elapsed': round(time.monotonic() - started, 3)}
+
+
+def parse_state(state):
+    """Convert the client's ``warState`` payload to (board, walls); raises ValueError"""
+    rows = state.get('board') if isinstance(state, dict) else None
+    if not isinstance(rows, list) or len(rows) != SIZE:
+        raise ValueError('board must be a 15x15 array')
+    board = []
+    for row in rows:
+        if not isinstance(row, list) or len(row) != SIZE:
+            raise ValueError('board must be a 15x15 array')
+        for cell in row:
+            if cell is None:
+                board.append(0)
+                continue
+            if not isinstance(cell, list) or len(cell) != 3:
+                raise ValueError('cells must be null or [piece, health, flag]')
+            name, health, flag = cell
+            for side, prefix in enumerate(SIDE_PREFIXES):
+                if isinstance(name, str) and name.startswith(prefix) \
+                        and name[len(prefix):] in KIND_BY_NAME:
+                    break
+            else:
+                raise ValueError(f'unknown piece {name!r}')
+            if not isinstance(health, int) or not 1 <= health <= 3:
+                raise ValueError('health must be 1-3')
+            board.append(encode(KIND_BY_NAME[name[len(prefix):]], side, health, bool(flag)))
+
+    walls = {}
+    for wall in state.get('walls') or []:
+        try:
+            sq = _square(int(wall['row']), int(wall['col']))
+            health = int(wall['health'])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError('walls must be {row, col, health} objects')
+        if sq is None or not 1 <= health <= WALL_HEALTH:
+            raise ValueError('wall out of range')
+        walls[sq] = health
+    return board, walls
+
+
+def describe_move(move):
+    """JSON-friendly form of a move tuple"""
+    if move is None:
+        return None
+    action, frm, to, summon = move
+    described = {
+        'type': ACTION_NAMES[action],
+        'from': {'row': frm // SIZE, 'col': frm % SIZE},
+        'to': {'row': to // SIZE, 'col': to % SIZE},
+    }
+    if action == SUMMON:
+        described['summon'] = KINDS[summon]
+    return described
+
+
+class EngineBusy(Exception):
+    """Raised when the search pool cannot admit another job"""
+
+    def __init__(self, retry_after):
+        super().__init__('Chess engine pool is saturated')
+        self.retry_after = retry_after
+
+
+class ChessEngine:
+    """Bounded process pool running ``choose_move``"""
+
+    def __init__(self, app=None):
+        self.time_budget = 1.0
+        self.max_depth = 8
+        self.pool_size = 2
+        self.queue_size = 4
+        self.retry_after = 2
+        self._executor = None
+        self._executor_pid = None
+        self._slots = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read engine settings from the app config"""
+        app.config.setdefault('CHESS_AI_TIME_BUDGET', self.time_budget)
+        app.config.setdefault('CHESS_AI_MAX_DEPTH', self.max_depth)
+        app.config.setdefault('CHESS_POOL_SIZE', self.pool_size)
+        app.config.setdefault('CHESS_QUEUE_SIZE', self.queue_size)
+        self.time_budget = float(app.config['CHESS_AI_TIME_BUDGET'])
+        self.max_depth = int(app.config['CHESS_AI_MAX_DEPTH'])
+        self.pool_size = int(app.config['CHESS_POOL_SIZE'])
+        self.queue_size = int(app.config['CHESS_QUEUE_SIZE'])
+        self._slots = threading.BoundedSemaphore(self.pool_size + self.queue_size)
+
+    def _get_executor(self):
+        # Pools do not survive fork, so each gunicorn worker builds its own
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.pool_size)
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def best_move(self, board, walls, side=AI):
+        """Search the position and return ``choose_move``'s result"""
+        args = (board, walls, side, self.time_budget, self.max_depth)
+        if self.pool_size <= 0:
+            return choose_move(*args)
+        if self._slots is None:
+            self._slots = threading.BoundedSemaphore(self.pool_size + self.queue_size)
+        if not self._slots.acquire(blocking=False):
+            raise EngineBusy(self.retry_after)
+        try:
+            future = self._get_executor().submit(choose_move, *args)
+            # Queued jobs wait for a free process, so allow a few budgets
+            return future.result(timeout=self.time_budget * (1 + self.queue_size) + 5)
+        except FutureTimeoutError:
+            raise EngineBusy(self.retry_after)
+        finally:
+            self._slots.release()
+
+
+chess_engine = ChessEngine()
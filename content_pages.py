@@ -0,0 +1,137 @@
+"""
+Database-rendered content pages for ZjadowRealm
+
+The game review, movie review, music and recipe pages list rows from the
+database, newest first with keyset pagination. Two caches keep them cheap:
+
+- each item's card is rendered once per ``(model, id, updated_at)`` and kept
+  in an LRU, so an edit re-renders that one card and the others are reused;
+- whole pages go through ``page_cache`` with the genre, the cursor and the
+  table's content version in the key. The version is the newest
+  ``updated_at`` plus the row counter, read in one indexed query, so any
+  admin add, edit or delete moves it and every worker re-renders the page
+  on its next request, not only the worker that handled the write.
+
+Genre filters are plain ``?genre=`` links answered by the database through
+the ``genre`` indexes.
+"""
+import threading
+from collections import OrderedDict
+
+from flask import abort, current_app, render_template
+from markupsafe import Markup
+from sqlalchemy import func, select
+
+from content_stats import TRACKED_MODELS
+from models import db, ContentCounter
+from page_cache import page_cache
+from pagination import decode_cursor, keyset_paginate
+
+# Model -> name of its ContentCounter row
+COUNTER_NAMES = {model: name for name, model in TRACKED_MODELS.items()}
+
+
+class ContentPages:
+    """Per-item fragment cache and versioned page rendering for content listings"""
+
+    def __init__(self, app=None):
+        self.per_page = 20
+        self.maxsize = 2048
+        self.hits = 0
+        self.misses = 0
+        self._fragments = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read settings and expose ``cached_fragment`` to templates"""
+        app.config.setdefault('CONTENT_PAGE_SIZE', self.per_page)
+        app.config.setdefault('FRAGMENT_CACHE_SIZE', self.maxsize)
+        self.per_page = int(app.config['CONTENT_PAGE_SIZE'])
+        self.maxsize = int(app.config['FRAGMENT_CACHE_SIZE'])
+        app.add_template_global(self.fragment, 'cached_fragment')
+
+    def fragment(self, template_name, item):
+        """Render ``template_name`` for ``item``, reusing the last render until it changes"""
+        if current_app.debug:
+            return Markup(render_template(template_name, item=item))
+
+        key = (template_name, type(item).__name__, item.id, item.updated_at)
+        with self._lock:
+            html = self._fragments.get(key)
+            if html is not None:
+                self._fragments.move_to_end(key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = Markup(render_template(template_name, item=item))
+        with self._lock:
+            self._fragments[key] = html
+            while len(self._fragments) > self.maxsize:
+                self._fragments.popitem(last=False)
+        return html
+
+    def version(self, model):
+        """``(newest updated_at, row counter)`` for ``model``, in one query"""
+        counter = select(ContentCounter.value) \
+            .where(ContentCounter.name == COUNTER_NAMES[model]).scalar_subquery()
+        return tuple(db.session.execute(
+            select(select(func.max(model.updated_at)).scalar_subquery(), counter)).one())
+
+    def genres(self, model):
+        """Distinct non-empty genres of ``model``, read from the genre index"""
+        rows = db.session.query(model.genre).filter(model.genre.isnot(None), model.genre != '') \
+            .distinct().order_by(model.genre)
+        return [row.genre for row in rows]
+
+    def render(self, template_name, model, genre=None, cursor=None, extra=None, options=()):
+        """Serve one page of ``model`` through ``page_cache``
+
+        ``options`` are loader options for the listing query (e.g. eager
+        loads the cards need). ``extra`` returns more template variables;
+        like the listing query it only runs when the page is not cached.
+        """
+        if decode_cursor(cursor) is None:
+            cursor = None
+        version = self.version(model)
+        with self._lock:
+            stale = self._versions.get(template_name, version) != version
+            self._versions[template_name] = version
+        if stale:
+            page_cache.invalidate(template_name)
+
+        def context():
+            query = model.query.options(*options)
+            genres = self.genres(model) if hasattr(model, 'genre') else []
+            if genre is not None:
+                if genre not in genres:
+                    abort(404)
+                query = query.filter(model.genre == genre)
+            return dict(items=keyset_paginate(query, model, cursor, self.per_page),
+                        genres=genres, genre=genre, cursor=cursor, **(extra() if extra else {}))
+
+        return page_cache.render(template_name, variant=(version, genre, cursor), context=context)
+
+    def stats(self):
+        """Return fragment hit/miss counters and current size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._fragments), 'maxsize': self.maxsize}
+
+
+def review_stats(model):
+    """Totals over every review of ``model`` for a page's stats panel"""
+    count, average, best, latest = db.session.query(
+        func.count(model.id), func.avg(model.rating), func.max(model.rating),
+        func.max(model.created_at)).one()
+    favorite = db.session.query(model.genre) \
+        .filter(model.genre.isnot(None), model.genre != '') \
+        .group_by(model.genre).order_by(func.count(model.id).desc(), model.genre).limit(1).scalar()
+    return {'count': count, 'average': average, 'best': best, 'latest': latest,
+            'favorite_genre': favorite}
+
+
+content_pages = ContentPages()
@@ -0,0 +1,102 @@
+"""
+Content statistics for ZjadowRealm
+
+Keeps one ``ContentCounter`` row per content model so the admin dashboard
+can read every count in a single query instead of running ``COUNT(*)``
+over each table. Counters move with ORM inserts and deletes (in the same
+transaction as the change). Anything that bypasses the ORM events, such as
+bulk inserts, is corrected by a recount job: bulk imports queue one, and a
+periodic one re-queues itself every ``CONTENT_STATS_RECONCILE`` seconds.
+Reading the counts never writes, so the dashboard GET never commits.
+"""
+from datetime import datetime
+
+from sqlalchemy import event, func, select
+
+from models import db, ContentCounter, Recipe, GameReview, MovieReview, MusicTrack
+from tasks import task_queue
+
+# Counter name -> model whose rows it counts
+TRACKED_MODELS = {
+    'recipes': Recipe,
+    'game_reviews': GameReview,
+    'movie_reviews': MovieReview,
+    'music_tracks': MusicTrack,
+}
+
+
+class ContentStats:
+    """Event-maintained row counters with periodic reconciliation"""
+
+    def __init__(self, app=None):
+        self.reconcile_interval = 600
+        self._listening = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read settings and hook the ORM insert/delete events"""
+        app.config.setdefault('CONTENT_STATS_RECONCILE', 600)
+        self.reconcile_interval = int(app.config['CONTENT_STATS_RECONCILE'])
+        if not self._listening:
+            for name, model in TRACKED_MODELS.items():
+                event.listen(model, 'after_insert', self._bump(name, 1))
+                event.listen(model, 'after_delete', self._bump(name, -1))
+            self._listening = True
+
+    @staticmethod
+    def _bump(name, delta):
+        counters = ContentCounter.__table__
+
+        def listener(mapper, connection, target):
+            connection.execute(
+                counters.update()
+                .where(counters.c.name == name)
+                .values(value=counters.c.value + delta)
+            )
+        return listener
+
+    def counts(self):
+        """Return ``{name: count}`` for every tracked model, without writing"""
+        rows = ContentCounter.query.all()
+        if len(rows) < len(TRACKED_MODELS):
+            # Counters not created yet (init-db creates them): count directly
+            return self._count()
+        return {row.name: row.value for row in rows}
+
+    def queue_reconcile(self):
+        """Queue a recount in the caller's transaction (at most one pending)"""
+        task_queue.enqueue('content_stats.reconcile', dedup_key='content_stats.reconcile')
+
+    def schedule_reconcile(self, delay=0):
+        """Queue the next periodic recount in the caller's transaction"""
+        task_queue.enqueue('content_stats.reconcile', {'periodic': True},
+                           dedup_key='content_stats.reconcile.periodic', delay=delay)
+
+    @staticmethod
+    def _count():
+        names = list(TRACKED_MODELS)
+        counts = db.session.execute(select(*[
+            select(func.count()).select_from(TRACKED_MODELS[name]).scalar_subquery()
+            for name in names
+        ])).one()
+        return dict(zip(names, counts))
+
+    def reconcile(self):
+        """Recount every tracked table in one statement and store the result"""
+        result = self._count()
+        now = datetime.utcnow()
+        for name, value in result.items():
+            db.session.merge(ContentCounter(name=name, value=value, reconciled_at=now))
+        db.session.commit()
+        return result
+
+
+content_stats = ContentStats()
+
+
+@task_queue.task('content_stats.reconcile')
+def _reconcile_counters(payload):
+    content_stats.reconcile()
+    if payload.get('periodic'):
+        content_stats.schedule_reconcile(delay=content_stats.reconcile_interval)
@@ -0,0 +1,146 @@
+"""
+Database engine tuning and query instrumentation for ZjadowRealm
+
+``engine_options`` builds ``SQLALCHEMY_ENGINE_OPTIONS`` from the
+environment: connection-pool sizing for Postgres (split across gunicorn
+workers so the server's connection limit is never exceeded) and WAL plus
+tuned pragmas for SQLite. ``QueryStats`` times every statement and keeps
+per-endpoint query counts and SQL time, logging slow requests and
+repeated identical statements (the usual N+1 signature).
+"""
+import os
+import threading
+import time
+from collections import Counter
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+def engine_options(database_url):
+    """Return SQLAlchemy engine options for ``database_url``"""
+    if database_url.startswith('sqlite'):
+        # SQLite connections are cheap; pragmas are applied on connect
+        return {'connect_args': {'timeout': 15}}
+
+    # Every gunicorn worker owns a pool, so share the server budget between them
+    workers = max(1, _env_int('WEB_CONCURRENCY', 1))
+    budget = _env_int('DB_MAX_CONNECTIONS', 20)
+    per_worker = max(1, budget // workers)
+    pool_size = _env_int('DB_POOL_SIZE', min(5, per_worker))
+    max_overflow = _env_int('DB_MAX_OVERFLOW', max(0, per_worker - pool_size))
+    if (pool_size + max_overflow) * workers > budget:
+        raise ValueError(
+            f'{workers} workers x {pool_size + max_overflow} connections exceeds '
+            f'DB_MAX_CONNECTIONS={budget}; lower WEB_CONCURRENCY or the pool settings')
+    return {
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_recycle': _env_int('DB_POOL_RECYCLE', 1800),
+        'pool_timeout': _env_int('DB_POOL_TIMEOUT', 10),
+        'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '1') == '1',
+    }
+
+
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA cache_size=-16000',
+    'PRAGMA temp_store=MEMORY',
+)
+
+
+@event.listens_for(Engine, 'connect')
+def _configure_sqlite(dbapi_connection, connection_record):
+    if type(dbapi_connection).__module__.startswith('sqlite3'):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+class QueryStats:
+    """Per-request and per-endpoint SQL timing"""
+
+    def __init__(self, app=None):
+        self.slow_sql_ms = 200
+        self.n_plus_one_threshold = 5
+        self.headers = False
+        self.endpoints = {}
+        self._lock = threading.Lock()
+        self._listening = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read thresholds and hook engine and request events"""
+        app.config.setdefault('SLOW_SQL_MS', self.slow_sql_ms)
+        app.config.setdefault('N_PLUS_ONE_THRESHOLD', self.n_plus_one_threshold)
+        app.config.setdefault('SQL_TIMING_HEADERS', self.headers)
+        self.slow_sql_ms = float(app.config['SLOW_SQL_MS'])
+        self.n_plus_one_threshold = int(app.config['N_PLUS_ONE_THRESHOLD'])
+        self.headers = bool(app.config['SQL_TIMING_HEADERS'])
+        self.logger = app.logger
+
+        if not self._listening:
+            event.listen(Engine, 'before_cursor_execute', self._before_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_execute)
+            self._listening = True
+        app.after_request(self._after_request)
+
+    @staticmethod
+    def _before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_start'].pop()
+        if has_request_context():
+            g.sql_count = g.get('sql_count', 0) + 1
+            g.sql_time = g.get('sql_time', 0.0) + elapsed
+            g.setdefault('sql_statements', Counter())[statement] += 1
+
+    def _after_request(self, response):
+        count = g.get('sql_count', 0)
+        sql_ms = g.get('sql_time', 0.0) * 1000
+        # Unmatched URLs share one entry so scanners cannot grow the table
+        endpoint = request.endpoint or 'unknown'
+
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint, {
+                'requests': 0, 'queries': 0, 'sql_ms': 0.0, 'max_queries': 0})
+            stats['requests'] += 1
+            stats['queries'] += count
+            stats['sql_ms'] += sql_ms
+            stats['max_queries'] = max(stats['max_queries'], count)
+
+        if sql_ms > self.slow_sql_ms:
+            self.logger.warning('Slow SQL on %s: %d queries, %.1f ms', endpoint, count, sql_ms)
+        for statement, repeats in g.get('sql_statements', Counter()).items():
+            if repeats >= self.n_plus_one_threshold:
+                self.logger.warning('Possible N+1 on %s: statement ran %d times: %s',
+                                    endpoint, repeats, ' '.join(statement.split())[:200])
+
+        if self.headers:
+            response.headers['X-Query-Count'] = str(count)
+            response.headers.add('Server-Timing', f'db;dur={sql_ms:.2f}')
+        return response
+
+    def stats(self):
+        """Return per-endpoint totals and averages"""
+        with self._lock:
+            return {
+                endpoint: dict(stats,
+                               avg_queries=round(stats['queries'] / stats['requests'], 2),
+                               avg_sql_ms=round(stats['sql_ms'] / stats['requests'], 3))
+                for endpoint, stats in self.endpoints.items()
+            }
+
+
+query_stats = QueryStats()
@@ -0,0 +1,72 @@
+"""
+Gunicorn settings for ZjadowRealm
+
+Everything is driven by environment variables so Render (or a local run)
+can switch serving modes without code changes:
+
+    GUNICORN_WORKER_CLASS=gevent  cooperative workers; one slow client or
+                                  query no longer ties up a whole worker
+    GUNICORN_WORKER_CLASS=gthread threads per worker (GUNICORN_THREADS)
+    GUNICORN_WORKER_CLASS=sync    the classic default
+
+With gevent, psycopg2 is switched to green mode after fork so Postgres
+queries yield to other greenlets instead of blocking the worker.
+"""
+import multiprocessing
+import os
+
+from database import engine_options
+# Imported up front: child_exit runs inside the master's SIGCHLD handling
+from metrics import mark_process_dead
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+workers = int(os.environ.get('WEB_CONCURRENCY', min(4, multiprocessing.cpu_count() * 2 + 1)))
+threads = int(os.environ.get('GUNICORN_THREADS', 4 if worker_class == 'gthread' else 1))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 500))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', 20))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 0))
+
+# The app reads WEB_CONCURRENCY to split the database connection budget
+os.environ['WEB_CONCURRENCY'] = str(workers)
+if worker_class in ('gevent', 'eventlet'):
+    # Greenlets share one pool per worker, so keep the worker's whole slice
+    # of DB_MAX_CONNECTIONS open instead of a few connections plus overflow
+    budget = int(os.environ.get('DB_MAX_CONNECTIONS', 20))
+    os.environ.setdefault('DB_POOL_SIZE', str(max(1, budget // workers)))
+
+# Refuse to start rather than open more connections than Postgres allows
+try:
+    engine_options(os.environ.get('DATABASE_URL', 'sqlite://'))
+except ValueError as exc:
+    raise SystemExit(f'Database connection budget: {exc}')
+
+
+def child_exit(server, worker):
+    """Fold an exited worker's metrics into the shared totals and drop its file"""
+    try:
+        mark_process_dead(worker.pid)
+    except OSError as exc:
+        server.log.warning('Could not retire metrics for worker %s: %s', worker.pid, exc)
+
+
+def post_fork(server, worker):
+    """Make psycopg2 cooperative under gevent/eventlet"""
+    mode = server.cfg.worker_class_str
+    if mode == 'gevent':
+        try:
+            from psycogreen.gevent import patch_psycopg
+        except ImportError:
+            server.log.warning('psycogreen is not installed; Postgres calls will block the worker')
+        else:
+            patch_psycopg()
+    elif mode == 'eventlet':
+        try:
+            from psycogreen.eventlet import patch_psycopg
+        except ImportError:
+            server.log.warning('psycogreen is not installed; Postgres calls will block the worker')
+        else:
+            patch_psycopg()
@@ -0,0 +1,103 @@
+"""
+Password hashing pool for ZjadowRealm
+
+PBKDF2 is deliberately slow, so running it inside a sync gunicorn worker
+blocks that worker for the whole hash. ``PasswordHasher`` pushes the work
+to a small process pool and admits only a bounded number of jobs; once the
+pool and its queue are full, callers get ``HashingBusy`` right away instead
+of piling up behind each other.
+"""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class HashingBusy(Exception):
+    """Raised when the hashing pool cannot admit another job"""
+
+    def __init__(self, retry_after):
+        super().__init__('Password hashing pool is saturated')
+        self.retry_after = retry_after
+
+
+class PasswordHasher:
+    """Bounded process pool for password hashing and verification"""
+
+    def __init__(self, app=None):
+        self.method = 'pbkdf2:sha256:600000'
+        self._prefix = None
+        self.pool_size = 2
+        self.queue_size = 8
+        self.timeout = 10
+        self.retry_after = 2
+        self._executor = None
+        self._executor_pid = None
+        self._slots = None
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read hashing settings from the app config"""
+        app.config.setdefault('PASSWORD_HASH_METHOD', self.method)
+        app.config.setdefault('HASH_POOL_SIZE', self.pool_size)
+        app.config.setdefault('HASH_QUEUE_SIZE', self.queue_size)
+        app.config.setdefault('HASH_TIMEOUT', self.timeout)
+        app.config.setdefault('HASH_RETRY_AFTER', self.retry_after)
+        self.method = app.config['PASSWORD_HASH_METHOD']
+        self.pool_size = int(app.config['HASH_POOL_SIZE'])
+        self.queue_size = int(app.config['HASH_QUEUE_SIZE'])
+        self.timeout = float(app.config['HASH_TIMEOUT'])
+        self.retry_after = int(app.config['HASH_RETRY_AFTER'])
+        self._slots = threading.BoundedSemaphore(self.pool_size + self.queue_size)
+        self._prefix = None
+
+    def _get_executor(self):
+        # Pools do not survive fork, so each gunicorn worker builds its own
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.pool_size)
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _run(self, func, *args):
+        if self.pool_size <= 0:
+            return func(*args)
+        if self._slots is None:
+            self._slots = threading.BoundedSemaphore(self.pool_size + self.queue_size)
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            raise HashingBusy(self.retry_after)
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BaseException:
+            slots.release()
+            raise
+        # A timed-out job keeps running in the pool, so it keeps its slot until done
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise HashingBusy(self.retry_after)
+
+    def hash(self, password):
+        """Hash ``password`` with the configured method"""
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, pwhash, password):
+        """Check ``password`` against ``pwhash``"""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash):
+        """Return True if ``pwhash`` was made with a different method or cost"""
+        if self._prefix is None:
+            # Werkzeug fills in default parameters ("scrypt" -> "scrypt:32768:8:1"),
+            # so compare against the method as it appears in a stored hash. Worked
+            # out on first use so CLI commands and worker boots skip the hash.
+            self._prefix = generate_password_hash('', self.method).split('$', 1)[0]
+        return pwhash.split('$', 1)[0] != self._prefix
+
+
+password_hasher = PasswordHasher()
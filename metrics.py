@@ -0,0 +1,215 @@
+"""
+Per-route request metrics for ZjadowRealm
+
+Records, per endpoint, histograms of total request time, Jinja render time
+(from the ``before_render_template``/``template_rendered`` signals), SQL
+time (from ``database.QueryStats``) and response size. Each gunicorn
+worker periodically writes its totals to ``METRICS_DIR``; ``/metrics``
+merges every worker's file and renders Prometheus text format.
+
+When a worker exits, gunicorn's ``child_exit`` hook calls
+``mark_process_dead``, which folds the worker's totals into one
+``dead.json`` file and removes the worker's own file. Recycled workers
+therefore don't pile up files, and the counters never go backwards.
+"""
+import atexit
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+
+from flask import before_render_template, g, request, template_rendered
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+DEFAULT_DIR = os.path.join(tempfile.gettempdir(), 'zjadowrealm-metrics')
+
+# Totals of every exited worker, merged into one file
+DEAD_FILE = 'dead.json'
+
+# Metric name -> (help text, bucket bounds)
+HISTOGRAMS = {
+    'zjadowrealm_request_duration_seconds': ('Total time spent handling the request', SECONDS_BUCKETS),
+    'zjadowrealm_template_render_seconds': ('Time spent rendering Jinja templates', SECONDS_BUCKETS),
+    'zjadowrealm_sql_duration_seconds': ('Time spent executing SQL statements', SECONDS_BUCKETS),
+    'zjadowrealm_response_size_bytes': ('Size of the response body', BYTES_BUCKETS),
+}
+
+
+class RequestMetrics:
+    """Histogram recorder with a file-per-worker shared store"""
+
+    def __init__(self, app=None):
+        self.directory = DEFAULT_DIR
+        self.flush_interval = 5.0
+        self._series = {}
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read settings and hook the request lifecycle and template signals"""
+        app.config.setdefault('METRICS_DIR', self.directory)
+        app.config.setdefault('METRICS_FLUSH_INTERVAL', self.flush_interval)
+        self.directory = app.config['METRICS_DIR']
+        self.flush_interval = float(app.config['METRICS_FLUSH_INTERVAL'])
+        os.makedirs(self.directory, exist_ok=True)
+
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        before_render_template.connect(self._before_render, app)
+        template_rendered.connect(self._after_render, app)
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _before_request():
+        g.metrics_start = time.perf_counter()
+
+    @staticmethod
+    def _before_render(sender, template, context, **extra):
+        g.setdefault('render_starts', []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_render(sender, template, context, **extra):
+        starts = g.get('render_starts')
+        if starts:
+            g.render_time = g.get('render_time', 0.0) + time.perf_counter() - starts.pop()
+
+    def _after_request(self, response):
+        start = g.get('metrics_start')
+        if start is None:
+            return response
+        endpoint = request.endpoint or 'unknown'
+        size = response.content_length
+        if size is None and not response.is_streamed:
+            size = len(response.get_data())
+
+        self.observe('zjadowrealm_request_duration_seconds', endpoint, time.perf_counter() - start)
+        self.observe('zjadowrealm_template_render_seconds', endpoint, g.get('render_time', 0.0))
+        self.observe('zjadowrealm_sql_duration_seconds', endpoint, g.get('sql_time', 0.0))
+        self.observe('zjadowrealm_response_size_bytes', endpoint, size or 0)
+
+        if time.monotonic() - self._last_flush > self.flush_interval:
+            self.flush()
+        return response
+
+    def observe(self, name, endpoint, value):
+        """Add one observation to histogram ``name`` for ``endpoint``"""
+        bounds = HISTOGRAMS[name][1]
+        with self._lock:
+            series = self._series.get((name, endpoint))
+            if series is None:
+                series = self._series[(name, endpoint)] = {
+                    'buckets': [0] * len(bounds), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(bounds):
+                if value <= bound:
+                    series['buckets'][index] += 1
+                    break
+            series['sum'] += value
+            series['count'] += 1
+
+    def flush(self):
+        """Write this worker's totals to the shared directory"""
+        with self._lock:
+            snapshot = [{'name': name, 'endpoint': endpoint, **series}
+                        for (name, endpoint), series in self._series.items()]
+            self._last_flush = time.monotonic()
+        if not snapshot:
+            # CLI commands and the job worker serve no requests; leave no file behind
+            return
+        path = os.path.join(self.directory, f'{os.getpid()}.json')
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, path)
+
+    def collect(self):
+        """Merge every worker's totals, including exited workers'"""
+        self.flush()
+        return _merge_directory(self.directory)
+
+    def render_prometheus(self):
+        """Return all histograms in Prometheus text exposition format"""
+        merged = self.collect()
+        lines = []
+        for name, (help_text, bounds) in HISTOGRAMS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for (series_name, endpoint), series in sorted(merged.items()):
+                if series_name != name:
+                    continue
+                label = endpoint.replace('\\', '\\\\').replace('"', '\\"')
+                cumulative = 0
+                for bound, count in zip(bounds, series['buckets']):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{endpoint="{label}",le="{bound:g}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{endpoint="{label}",le="+Inf"}} {series["count"]}')
+                lines.append(f'{name}_sum{{endpoint="{label}"}} {series["sum"]:.6f}')
+                lines.append(f'{name}_count{{endpoint="{label}"}} {series["count"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _read(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _add(merged, snapshot):
+    for series in snapshot:
+        if series['name'] not in HISTOGRAMS:
+            continue
+        key = (series['name'], series['endpoint'])
+        total = merged.setdefault(key, {
+            'buckets': [0] * len(series['buckets']), 'sum': 0.0, 'count': 0})
+        total['buckets'] = [a + b for a, b in zip(total['buckets'], series['buckets'])]
+        total['sum'] += series['sum']
+        total['count'] += series['count']
+
+
+def _merge_directory(directory):
+    merged = {}
+    dead = _read(os.path.join(directory, DEAD_FILE)) or {'pids': [], 'series': []}
+    _add(merged, dead['series'])
+    # The last merged worker's file may not be removed yet; it is already in dead.json
+    skip = {f'{pid}.json' for pid in dead['pids']} | {DEAD_FILE}
+    for path in glob.glob(os.path.join(directory, '*.json')):
+        if os.path.basename(path) in skip:
+            continue
+        snapshot = _read(path)
+        if snapshot is not None:
+            _add(merged, snapshot)
+    return merged
+
+
+def mark_process_dead(pid, directory=None):
+    """Fold exited worker ``pid``'s totals into ``dead.json`` and remove its file
+
+    Call it from one process only (gunicorn's master, in ``child_exit``).
+    """
+    directory = directory or os.environ.get('METRICS_DIR', DEFAULT_DIR)
+    path = os.path.join(directory, f'{pid}.json')
+    snapshot = _read(path)
+    if snapshot is None:
+        return
+    dead_path = os.path.join(directory, DEAD_FILE)
+    merged = {}
+    _add(merged, (_read(dead_path) or {'series': []})['series'])
+    _add(merged, snapshot)
+    dead = {'pids': [pid],
+            'series': [{'name': name, 'endpoint': endpoint, **series}
+                       for (name, endpoint), series in merged.items()]}
+    tmp = f'{dead_path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(dead, f)
+    os.replace(tmp, dead_path)
+    os.remove(path)
+
+
+request_metrics = RequestMetrics()
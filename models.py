@@ -3,7 +3,7 @@ Database models for ZjadowRealm
 """
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from hashing import password_hasher
 from datetime import datetime
 
 db = SQLAlchemy()
@@ -20,11 +20,15 @@ class User(UserMixin, db.Model):
     
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
         """Check if password matches hash"""
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        """Check if the stored hash predates the configured hashing cost"""
+        return password_hasher.needs_rehash(self.password_hash)
     
     def __repr__(self):
         return f'<User {self.username}>'
@@ -45,10 +49,55 @@ class Recipe(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    ingredient_items = db.relationship('RecipeIngredient', order_by='RecipeIngredient.position',
+                                       cascade='all, delete-orphan', backref='recipe')
+    steps = db.relationship('RecipeStep', order_by='RecipeStep.position',
+                            cascade='all, delete-orphan', backref='recipe')
+    
+    __table_args__ = (
+        db.Index('ix_recipe_created_at_id', 'created_at', 'id'),
+        db.Index('ix_recipe_updated_at', 'updated_at'),
+    )
+    
     def __repr__(self):
         return f'<Recipe {self.title}>'
 
 
+class RecipeIngredient(db.Model):
+    """One ingredient line of a recipe"""
+    id = db.Column(db.Integer, primary_key=True)
+    recipe_id = db.Column(db.Integer, db.ForeignKey('recipe.id', ondelete='CASCADE'), nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.String(500), nullable=False)  # Line as entered, e.g. "2 cups rice"
+    name = db.Column(db.String(200), nullable=False, index=True)  # Normalized, e.g. "rice"
+    
+    __table_args__ = (
+        db.Index('ix_recipe_ingredient_recipe_position', 'recipe_id', 'position'),
+        # Postgres only serves LIKE 'prefix%' from a btree under the C collation
+        # or with text_pattern_ops; SQLite does not need (or understand) it
+        db.Index('ix_recipe_ingredient_name_pattern', 'name',
+                 postgresql_ops={'name': 'text_pattern_ops'}).ddl_if(dialect='postgresql'),
+    )
+    
+    def __repr__(self):
+        return f'<RecipeIngredient {self.name}>'
+
+
+class RecipeStep(db.Model):
+    """One instruction step of a recipe"""
+    id = db.Column(db.Integer, primary_key=True)
+    recipe_id = db.Column(db.Integer, db.ForeignKey('recipe.id', ondelete='CASCADE'), nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.Text, nullable=False)
+    
+    __table_args__ = (
+        db.Index('ix_recipe_step_recipe_position', 'recipe_id', 'position'),
+    )
+    
+    def __repr__(self):
+        return f'<RecipeStep {self.position}>'
+
+
 class GameReview(db.Model):
     """Game review model"""
     id = db.Column(db.Integer, primary_key=True)
@@ -62,6 +111,12 @@ class GameReview(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_game_review_created_at_id', 'created_at', 'id'),
+        db.Index('ix_game_review_updated_at', 'updated_at'),
+        db.Index('ix_game_review_genre', 'genre'),
+    )
+    
     def __repr__(self):
         return f'<GameReview {self.title}>'
 
@@ -79,6 +134,12 @@ class MovieReview(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_movie_review_created_at_id', 'created_at', 'id'),
+        db.Index('ix_movie_review_updated_at', 'updated_at'),
+        db.Index('ix_movie_review_genre', 'genre'),
+    )
+    
     def __repr__(self):
         return f'<MovieReview {self.title}>'
 
@@ -94,5 +155,84 @@ class MusicTrack(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        db.Index('ix_music_track_created_at_id', 'created_at', 'id'),
+        db.Index('ix_music_track_updated_at', 'updated_at'),
+    )
+    
     def __repr__(self):
         return f'<MusicTrack {self.title}>'
+
+
+class GameScore(db.Model):
+    """Final score of one finished game session"""
+    id = db.Column(db.Integer, primary_key=True)
+    game = db.Column(db.String(30), nullable=False)
+    score = db.Column(db.Integer, nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        # Top-N leaderboard reads walk this index instead of sorting the table
+        db.Index('ix_game_score_game_score', 'game', score.desc()),
+    )
+    
+    def __repr__(self):
+        return f'<GameScore {self.game}={self.score}>'
+
+
+class ContentCounter(db.Model):
+    """Cached row count for a content model, kept current by content_stats"""
+    name = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+    reconciled_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<ContentCounter {self.name}={self.value}>'
+
+
+class Job(db.Model):
+    """A background job for the task worker (see tasks.py)"""
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), nullable=False)
+    payload = db.Column(db.Text, nullable=False, default='{}')  # JSON object
+    dedup_key = db.Column(db.String(200))  # At most one pending job per key
+    status = db.Column(db.String(10), nullable=False, default='pending')  # pending/running/failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    locked_by = db.Column(db.String(32))
+    locked_at = db.Column(db.DateTime)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('ix_job_status_run_at', 'status', 'run_at'),
+        db.Index('ix_job_dedup_key', 'dedup_key'),
+        db.Index('ix_job_locked_by', 'locked_by'),
+    )
+    
+    def __repr__(self):
+        return f'<Job {self.name} {self.status}>'
+
+
+class StoredSession(db.Model):
+    """Server-side session data (see sessions.py)"""
+    id = db.Column(db.String(64), primary_key=True)  # SHA-256 of the cookie value
+    user_id = db.Column(db.Integer)  # Logged-in user, for bulk revocation
+    data = db.Column(db.LargeBinary, nullable=False)  # Compact tagged JSON, maybe zlib'd
+    expires_at = db.Column(db.DateTime, nullable=False)
+    
+    __table_args__ = (
+        db.Index('ix_stored_session_user_id', 'user_id'),
+        db.Index('ix_stored_session_expires_at', 'expires_at'),
+    )
+    
+    def __repr__(self):
+        return f'<StoredSession user={self.user_id}>'
+
+
+def ensure_indexes():
+    """Create declared indexes missing from tables that predate them"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
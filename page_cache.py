@@ -0,0 +1,162 @@
+"""
+Rendered-page cache for ZjadowRealm
+
+Content pages render the same HTML for every visitor: ``base.html`` is an
+anonymous-safe shell and the user menu and flash messages are filled in by
+``/fragments/user``. The cache stores each rendered template once, together
+with pre-compressed gzip/brotli bodies and an ETag, so repeat views skip
+both Jinja and compression and revalidations end in a 304. With
+``PUBLIC_PAGES`` on, the shells are also sent ``Cache-Control: public`` so
+a reverse proxy or CDN can serve them.
+
+Pages built from database rows pass a ``variant`` (their filters and content
+version) to get one entry per variant, and a ``context`` callable that only
+runs on a miss.
+"""
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+from flask import current_app, render_template, request
+from flask_login import login_required
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+class CachedPage:
+    """A rendered page with its compressed variants"""
+
+    __slots__ = ('body', 'gzip', 'br', 'etag')
+
+    def __init__(self, body, min_compress_size):
+        self.body = body
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.gzip = None
+        self.br = None
+        if len(body) >= min_compress_size:
+            self.gzip = gzip.compress(body, compresslevel=9)
+            if brotli is not None:
+                self.br = brotli.compress(body, mode=brotli.MODE_TEXT)
+
+
+class PageCache:
+    """LRU cache of rendered templates"""
+
+    def __init__(self, app=None):
+        self.maxsize = 512
+        self.min_compress_size = 1024
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read cache settings from the app config"""
+        app.config.setdefault('PAGE_CACHE_ENABLED', True)
+        app.config.setdefault('PAGE_CACHE_SIZE', self.maxsize)
+        app.config.setdefault('PAGE_CACHE_MIN_COMPRESS', self.min_compress_size)
+        app.config.setdefault('PUBLIC_PAGES', False)
+        app.config.setdefault('PUBLIC_PAGE_MAX_AGE', 300)
+        self.maxsize = int(app.config['PAGE_CACHE_SIZE'])
+        self.min_compress_size = int(app.config['PAGE_CACHE_MIN_COMPRESS'])
+
+    def _enabled(self):
+        app = current_app._get_current_object()
+        return app.config['PAGE_CACHE_ENABLED'] and not app.debug
+
+    def _lookup(self, template_name, variant=None, context=None):
+        key = template_name if variant is None else (template_name, variant)
+        with self._lock:
+            page = self._entries.get(key)
+            if page is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return page
+            self.misses += 1
+
+        body = render_template(template_name, **(context() if context else {}))
+        page = CachedPage(body.encode('utf-8'), self.min_compress_size)
+        with self._lock:
+            self._entries[key] = page
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return page
+
+    def render(self, template_name, variant=None, context=None):
+        """Serve ``template_name`` from the cache, rendering it on a miss
+
+        ``variant`` must be hashable; ``context`` returns the template
+        variables and is only called when the page has to be rendered.
+        """
+        if not self._enabled():
+            return render_template(template_name, **(context() if context else {}))
+
+        page = self._lookup(template_name, variant, context)
+        encodings = request.accept_encodings
+        if page.br is not None and encodings['br']:
+            body, encoding = page.br, 'br'
+        elif page.gzip is not None and encodings['gzip']:
+            body, encoding = page.gzip, 'gzip'
+        else:
+            body, encoding = page.body, None
+
+        response = current_app.response_class(body, mimetype='text/html')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        # The shell is identical for every visitor, so only the encoding varies
+        response.vary.add('Accept-Encoding')
+        if current_app.config['PUBLIC_PAGES']:
+            response.cache_control.public = True
+            response.cache_control.max_age = int(current_app.config['PUBLIC_PAGE_MAX_AGE'])
+        else:
+            response.cache_control.private = True
+            response.cache_control.no_cache = True
+        # Weak ETag: every encoding of the page shares it
+        response.set_etag(page.etag, weak=True)
+        return response.make_conditional(request)
+
+    def warm(self, app, template_names):
+        """Render ``template_names`` ahead of time"""
+        with app.test_request_context('/'):
+            for template_name in template_names:
+                self._lookup(template_name)
+
+    def invalidate(self, template_name):
+        """Drop every cached variant of ``template_name``"""
+        with self._lock:
+            for key in [key for key in self._entries
+                        if key == template_name or (isinstance(key, tuple) and key[0] == template_name)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every cached page"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+def content_page(view):
+    """``login_required``, unless ``PUBLIC_PAGES`` opens the page shells to everyone"""
+    protected = login_required(view)
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_app.config['PUBLIC_PAGES']:
+            return view(*args, **kwargs)
+        return protected(*args, **kwargs)
+    return wrapper
+
+
+page_cache = PageCache()
@@ -0,0 +1,71 @@
+"""
+Keyset (cursor) pagination helpers for ZjadowRealm
+
+Listings are ordered newest first on ``(created_at, id)``. Instead of an
+OFFSET, each page carries an opaque cursor holding the last row's key, so
+fetching page N costs the same as page 1 and uses the composite
+``(created_at, id)`` indexes declared in ``models.py``.
+"""
+import base64
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+
+class KeysetPage:
+    """One page of results plus the cursor for the next one"""
+
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def encode_cursor(created_at, item_id):
+    """Encode a ``(created_at, id)`` key as a URL-safe token"""
+    raw = f'{created_at.isoformat()}|{item_id}'.encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """Decode a cursor token, returning None for missing or malformed input"""
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode('utf-8')
+        created_at, item_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(item_id)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+def keyset_paginate(query, model, cursor=None, per_page=24):
+    """Return the page of ``query`` that follows ``cursor``, newest first
+
+    ``query`` may select ORM entities or plain columns, but it must expose
+    ``created_at`` and ``id`` on each row.
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+    key = decode_cursor(cursor)
+    if key is not None:
+        created_at, item_id = key
+        query = query.filter(or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < item_id),
+        ))
+
+    rows = query.limit(per_page + 1).all()
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+    return KeysetPage(rows, next_cursor)
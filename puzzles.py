@@ -0,0 +1,329 @@
+"""
+Puzzle generation for the Strands and Word Guess games
+
+Strands grids are built by a backtracking placer that lays each theme word
+along a path of adjacent cells (the same moves the player drags), longest
+words first and always extending into the most cramped free cell so dead
+ends show up early. Each finished grid is checked with a trie-driven
+search that confirms every theme word can be traced.
+
+``PuzzlePool`` keeps a few ready puzzles per game, refilled by a background
+thread, and memoizes the daily puzzle, which is seeded from the date so
+every worker (and every player) gets the same one.
+"""
+import hashlib
+import os
+import random
+import string
+import threading
+from collections import deque
+from datetime import date
+
+from flask import Blueprint, jsonify
+from flask_login import login_required
+
+# Strands themes: eight words each, at most 64 letters for the 8x8 grid
+STRANDS_THEMES = {
+    'Ocean Creatures': ('WHALE', 'SHARK', 'DOLPHIN', 'OCTOPUS', 'STARFISH', 'JELLYFISH',
+                        'SEAHORSE', 'CORAL'),
+    'Space Objects': ('PLANET', 'COMET', 'GALAXY', 'NEBULA', 'ASTEROID', 'METEOR',
+                      'SATELLITE', 'BLACKHOLE'),
+    'Kitchen Items': ('SPOON', 'KNIFE', 'PLATE', 'OVEN', 'MIXER', 'BLENDER', 'SPATULA',
+                      'REFRIGERATOR'),
+    'Musical Instruments': ('GUITAR', 'PIANO', 'VIOLIN', 'DRUMS', 'FLUTE', 'TRUMPET',
+                            'CELLO', 'HARP'),
+    'Weather': ('THUNDER', 'RAIN', 'SNOW', 'CLOUD', 'STORM', 'TORNADO', 'HAIL', 'FOG'),
+    'Fruits': ('APPLE', 'BANANA', 'CHERRY', 'MANGO', 'GRAPE', 'LEMON', 'PEACH', 'KIWI'),
+    'ZjadowRealm Games': ('TETRIS', 'PONG', 'SNAKE', 'CHESS', 'MEMORY', 'PIRATES',
+                          'STRANDS', 'PLATFORMER'),
+}
+
+WORD_GUESS_CATEGORIES = {
+    'Animals': ('ELEPHANT', 'GIRAFFE', 'PENGUIN', 'DOLPHIN', 'KANGAROO', 'BUTTERFLY'),
+    'Countries': ('AUSTRALIA', 'BRAZIL', 'CANADA', 'DENMARK', 'EGYPT', 'FRANCE'),
+    'Food': ('PIZZA', 'HAMBURGER', 'SPAGHETTI', 'CHOCOLATE', 'STRAWBERRY', 'SANDWICH'),
+    'Games': ('MINECRAFT', 'TETRIS', 'PLATFORMER', 'CHECKERS', 'SOLITAIRE', 'PINBALL'),
+    'Instruments': ('SAXOPHONE', 'ACCORDION', 'HARMONICA', 'TROMBONE', 'XYLOPHONE', 'UKULELE'),
+}
+
+GRID_SIZE = 8
+MAX_PLACEMENT_STEPS = 20000
+
+# Seconds browsers may reuse the daily puzzle response
+DAILY_MAX_AGE = 300
+
+
+class _GiveUp(Exception):
+    pass
+
+
+class Trie:
+    """Prefix tree of words for grid validation"""
+
+    __slots__ = ('children', 'word')
+
+    def __init__(self, words=()):
+        self.children = {}
+        self.word = None
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word):
+        node = self
+        for letter in word:
+            node = node.children.setdefault(letter, Trie())
+        node.word = word
+
+
+def _neighbours(size):
+    table = []
+    for cell in range(size * size):
+        row, col = divmod(cell, size)
+        table.append(tuple((row + dr) * size + col + dc
+                           for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                           if (dr or dc) and 0 <= row + dr < size and 0 <= col + dc < size))
+    return table
+
+
+NEIGHBOURS = {GRID_SIZE: _neighbours(GRID_SIZE)}
+
+
+def traceable_words(grid, trie):
+    """Every trie word that can be traced through adjacent, unrepeated cells"""
+    size = len(grid)
+    letters = [letter for row in grid for letter in row]
+    neighbours = NEIGHBOURS.get(size) or _neighbours(size)
+    found = set()
+    used = [False] * len(letters)
+
+    def walk(cell, node):
+        node = node.children.get(letters[cell])
+        if node is None:
+            return
+        if node.word:
+            found.add(node.word)
+        used[cell] = True
+        for nxt in neighbours[cell]:
+            if not used[nxt]:
+                walk(nxt, node)
+        used[cell] = False
+
+    for cell in range(len(letters)):
+        walk(cell, trie)
+    return found
+
+
+def place_words(words, rng, size=GRID_SIZE, max_steps=MAX_PLACEMENT_STEPS):
+    """Lay ``words`` on disjoint adjacent-cell paths; returns {word: [cells]} or None"""
+    neighbours = NEIGHBOURS.get(size) or _neighbours(size)
+    owner = [None] * (size * size)
+    order = sorted(words, key=len, reverse=True)
+    paths = {}
+    steps = 0
+
+    def free_degree(cell):
+        return sum(1 for nxt in neighbours[cell] if owner[nxt] is None)
+
+    def room_left(index):
+        # Free regions too small for the shortest remaining word are dead space
+        remaining = order[index:]
+        if not remaining:
+            return True
+        shortest = min(len(word) for word in remaining)
+        seen, usable = set(), 0
+        for cell, taken in enumerate(owner):
+            if taken is not None or cell in seen:
+                continue
+            stack, region = [cell], 0
+            seen.add(cell)
+            while stack:
+                current = stack.pop()
+                region += 1
+                for nxt in neighbours[current]:
+                    if owner[nxt] is None and nxt not in seen:
+                        seen.add(nxt)
+                        stack.append(nxt)
+            if region >= shortest:
+                usable += region
+        return usable >= sum(len(word) for word in remaining)
+
+    def ranked(cells):
+        cells = list(cells)
+        rng.shuffle(cells)
+        cells.sort(key=free_degree)
+        return cells
+
+    def extend(index, path):
+        nonlocal steps
+        steps += 1
+        if steps > max_steps:
+            raise _GiveUp
+        word = order[index]
+        if len(path) == len(word):
+            if room_left(index + 1) and place(index + 1):
+                paths[word] = list(path)
+                return True
+            return False
+        for nxt in ranked(cell for cell in neighbours[path[-1]] if owner[cell] is None):
+            owner[nxt] = index
+            path.append(nxt)
+            if extend(index, path):
+                return True
+            path.pop()
+            owner[nxt] = None
+        return False
+
+    def place(index):
+        if index == len(order):
+            return True
+        for start in ranked(cell for cell, taken in enumerate(owner) if taken is None):
+            owner[start] = index
+            if extend(index, [start]):
+                return True
+            owner[start] = None
+        return False
+
+    try:
+        return paths if place(0) else None
+    except _GiveUp:
+        return None
+
+
+def generate_strands(rng, theme=None, size=GRID_SIZE, attempts=20):
+    """Build a validated Strands puzzle for ``theme`` (random by default)"""
+    theme = theme or rng.choice(sorted(STRANDS_THEMES))
+    words = STRANDS_THEMES[theme]
+    trie = Trie(words)
+    for _ in range(attempts):
+        paths = place_words(words, rng, size)
+        if paths is None:
+            continue
+        letters = [rng.choice(string.ascii_uppercase) for _ in range(size * size)]
+        for word, cells in paths.items():
+            for letter, cell in zip(word, cells):
+                letters[cell] = letter
+        grid = [letters[row * size:(row + 1) * size] for row in range(size)]
+        if traceable_words(grid, trie) == set(words):
+            return {
+                'theme': theme,
+                'size': size,
+                'grid': [''.join(row) for row in grid],
+                'words': list(words),
+                'paths': {word: [divmod(cell, size) for cell in cells]
+                          for word, cells in paths.items()},
+            }
+    raise RuntimeError(f'Could not place the "{theme}" words on a {size}x{size} grid')
+
+
+def generate_wordguess(rng):
+    """Pick a Word Guess category and word"""
+    category = rng.choice(sorted(WORD_GUESS_CATEGORIES))
+    return {'category': category, 'word': rng.choice(WORD_GUESS_CATEGORIES[category])}
+
+
+GENERATORS = {'strands': generate_strands, 'wordguess': generate_wordguess}
+
+
+def daily_seed(game, day):
+    """Stable seed for ``game`` on ``day`` (identical in every process)"""
+    return int.from_bytes(hashlib.sha256(f'{game}:{day.isoformat()}'.encode()).digest()[:8], 'big')
+
+
+class PuzzlePool:
+    """Pre-generated puzzles per game, refilled in the background"""
+
+    def __init__(self, app=None):
+        self.pool_size = 16
+        self._pools = {game: deque() for game in GENERATORS}
+        self._daily = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread_pid = None
+        self._rng = random.Random()
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read pool settings from the app config"""
+        app.config.setdefault('PUZZLE_POOL_SIZE', self.pool_size)
+        self.pool_size = int(app.config['PUZZLE_POOL_SIZE'])
+        self.app = app
+
+    def _ensure_thread(self):
+        # Threads do not survive fork, so each gunicorn worker starts its own
+        if self._thread_pid != os.getpid():
+            self._thread_pid = os.getpid()
+            threading.Thread(target=self._run, name='puzzle-filler', daemon=True).start()
+
+    def _run(self):
+        while True:
+            try:
+                self.fill()
+            except Exception:
+                self.app.logger.exception('Puzzle pool refill failed')
+            self._wakeup.wait()
+            self._wakeup.clear()
+
+    def fill(self):
+        """Top every game's pool up to ``pool_size``"""
+        for game, generate in GENERATORS.items():
+            while len(self._pools[game]) < self.pool_size:
+                puzzle = generate(self._rng)
+                with self._lock:
+                    self._pools[game].append(puzzle)
+
+    def take(self, game):
+        """A fresh random puzzle; generated inline only if the pool is empty"""
+        with self._lock:
+            self._ensure_thread()
+            pool = self._pools[game]
+            puzzle = pool.popleft() if pool else None
+            low = len(pool) < self.pool_size // 2
+        if low:
+            self._wakeup.set()
+        return puzzle if puzzle is not None else GENERATORS[game](self._rng)
+
+    def daily(self, game, day=None):
+        """The deterministic puzzle for ``day`` (today by default)"""
+        day = day or date.today()
+        key = (game, day)
+        puzzle = self._daily.get(key)
+        if puzzle is None:
+            puzzle = GENERATORS[game](random.Random(daily_seed(game, day)))
+            with self._lock:
+                # Only today's and yesterday's puzzles are worth keeping
+                for stale in [k for k in self._daily if (day - k[1]).days > 1]:
+                    del self._daily[stale]
+                self._daily[key] = puzzle
+        return puzzle
+
+
+puzzle_pool = PuzzlePool()
+
+puzzles = Blueprint('puzzles', __name__, url_prefix='/api/v1/puzzles')
+
+
+@puzzles.route('/<game>')
+@login_required
+def random_puzzle(game):
+    """A new puzzle from the pool"""
+    if game not in GENERATORS:
+        return jsonify(error='Unknown game'), 404
+    response = jsonify(game=game, daily=False, puzzle=puzzle_pool.take(game))
+    response.cache_control.no_store = True
+    return response
+
+
+@puzzles.route('/<game>/daily')
+@login_required
+def daily_puzzle(game):
+    """Today's puzzle, the same for everyone"""
+    if game not in GENERATORS:
+        return jsonify(error='Unknown game'), 404
+    day = date.today()
+    response = jsonify(game=game, daily=True, date=day.isoformat(),
+                       puzzle=puzzle_pool.daily(game, day))
+    response.cache_control.private = True
+    response.cache_control.max_age = DAILY_MAX_AGE
+    return response
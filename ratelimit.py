@@ -0,0 +1,219 @@
+"""
+Rate limiting for ZjadowRealm
+
+Token buckets keyed by client IP and by account guard the routes that hash
+passwords (``/login``, ``/signup``, ``/change-password``), the admin
+routes that change data and leaderboard score submissions. The check runs
+in the view decorator, before the view touches the database or the hashing
+pool, and routes without the decorator pay nothing. The login, signup and
+password-change buckets per account are keyed on (IP, account), so a
+client failing logins under someone else's name only locks out itself.
+
+Behind a reverse proxy the client IP comes from ``X-Forwarded-For``;
+``RATELIMIT_PROXY_COUNT`` defaults to 1 on Render (``RENDER`` is set) and
+an error is logged if the header shows up while it is 0.
+
+Buckets live in a backend: ``SQLiteBackend`` (the default) shares them
+between all gunicorn workers on the host through one small SQLite file,
+``MemoryBackend`` keeps them per process. Anything with a ``consume(key,
+capacity, rate)`` method can be plugged in. If the backend fails, requests
+are let through: the hashing pool still sheds load on its own.
+"""
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, request
+
+_LIMIT = re.compile(r'^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$')
+_PERIODS = {'second': 1, 'minute': 60, 'hour': 3600, 'day': 86400}
+
+# Buckets untouched this long are full again and can be forgotten
+IDLE_EXPIRY = 86400
+
+# Backend calls between sweeps of idle buckets
+PRUNE_EVERY = 1000
+
+# Scopes anyone can hit with any username: their account buckets are per client IP
+IP_SCOPED_ACCOUNTS = {'auth'}
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request is over one of its limits"""
+
+    def __init__(self, retry_after):
+        super().__init__('Rate limit exceeded')
+        self.retry_after = retry_after
+
+
+def parse_limit(value):
+    """``'5/minute'`` -> ``(5, 60)``; empty values disable the limit"""
+    if not value:
+        return None
+    match = _LIMIT.match(value)
+    if not match:
+        raise ValueError(f'Invalid rate limit {value!r} (expected e.g. "5/minute")')
+    return int(match.group(1)), _PERIODS[match.group(2)]
+
+
+def _take(tokens, updated, capacity, rate, now):
+    # Refill since the last hit, then try to spend one token
+    tokens = min(capacity, tokens + (now - updated) * rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryBackend:
+    """Buckets in this process only"""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def consume(self, key, capacity, rate):
+        """Spend a token from ``key``; returns seconds to wait (0 if allowed)"""
+        now = time.time()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens, retry_after = _take(tokens, updated, capacity, rate, now)
+            self._buckets[key] = (tokens, now)
+            self._calls += 1
+            if self._calls % PRUNE_EVERY == 0:
+                self._buckets = {k: v for k, v in self._buckets.items()
+                                 if now - v[1] < IDLE_EXPIRY}
+        return retry_after
+
+
+class SQLiteBackend:
+    """Buckets in a SQLite file shared by every worker on the host"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._calls = 0
+
+    def _connection(self):
+        # Connections are per thread and must not cross a fork
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=2, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute('CREATE TABLE IF NOT EXISTS bucket ('
+                         ' key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)')
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def consume(self, key, capacity, rate):
+        """Spend a token from ``key``; returns seconds to wait (0 if allowed)"""
+        conn = self._connection()
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT tokens, updated FROM bucket WHERE key = ?',
+                               (key,)).fetchone()
+            tokens, updated = row if row else (capacity, now)
+            tokens, retry_after = _take(tokens, updated, capacity, rate, now)
+            conn.execute('INSERT OR REPLACE INTO bucket (key, tokens, updated) VALUES (?, ?, ?)',
+                         (key, tokens, now))
+            self._calls += 1
+            if self._calls % PRUNE_EVERY == 0:
+                conn.execute('DELETE FROM bucket WHERE updated < ?', (now - IDLE_EXPIRY,))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        return retry_after
+
+
+class RateLimiter:
+    """Per-IP and per-account token buckets for selected routes"""
+
+    def __init__(self, app=None):
+        self.enabled = True
+        self.proxy_count = 0
+        self.backend = None
+        self._proxy_warned = False
+        self.limits = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read limits and pick the backend from the app config"""
+        app.config.setdefault('RATELIMIT_ENABLED', True)
+        app.config.setdefault('RATELIMIT_STORAGE', os.path.join(
+            tempfile.gettempdir(), 'zjadowrealm-ratelimit.sqlite3'))
+        # Render sets RENDER and puts exactly one proxy in front of the app
+        app.config.setdefault('RATELIMIT_PROXY_COUNT', 1 if os.environ.get('RENDER') else 0)
+        app.config.setdefault('RATELIMIT_AUTH_PER_IP', '20/minute')
+        app.config.setdefault('RATELIMIT_AUTH_PER_USER', '5/minute')
+        app.config.setdefault('RATELIMIT_ADMIN', '60/minute')
+        app.config.setdefault('RATELIMIT_SCORES', '30/minute')
+        self.enabled = bool(app.config['RATELIMIT_ENABLED'])
+        self.proxy_count = int(app.config['RATELIMIT_PROXY_COUNT'])
+        # scope -> (limit per client IP, limit per account)
+        self.limits = {
+            'auth': (parse_limit(app.config['RATELIMIT_AUTH_PER_IP']),
+                     parse_limit(app.config['RATELIMIT_AUTH_PER_USER'])),
+            'admin': (None, parse_limit(app.config['RATELIMIT_ADMIN'])),
+            'scores': (None, parse_limit(app.config['RATELIMIT_SCORES'])),
+        }
+        storage = app.config['RATELIMIT_STORAGE']
+        self.backend = MemoryBackend() if storage == 'memory' else SQLiteBackend(storage)
+
+    def client_ip(self):
+        """The client address, trusting ``RATELIMIT_PROXY_COUNT`` proxies' X-Forwarded-For"""
+        # Each trusted proxy appends the address it saw, so the client is the
+        # proxy_count-th entry from the right (like werkzeug's ProxyFix x_for)
+        route = request.access_route
+        if self.proxy_count and 'X-Forwarded-For' in request.headers \
+                and len(route) >= self.proxy_count:
+            return route[-self.proxy_count]
+        if not self.proxy_count and not self._proxy_warned and 'X-Forwarded-For' in request.headers:
+            self._proxy_warned = True
+            current_app.logger.error(
+                'X-Forwarded-For is present but RATELIMIT_PROXY_COUNT is 0: every client '
+                'behind the proxy shares one rate-limit bucket; set it to the number of proxies')
+        return request.remote_addr or 'unknown'
+
+    def check(self, scope, account=None):
+        """Spend one token from each of ``scope``'s buckets or raise ``RateLimitExceeded``"""
+        per_ip, per_account = self.limits[scope]
+        buckets = []
+        ip = self.client_ip() if per_ip or scope in IP_SCOPED_ACCOUNTS else None
+        if per_ip:
+            buckets.append((f'{scope}:ip:{ip}', per_ip))
+        if per_account and account:
+            owner = f'{ip}:' if scope in IP_SCOPED_ACCOUNTS else ''
+            buckets.append((f'{scope}:account:{owner}{str(account).lower()}', per_account))
+
+        retry_after = 0.0
+        try:
+            for key, (capacity, period) in buckets:
+                retry_after = max(retry_after,
+                                  self.backend.consume(key, capacity, capacity / period))
+        except sqlite3.Error as exc:
+            current_app.logger.warning('Rate limit check skipped: %s', exc)
+            return
+        if retry_after:
+            raise RateLimitExceeded(max(1, int(retry_after + 0.999)))
+
+    def limit(self, scope, account=None, methods=None):
+        """Decorate a view; ``account`` returns the username/id the limit is keyed on"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if self.enabled and (methods is None or request.method in methods):
+                    self.check(scope, account() if account else None)
+                return view(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+rate_limiter = RateLimiter()
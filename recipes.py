@@ -0,0 +1,101 @@
+"""
+Structured recipe storage for ZjadowRealm
+
+The admin forms still submit ingredients and instructions as text blobs
+(one item per line, or a JSON list). ``sync_structure`` splits them into
+``RecipeIngredient`` and ``RecipeStep`` rows so ingredient lookups run in
+the database instead of re-parsing every recipe in Python.
+"""
+import json
+import re
+
+from models import db, Recipe, RecipeIngredient, RecipeStep
+
+_BULLET = re.compile(r'^\s*(?:[-*•]|\d+[.)])\s+')
+_QUANTITY = re.compile(r'^[\d\s/.,¼-¾⅐-⅞-]+')
+_UNIT = re.compile(
+    r'^(?:g|gr|grams?|kg|mg|ml|l|dl|cl|liters?|litres?|cups?|tbsp|tsp|tablespoons?|'
+    r'teaspoons?|oz|ounces?|lbs?|pounds?|pinch(?:es)?|cloves?|cans?|slices?|pieces?|'
+    r'handfuls?|dash(?:es)?)\.?\s+(?:of\s+)?', re.IGNORECASE)
+
+
+def split_lines(blob):
+    """Split a stored blob (JSON list or one item per line) into clean items"""
+    if not blob:
+        return []
+    stripped = blob.strip()
+    if stripped.startswith('['):
+        try:
+            items = json.loads(stripped)
+        except ValueError:
+            items = None
+        if isinstance(items, list):
+            return [str(item).strip() for item in items if str(item).strip()]
+    lines = (_BULLET.sub('', line).strip() for line in blob.splitlines())
+    return [line for line in lines if line]
+
+
+def normalize_ingredient(text):
+    """Reduce an ingredient line to its name: "2 cups of Rice" -> "rice" """
+    name = _QUANTITY.sub('', text.strip())
+    name = _UNIT.sub('', name)
+    name = name.split(',', 1)[0].strip().lower()
+    return (name or text.strip().lower())[:200]
+
+
+def sync_structure(recipe):
+    """Rebuild ``recipe``'s ingredient and step rows from its text fields"""
+    recipe.ingredient_items = [
+        RecipeIngredient(position=position, text=line[:500], name=normalize_ingredient(line))
+        for position, line in enumerate(split_lines(recipe.ingredients))
+    ]
+    recipe.steps = [
+        RecipeStep(position=position, text=line)
+        for position, line in enumerate(split_lines(recipe.instructions))
+    ]
+
+
+def structure_mappings(recipe_id, ingredients, instructions):
+    """``sync_structure`` as plain row dicts, for bulk inserts"""
+    ingredient_rows = [
+        {'recipe_id': recipe_id, 'position': position, 'text': line[:500],
+         'name': normalize_ingredient(line)}
+        for position, line in enumerate(split_lines(ingredients))
+    ]
+    step_rows = [
+        {'recipe_id': recipe_id, 'position': position, 'text': line}
+        for position, line in enumerate(split_lines(instructions))
+    ]
+    return ingredient_rows, step_rows
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def recipes_containing(ingredient):
+    """Query for recipes with an ingredient whose name starts with ``ingredient``
+
+    The prefix match uses the ``text_pattern_ops`` index on Postgres. Raises
+    ``ValueError`` if nothing is left of ``ingredient`` after normalizing.
+    """
+    name = normalize_ingredient(ingredient)
+    if not name:
+        raise ValueError('Ingredient name is empty')
+    matching = db.session.query(RecipeIngredient.recipe_id) \
+        .filter(RecipeIngredient.name.like(f'{_escape_like(name)}%', escape='\\'))
+    return Recipe.query.filter(Recipe.id.in_(matching)).order_by(Recipe.title)
+
+
+def backfill(batch_size=200):
+    """Create structured rows for recipes that have none; returns the count"""
+    has_items = db.session.query(RecipeIngredient.recipe_id).distinct()
+    pending = db.session.query(Recipe.id).filter(~Recipe.id.in_(has_items)).all()
+    done = 0
+    for start in range(0, len(pending), batch_size):
+        ids = [row.id for row in pending[start:start + batch_size]]
+        for recipe in Recipe.query.filter(Recipe.id.in_(ids)):
+            sync_structure(recipe)
+            done += 1
+        db.session.commit()
+    return done
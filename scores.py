@@ -0,0 +1,171 @@
+"""
+Server-side leaderboards for the ZjadowRealm games
+
+Scores posted by the game pages are buffered in memory and written with a
+single bulk INSERT once the buffer reaches ``SCORE_FLUSH_SIZE`` entries or
+``SCORE_FLUSH_INTERVAL`` seconds have passed, so a busy game session
+does not turn into one commit per request. Rows from a failed flush are
+put back, but the buffer never holds more than ``SCORE_BUFFER_MAX``
+scores: past that the oldest are dropped and logged. Top-N leaderboards
+are cached per game for ``LEADERBOARD_TTL`` seconds and dropped when this
+worker flushes new scores for that game.
+"""
+import atexit
+import os
+import threading
+import time
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_login import current_user, login_required
+from sqlalchemy import insert
+
+from models import db, GameScore, User
+from ratelimit import rate_limiter
+
+# Games that may post scores (matches the /games/* pages)
+GAMES = ('snake', 'pong', 'memory', 'tetris', 'platformer', 'pirates',
+         'chess', 'tictactoe', 'wordguess', 'strands')
+
+MAX_SCORE = 10 ** 9
+
+scores = Blueprint('scores', __name__, url_prefix='/api/v1/scores')
+
+
+class ScoreBuffer:
+    """Collects scores and flushes them in bulk from a background thread"""
+
+    def __init__(self, app=None):
+        self.flush_size = 200
+        self.flush_interval = 5.0
+        self.max_pending = 10000
+        self.leaderboard_ttl = 30.0
+        self.dropped = 0
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread_pid = None
+        self._leaderboards = {}
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read buffering settings from the app config"""
+        app.config.setdefault('SCORE_FLUSH_SIZE', self.flush_size)
+        app.config.setdefault('SCORE_FLUSH_INTERVAL', self.flush_interval)
+        app.config.setdefault('SCORE_BUFFER_MAX', self.max_pending)
+        app.config.setdefault('LEADERBOARD_TTL', self.leaderboard_ttl)
+        self.flush_size = int(app.config['SCORE_FLUSH_SIZE'])
+        self.flush_interval = float(app.config['SCORE_FLUSH_INTERVAL'])
+        self.max_pending = max(self.flush_size, int(app.config['SCORE_BUFFER_MAX']))
+        self.leaderboard_ttl = float(app.config['LEADERBOARD_TTL'])
+        self.app = app
+        atexit.register(self.flush)
+
+    def _ensure_thread(self):
+        # Threads do not survive fork, so each gunicorn worker starts its own
+        if self._thread_pid != os.getpid():
+            self._thread_pid = os.getpid()
+            threading.Thread(target=self._run, name='score-flusher', daemon=True).start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                self.app.logger.exception('Score flush failed')
+
+    def _trim(self):
+        # Caller holds self._lock; while the database is down, keep the newest scores
+        excess = len(self._pending) - self.max_pending
+        if excess > 0:
+            del self._pending[:excess]
+            self.dropped += excess
+            self.app.logger.warning('Score buffer full: dropped %d oldest scores (%d so far)',
+                                    excess, self.dropped)
+
+    def add(self, game, score, user_id):
+        """Queue one score; a full buffer wakes the flusher early"""
+        with self._lock:
+            self._pending.append({'game': game, 'score': score, 'user_id': user_id,
+                                  'created_at': datetime.utcnow()})
+            self._trim()
+            full = len(self._pending) >= self.flush_size
+            self._ensure_thread()
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """Write all pending scores in one INSERT; returns the number written"""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+            with self.app.app_context():
+                try:
+                    db.session.execute(insert(GameScore), rows)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    with self._lock:
+                        self._pending[:0] = rows
+                        self._trim()
+                    raise
+            for game in {row['game'] for row in rows}:
+                self._leaderboards.pop(game, None)
+            return len(rows)
+
+    def leaderboard(self, game, limit=10):
+        """Top ``limit`` scores for ``game``, cached for ``leaderboard_ttl``"""
+        cached = self._leaderboards.get(game)
+        if cached is not None and cached[0] > time.monotonic() and cached[1] >= limit:
+            return cached[2][:limit]
+
+        rows = db.session.query(GameScore.score, GameScore.created_at, User.username) \
+            .outerjoin(User, User.id == GameScore.user_id) \
+            .filter(GameScore.game == game) \
+            .order_by(GameScore.score.desc()) \
+            .limit(limit).all()
+        ranking = [{'rank': rank, 'username': row.username, 'score': row.score,
+                    'created_at': row.created_at.isoformat()}
+                   for rank, row in enumerate(rows, start=1)]
+        self._leaderboards[game] = (time.monotonic() + self.leaderboard_ttl, limit, ranking)
+        return ranking
+
+
+score_buffer = ScoreBuffer()
+
+
+@scores.route('', methods=['POST'])
+@login_required
+@rate_limiter.limit('scores', account=lambda: current_user.get_id())
+def submit_score():
+    """Accept a finished game's score for buffered storage"""
+    data = request.get_json(silent=True) or {}
+    game = data.get('game')
+    score = data.get('score')
+    if game not in GAMES:
+        return jsonify(error='Unknown game'), 400
+    if not isinstance(score, int) or isinstance(score, bool) or not 0 <= score <= MAX_SCORE:
+        return jsonify(error='score must be an integer between 0 and 1e9'), 400
+
+    score_buffer.add(game, score, current_user.id)
+    return jsonify(status='queued'), 202
+
+
+@scores.route('/<game>')
+@login_required
+def leaderboard(game):
+    """Top scores for one game"""
+    if game not in GAMES:
+        return jsonify(error='Unknown game'), 404
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 100)
+    response = jsonify(game=game, scores=score_buffer.leaderboard(game, limit))
+    response.cache_control.private = True
+    response.cache_control.max_age = int(current_app.config['LEADERBOARD_TTL'])
+    return response
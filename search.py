@@ -0,0 +1,186 @@
+"""
+Full-text search for ZjadowRealm content
+
+Keeps an inverted index of game reviews, movie reviews, recipes and music
+tracks: an FTS5 virtual table on SQLite, or a table with a tsvector column
+and GIN index on PostgreSQL. Admin routes call ``queue_update`` or
+``queue_remove`` with each write; the job worker then refreshes the queued
+items in batches, so the index follows the content without ever scanning
+the Text columns at query time.
+"""
+import re
+
+from markupsafe import Markup, escape
+from sqlalchemy import text
+
+from models import db, Recipe, GameReview, MovieReview, MusicTrack
+from tasks import task_queue
+
+# Index kind -> (model, title field, body fields, listing endpoint)
+SEARCHABLE = {
+    'game_review': (GameReview, 'title', ('review_text', 'genre', 'platform'), 'game_reviews'),
+    'movie_review': (MovieReview, 'title', ('review_text', 'genre'), 'movie_reviews'),
+    'recipe': (Recipe, 'title', ('ingredients',), 'dinner_recipes'),
+    'music_track': (MusicTrack, 'title', ('description',), 'music'),
+}
+
+KIND_BY_MODEL = {model: kind for kind, (model, _, _, _) in SEARCHABLE.items()}
+
+# Private-use markers survive escaping and are swapped for <mark> afterwards
+_HIT_START, _HIT_END = '\ue000', '\ue001'
+_TOKEN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchIndex:
+    """Inverted index over the content models"""
+
+    def __init__(self, app=None):
+        self.max_results = 50
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read search settings from the app config"""
+        app.config.setdefault('SEARCH_MAX_RESULTS', self.max_results)
+        self.max_results = int(app.config['SEARCH_MAX_RESULTS'])
+
+    @property
+    def _postgres(self):
+        return db.engine.dialect.name == 'postgresql'
+
+    def create_tables(self):
+        """Create the index structures; returns True if they were just created"""
+        if self._postgres:
+            exists = db.session.execute(text(
+                "SELECT to_regclass('search_document') IS NOT NULL")).scalar()
+            if not exists:
+                db.session.execute(text(
+                    'CREATE TABLE search_document ('
+                    ' kind VARCHAR(20) NOT NULL, item_id INTEGER NOT NULL,'
+                    ' title TEXT NOT NULL, body TEXT NOT NULL,'
+                    " document TSVECTOR GENERATED ALWAYS AS ("
+                    "  setweight(to_tsvector('simple', title), 'A') ||"
+                    "  setweight(to_tsvector('simple', body), 'B')) STORED,"
+                    ' PRIMARY KEY (kind, item_id))'))
+                db.session.execute(text(
+                    'CREATE INDEX ix_search_document ON search_document USING GIN (document)'))
+        else:
+            exists = db.session.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE name = 'search_index'")).scalar()
+            if not exists:
+                db.session.execute(text(
+                    'CREATE VIRTUAL TABLE search_index USING fts5('
+                    ' kind UNINDEXED, item_id UNINDEXED, title, body,'
+                    " tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"))
+        db.session.commit()
+        return not exists
+
+    @staticmethod
+    def _document(item):
+        kind = KIND_BY_MODEL[type(item)]
+        _, title_field, body_fields, _ = SEARCHABLE[kind]
+        body = '\n'.join(getattr(item, field) or '' for field in body_fields)
+        return kind, getattr(item, title_field) or '', body
+
+    def _insert(self, item):
+        kind, title, body = self._document(item)
+        table = 'search_document' if self._postgres else 'search_index'
+        db.session.execute(text(
+            f'INSERT INTO {table} (kind, item_id, title, body) '
+            'VALUES (:kind, :item_id, :title, :body)'),
+            {'kind': kind, 'item_id': item.id, 'title': title, 'body': body})
+
+    def queue_update(self, item):
+        """Queue a refresh of ``item`` in the caller's transaction (needs ``item.id``)"""
+        self.queue_remove(type(item), item.id)
+
+    def queue_remove(self, model, item_id):
+        """Queue a refresh of ``model`` row ``item_id``; a missing row is dropped"""
+        kind = KIND_BY_MODEL[model]
+        task_queue.enqueue('search.refresh', {'kind': kind, 'id': item_id},
+                           dedup_key=f'search:{kind}:{item_id}')
+
+    def refresh(self, entries):
+        """Re-index ``[{'kind', 'id'}, ...]`` with one delete and one load per kind"""
+        ids_by_kind = {}
+        for entry in entries:
+            ids_by_kind.setdefault(entry['kind'], set()).add(entry['id'])
+        table = 'search_document' if self._postgres else 'search_index'
+        for kind, ids in ids_by_kind.items():
+            model = SEARCHABLE[kind][0]
+            db.session.execute(text(f'DELETE FROM {table} WHERE kind = :kind AND item_id = :item_id'),
+                               [{'kind': kind, 'item_id': item_id} for item_id in ids])
+            for item in model.query.filter(model.id.in_(ids)):
+                self._insert(item)
+
+    def index_rows(self, model, rows):
+        """Index freshly inserted ``rows`` (dicts with ``id``) in the caller's transaction"""
+        kind = KIND_BY_MODEL[model]
+        _, title_field, body_fields, _ = SEARCHABLE[kind]
+        params = [{'kind': kind, 'item_id': row['id'], 'title': row.get(title_field) or '',
+                   'body': '\n'.join(row.get(field) or '' for field in body_fields)}
+                  for row in rows]
+        if params:
+            table = 'search_document' if self._postgres else 'search_index'
+            db.session.execute(text(
+                f'INSERT INTO {table} (kind, item_id, title, body) '
+                'VALUES (:kind, :item_id, :title, :body)'), params)
+
+    def rebuild(self):
+        """Re-index every searchable row; returns the number indexed"""
+        table = 'search_document' if self._postgres else 'search_index'
+        db.session.execute(text(f'DELETE FROM {table}'))
+        indexed = 0
+        for model, _, _, _ in SEARCHABLE.values():
+            for item in model.query.yield_per(500):
+                self._insert(item)
+                indexed += 1
+        db.session.commit()
+        return indexed
+
+    def search(self, query, limit=None):
+        """Return ranked hits for ``query``; every term is prefix-matched"""
+        terms = _TOKEN.findall(query.lower())
+        if not terms:
+            return []
+        limit = min(limit or self.max_results, self.max_results)
+
+        if self._postgres:
+            rows = db.session.execute(text(
+                'SELECT kind, item_id, title,'
+                "  ts_headline('simple', body, q, :options) AS snippet"
+                ' FROM search_document, to_tsquery(\'simple\', :tsquery) AS q'
+                ' WHERE document @@ q'
+                ' ORDER BY ts_rank(document, q) DESC LIMIT :limit'),
+                {'tsquery': ' & '.join(f'{term}:*' for term in terms),
+                 'options': f'StartSel={_HIT_START}, StopSel={_HIT_END}, MaxWords=24, MinWords=8',
+                 'limit': limit})
+        else:
+            rows = db.session.execute(text(
+                'SELECT kind, item_id, title,'
+                '  snippet(search_index, 3, :start, :end, \'…\', 16) AS snippet'
+                ' FROM search_index WHERE search_index MATCH :match'
+                ' ORDER BY bm25(search_index, 0.0, 0.0, 10.0, 1.0) LIMIT :limit'),
+                {'match': ' '.join(f'"{term}"*' for term in terms),
+                 'start': _HIT_START, 'end': _HIT_END, 'limit': limit})
+
+        return [{
+            'kind': row.kind,
+            'id': int(row.item_id),
+            'title': row.title,
+            'snippet': _highlight(row.snippet),
+            'endpoint': SEARCHABLE[row.kind][3],
+        } for row in rows]
+
+
+def _highlight(snippet):
+    return Markup(str(escape(snippet or ''))
+                  .replace(_HIT_START, '<mark>').replace(_HIT_END, '</mark>'))
+
+
+search_index = SearchIndex()
+
+
+@task_queue.task('search.refresh', batch=True)
+def _refresh_search(entries):
+    search_index.refresh(entries)
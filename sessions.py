@@ -0,0 +1,264 @@
+"""
+Server-side sessions for ZjadowRealm
+
+With ``SESSION_STORE=database`` the session cookie carries only a random
+id. The data lives in the ``stored_session`` table. It is serialized with
+Flask's tagged JSON, so tuples, bytes, Markup and datetimes round-trip as
+they do in the cookie session, and zlib-compressed when it is large. Each
+worker keeps recently used sessions decoded in an LRU, so a request with a
+warm session does no HMAC check, no decoding and no query.
+
+A session's stored data never changes. A write stores a new row under a
+new id and sends the new cookie, so a worker can never serve an outdated
+copy from its LRU. The superseded row stays readable for
+``SUPERSEDED_GRACE`` seconds for requests already in flight with the old
+cookie, unless the write logged a user in or out. Idle sessions expire
+after ``PERMANENT_SESSION_LIFETIME``, or after ``SESSION_ANON_LIFETIME``
+seconds when nobody is logged in (those mostly carry a single flash
+message, and crawlers create one per request). The expiry is pushed
+forward at most once per ``SESSION_TOUCH_INTERVAL``, and a background job
+deletes expired rows.
+
+``revoke_user`` deletes every session of a user. Other workers may still
+hold a deleted session (revoked or logged out) in their LRU for up to
+``SESSION_CACHE_TTL`` seconds.
+"""
+import copy
+import hashlib
+import secrets
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from sqlalchemy.exc import SQLAlchemyError
+
+from models import db, StoredSession
+from tasks import task_queue
+
+# Seconds a superseded session stays valid for requests already in flight
+SUPERSEDED_GRACE = 60
+
+# Payload prefixes: plain tagged JSON or zlib-compressed tagged JSON
+_PLAIN = b'j'
+_ZLIB = b'z'
+
+
+class ServerSession(SecureCookieSession):
+    """Session dict tied to a stored row"""
+
+    def __init__(self, initial=None, sid=None, expires_at=None, user_id=None):
+        super().__init__(initial)
+        self.sid = sid
+        self.expires_at = expires_at
+        self.user_id = user_id
+
+
+class SessionStore(SessionInterface):
+    """Database-backed ``SessionInterface`` with an in-process LRU in front"""
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, app=None):
+        self.enabled = False
+        self.maxsize = 10000
+        self.ttl = 60.0
+        self.touch_interval = timedelta(minutes=5)
+        self.anon_lifetime = timedelta(minutes=10)
+        self.sweep_interval = 3600
+        self.compress_min = 256
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read settings and take over ``app.session_interface`` when enabled"""
+        app.config.setdefault('SESSION_STORE', 'cookie')
+        app.config.setdefault('SESSION_CACHE_SIZE', self.maxsize)
+        app.config.setdefault('SESSION_CACHE_TTL', self.ttl)
+        app.config.setdefault('SESSION_TOUCH_INTERVAL', 300)
+        app.config.setdefault('SESSION_ANON_LIFETIME', 600)
+        app.config.setdefault('SESSION_SWEEP_INTERVAL', self.sweep_interval)
+        app.config.setdefault('SESSION_COMPRESS_MIN', self.compress_min)
+        self.enabled = app.config['SESSION_STORE'] == 'database'
+        self.maxsize = int(app.config['SESSION_CACHE_SIZE'])
+        self.ttl = float(app.config['SESSION_CACHE_TTL'])
+        self.touch_interval = timedelta(seconds=int(app.config['SESSION_TOUCH_INTERVAL']))
+        self.anon_lifetime = timedelta(seconds=int(app.config['SESSION_ANON_LIFETIME']))
+        self.sweep_interval = int(app.config['SESSION_SWEEP_INTERVAL'])
+        self.compress_min = int(app.config['SESSION_COMPRESS_MIN'])
+        if self.enabled:
+            app.session_interface = self
+
+    def dumps(self, data):
+        """Serialize session data to bytes, compressing large payloads"""
+        raw = self.serializer.dumps(dict(data)).encode('utf-8')
+        if len(raw) >= self.compress_min:
+            return _ZLIB + zlib.compress(raw)
+        return _PLAIN + raw
+
+    def loads(self, blob):
+        """Inverse of ``dumps``"""
+        blob = bytes(blob)
+        raw = zlib.decompress(blob[1:]) if blob[:1] == _ZLIB else blob[1:]
+        return self.serializer.loads(raw.decode('utf-8'))
+
+    @staticmethod
+    def _key(sid):
+        # Only a hash of the cookie is stored, so a leaked table can't be replayed
+        return hashlib.sha256(sid.encode('utf-8')).hexdigest()
+
+    def _cached(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[3] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self._entries.pop(key, None)
+            self.misses += 1
+        return None
+
+    def _remember(self, key, data, expires_at, user_id):
+        with self._lock:
+            self._entries[key] = (data, expires_at, user_id, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _forget(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if not sid:
+            return ServerSession()
+        key = self._key(sid)
+        entry = self._cached(key)
+        if entry is None:
+            table = StoredSession.__table__
+            try:
+                with db.engine.connect() as conn:
+                    row = conn.execute(table.select().where(table.c.id == key)).first()
+                if row is None:
+                    return ServerSession()
+                entry = (self.loads(row.data), row.expires_at, row.user_id)
+            except (SQLAlchemyError, ValueError, zlib.error) as exc:
+                app.logger.warning('Could not load session: %s', exc)
+                return ServerSession()
+            self._remember(key, *entry)
+        data, expires_at, user_id = entry[:3]
+        if expires_at <= datetime.utcnow():
+            return ServerSession()
+        # The cached dict is shared, so each request gets its own copy
+        return ServerSession(copy.deepcopy(data), sid=sid, expires_at=expires_at, user_id=user_id)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        now = datetime.utcnow()
+        table = StoredSession.__table__
+        if not session:
+            # Emptied (e.g. logout): drop the row and the cookie
+            if session.modified and session.sid:
+                key = self._key(session.sid)
+                self._forget(key)
+                with db.engine.begin() as conn:
+                    conn.execute(table.delete().where(table.c.id == key))
+                response.delete_cookie(name, domain=domain, path=path, secure=secure,
+                                       samesite=samesite, httponly=httponly)
+            return
+
+        user_id = dict.get(session, '_user_id')
+        user_id = int(user_id) if str(user_id).isdigit() else None
+        # Anonymous rows (flashes before a login, crawler hits) only live a few minutes
+        lifetime = app.permanent_session_lifetime if user_id is not None else self.anon_lifetime
+        expires_at = now + lifetime
+        if session.modified or session.sid is None:
+            sid = secrets.token_urlsafe(32)
+            key = self._key(sid)
+            with db.engine.begin() as conn:
+                conn.execute(table.insert().values(id=key, user_id=user_id,
+                                                   data=self.dumps(session), expires_at=expires_at))
+                if session.sid:
+                    old = table.c.id == self._key(session.sid)
+                    if user_id != session.user_id:
+                        # Login or logout: the old id must stop working at once
+                        conn.execute(table.delete().where(old))
+                    else:
+                        conn.execute(table.update().where(old, table.c.expires_at > now)
+                                     .values(expires_at=now + timedelta(seconds=SUPERSEDED_GRACE)))
+            if session.sid:
+                self._forget(self._key(session.sid))
+            self._remember(key, dict(session), expires_at, user_id)
+        elif expires_at - session.expires_at >= self.touch_interval:
+            # Unchanged data: only push the idle expiry forward, at most once per interval
+            sid = session.sid
+            key = self._key(sid)
+            with db.engine.begin() as conn:
+                conn.execute(table.update().where(table.c.id == key).values(expires_at=expires_at))
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries[key] = (entry[0], expires_at, entry[2], entry[3])
+            if not session.permanent:
+                return
+        else:
+            return
+
+        response.set_cookie(name, sid, expires=self.get_expiration_time(app, session),
+                            httponly=httponly, domain=domain, path=path,
+                            secure=secure, samesite=samesite)
+
+    def revoke_user(self, user_id):
+        """Delete every stored session of ``user_id``; returns how many were removed"""
+        if not self.enabled:
+            return 0
+        table = StoredSession.__table__
+        with db.engine.begin() as conn:
+            removed = conn.execute(table.delete().where(table.c.user_id == user_id)).rowcount
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[2] == user_id]:
+                del self._entries[key]
+        return removed
+
+    def sweep(self):
+        """Delete expired sessions; returns how many were removed"""
+        table = StoredSession.__table__
+        with db.engine.begin() as conn:
+            return conn.execute(table.delete().where(table.c.expires_at <= datetime.utcnow())).rowcount
+
+    def schedule_sweep(self, delay=0):
+        """Queue the next sweep in the caller's transaction (at most one pending)"""
+        if self.enabled:
+            task_queue.enqueue('sessions.sweep', dedup_key='sessions.sweep', delay=delay)
+
+    def stats(self):
+        """Return LRU hit/miss counters and current size"""
+        with self._lock:
+            return {'enabled': self.enabled, 'hits': self.hits, 'misses': self.misses,
+                    'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+session_store = SessionStore()
+
+
+@task_queue.task('sessions.sweep')
+def _sweep_sessions(payload):
+    session_store.sweep()
+    # Each sweep queues the next one in the same transaction as its own completion
+    session_store.schedule_sweep(delay=session_store.sweep_interval)
@@ -0,0 +1,208 @@
+// Strands game state (puzzles come from the server's pre-generated pool)
+let strandsState = {
+    currentTheme: '',
+    grid: [],
+    paths: {},
+    foundCells: new Set(),
+    foundWords: [],
+    targetWords: [],
+    score: 0,
+    gridSize: 8,
+    selectedPath: []
+};
+
+// Load page
+document.addEventListener('DOMContentLoaded', function() {
+    initializeStrands();
+});
+
+function initializeStrands() {
+    // Everyone starts on today's puzzle; "New Puzzle" draws a random one
+    startStrands(true);
+    const canvas = document.getElementById('strandsBoard');
+    if (canvas) {
+        canvas.addEventListener('mousedown', startStrandsSelection);
+        canvas.addEventListener('mousemove', continueStrandsSelection);
+        canvas.addEventListener('mouseup', endStrandsSelection);
+    }
+    
+    const input = document.getElementById('strandsInput');
+    if (input) {
+        input.addEventListener('keypress', function(e) {
+            if (e.key === 'Enter') {
+                submitStrandsWord();
+            }
+        });
+    }
+}
+
+function startStrands(daily = false) {
+    const url = window.ZJADOW_PUZZLE_URL + (daily ? '/daily' : '');
+    fetch(url)
+        .then(response => {
+            if (!response.ok) throw new Error('Puzzle request failed: ' + response.status);
+            return response.json();
+        })
+        .then(data => loadStrandsPuzzle(data.puzzle))
+        .catch(e => console.log('Could not load a Strands puzzle:', e));
+}
+
+function loadStrandsPuzzle(puzzle) {
+    strandsState.currentTheme = puzzle.theme;
+    strandsState.gridSize = puzzle.size;
+    strandsState.grid = puzzle.grid.map(row => row.split(''));
+    strandsState.targetWords = puzzle.words;
+    strandsState.paths = puzzle.paths;
+    strandsState.foundWords = [];
+    strandsState.foundCells = new Set();
+    strandsState.score = 0;
+    strandsState.selectedPath = [];
+    
+    document.getElementById('foundWordsList').innerHTML = '';
+    
+    updateStrandsDisplay();
+    drawStrandsBoard();
+}
+
+function drawStrandsBoard() {
+    const canvas = document.getElementById('strandsBoard');
+    if (!canvas) return;
+    
+    const ctx = canvas.getContext('2d');
+    const cellSize = 50;
+    
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    
+    // Draw grid
+    for (let i = 0; i < strandsState.gridSize; i++) {
+        for (let j = 0; j < strandsState.gridSize; j++) {
+            const x = j * cellSize;
+            const y = i * cellSize;
+            
+            // Background (found words stay highlighted)
+            ctx.fillStyle = strandsState.foundCells.has(i + ',' + j) ? '#d1e7dd' : '#f8f9fa';
+            ctx.fillRect(x, y, cellSize, cellSize);
+            
+            // Border
+            ctx.strokeStyle = '#dee2e6';
+            ctx.lineWidth = 1;
+            ctx.strokeRect(x, y, cellSize, cellSize);
+            
+            // Letter
+            ctx.fillStyle = '#212529';
+            ctx.font = '20px Arial';
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'middle';
+            ctx.fillText(
+                strandsState.grid[i][j],
+                x + cellSize/2,
+                y + cellSize/2
+            );
+        }
+    }
+    
+    // Highlight selected path
+    ctx.strokeStyle = '#007bff';
+    ctx.lineWidth = 3;
+    if (strandsState.selectedPath.length > 1) {
+        ctx.beginPath();
+        for (let i = 0; i < strandsState.selectedPath.length; i++) {
+            const {row, col} = strandsState.selectedPath[i];
+            const x = col * cellSize + cellSize/2;
+            const y = row * cellSize + cellSize/2;
+            
+            if (i === 0) {
+                ctx.moveTo(x, y);
+            } else {
+                ctx.lineTo(x, y);
+            }
+        }
+        ctx.stroke();
+    }
+}
+
+function startStrandsSelection(event) {
+    strandsState.selectedPath = [];
+    const {row, col} = getStrandsGridPosition(event);
+    if (row >= 0 && col >= 0) {
+        strandsState.selectedPath.push({row, col});
+        drawStrandsBoard();
+    }
+}
+
+function continueStrandsSelection(event) {
+    if (strandsState.selectedPath.length === 0) return;
+    
+    const {row, col} = getStrandsGridPosition(event);
+    if (row >= 0 && col >= 0) {
+        const lastPos = strandsState.selectedPath[strandsState.selectedPath.length - 1];
+        if (row !== lastPos.row || col !== lastPos.col) {
+            const rowDiff = Math.abs(row - lastPos.row);
+            const colDiff = Math.abs(col - lastPos.col);
+            if (rowDiff <= 1 && colDiff <= 1) {
+                strandsState.selectedPath.push({row, col});
+                drawStrandsBoard();
+            }
+        }
+    }
+}
+
+function endStrandsSelection() {
+    if (strandsState.selectedPath.length >= 3) {
+        const word = strandsState.selectedPath
+            .map(pos => strandsState.grid[pos.row][pos.col])
+            .join('');
+        checkStrandsWord(word);
+    }
+    strandsState.selectedPath = [];
+    drawStrandsBoard();
+}
+
+function getStrandsGridPosition(event) {
+    const canvas = document.getElementById('strandsBoard');
+    const rect = canvas.getBoundingClientRect();
+    const x = event.clientX - rect.left;
+    const y = event.clientY - rect.top;
+    
+    const col = Math.floor(x / 50);
+    const row = Math.floor(y / 50);
+    
+    return {row, col};
+}
+
+function submitStrandsWord() {
+    const input = document.getElementById('strandsInput');
+    const word = input.value.toUpperCase().trim();
+    input.value = '';
+    
+    if (word.length >= 3) {
+        checkStrandsWord(word);
+    }
+}
+
+function checkStrandsWord(word) {
+    if (strandsState.targetWords.includes(word) && !strandsState.foundWords.includes(word)) {
+        strandsState.foundWords.push(word);
+        strandsState.score += word.length * 10;
+        (strandsState.paths[word] || []).forEach(([row, col]) => strandsState.foundCells.add(row + ',' + col));
+        
+        const listItem = document.createElement('div');
+        listItem.className = 'list-group-item list-group-item-success';
+        listItem.textContent = word;
+        document.getElementById('foundWordsList').appendChild(listItem);
+        
+        if (strandsState.foundWords.length === strandsState.targetWords.length) {
+            ZjadowScores.submit('strands', strandsState.score);
+            setTimeout(() => alert('Congratulations! You found all words!'), 100);
+        }
+    }
+    
+    updateStrandsDisplay();
+}
+
+function updateStrandsDisplay() {
+    document.getElementById('strandsTheme').textContent = strandsState.currentTheme;
+    document.getElementById('strandsFound').textContent = strandsState.foundWords.length;
+    document.getElementById('strandsTotal').textContent = strandsState.targetWords.length;
+    document.getElementById('strandsScore').textContent = strandsState.score;
+}
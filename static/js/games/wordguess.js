@@ -0,0 +1,190 @@
+// Word Guess game state (words come from the server's puzzle pool)
+let wordGuessState = {
+    currentWord: '',
+    currentCategory: '',
+    guessedLetters: [],
+    wrongGuesses: 0,
+    maxWrongGuesses: 6,
+    score: 0,
+    gameOver: false
+};
+
+// Load page
+document.addEventListener('DOMContentLoaded', function() {
+    initializeWordGuess();
+});
+
+function initializeWordGuess() {
+    createAlphabetGrid();
+    // Everyone starts on today's word; "New Word" draws a random one
+    startWordGuess(true);
+}
+
+function createAlphabetGrid() {
+    const container = document.querySelector('.alphabet-grid');
+    if (!container) return;
+    
+    container.innerHTML = '';
+    for (let i = 65; i <= 90; i++) {
+        const letter = String.fromCharCode(i);
+        const button = document.createElement('button');
+        button.className = 'btn btn-outline-secondary btn-sm m-1';
+        button.textContent = letter;
+        button.onclick = () => guessLetter(letter);
+        button.id = `letter-${letter}`;
+        container.appendChild(button);
+    }
+}
+
+function startWordGuess(daily = false) {
+    const url = window.ZJADOW_PUZZLE_URL + (daily ? '/daily' : '');
+    fetch(url)
+        .then(response => {
+            if (!response.ok) throw new Error('Puzzle request failed: ' + response.status);
+            return response.json();
+        })
+        .then(data => loadWordGuess(data.puzzle))
+        .catch(e => console.log('Could not load a Word Guess word:', e));
+}
+
+function loadWordGuess(puzzle) {
+    wordGuessState.currentCategory = puzzle.category;
+    wordGuessState.currentWord = puzzle.word;
+    wordGuessState.guessedLetters = [];
+    wordGuessState.wrongGuesses = 0;
+    wordGuessState.gameOver = false;
+    
+    // Reset alphabet buttons
+    for (let i = 65; i <= 90; i++) {
+        const letter = String.fromCharCode(i);
+        const button = document.getElementById(`letter-${letter}`);
+        if (button) {
+            button.disabled = false;
+            button.className = 'btn btn-outline-secondary btn-sm m-1';
+        }
+    }
+    
+    updateWordGuessDisplay();
+    drawHangman();
+}
+
+function guessLetter(letter) {
+    if (wordGuessState.gameOver || wordGuessState.guessedLetters.includes(letter)) return;
+    
+    wordGuessState.guessedLetters.push(letter);
+    const button = document.getElementById(`letter-${letter}`);
+    
+    if (wordGuessState.currentWord.includes(letter)) {
+        button.className = 'btn btn-success btn-sm m-1';
+        wordGuessState.score += 10;
+    } else {
+        button.className = 'btn btn-danger btn-sm m-1';
+        wordGuessState.wrongGuesses++;
+        drawHangman();
+    }
+    
+    button.disabled = true;
+    
+    // Check win/lose conditions
+    const wordRevealed = wordGuessState.currentWord.split('').every(letter => 
+        wordGuessState.guessedLetters.includes(letter));
+    
+    if (wordRevealed) {
+        wordGuessState.gameOver = true;
+        wordGuessState.score += 50;
+        ZjadowScores.submit('wordguess', wordGuessState.score);
+        setTimeout(() => alert('You won! +50 bonus points'), 100);
+    } else if (wordGuessState.wrongGuesses >= wordGuessState.maxWrongGuesses) {
+        wordGuessState.gameOver = true;
+        ZjadowScores.submit('wordguess', wordGuessState.score);
+        setTimeout(() => alert(`Game Over! The word was: ${wordGuessState.currentWord}`), 100);
+    }
+    
+    updateWordGuessDisplay();
+}
+
+function updateWordGuessDisplay() {
+    const displayWord = wordGuessState.currentWord.split('').map(letter => 
+        wordGuessState.guessedLetters.includes(letter) ? letter : '_').join(' ');
+    
+    document.getElementById('wordDisplay').textContent = displayWord;
+    document.getElementById('wordCategory').textContent = wordGuessState.currentCategory;
+    document.getElementById('guessesLeft').textContent = 
+        wordGuessState.maxWrongGuesses - wordGuessState.wrongGuesses;
+    document.getElementById('wordScore').textContent = wordGuessState.score;
+}
+
+function drawHangman() {
+    const canvas = document.getElementById('hangmanCanvas');
+    if (!canvas) return;
+    
+    const ctx = canvas.getContext('2d');
+    ctx.clearRect(0, 0, canvas.width, canvas.height);
+    ctx.strokeStyle = '#333';
+    ctx.lineWidth = 3;
+    
+    // Draw based on wrong guesses
+    if (wordGuessState.wrongGuesses >= 1) {
+        // Base
+        ctx.beginPath();
+        ctx.moveTo(10, 240);
+        ctx.lineTo(100, 240);
+        ctx.stroke();
+    }
+    if (wordGuessState.wrongGuesses >= 2) {
+        // Pole
+        ctx.beginPath();
+        ctx.moveTo(30, 240);
+        ctx.lineTo(30, 20);
+        ctx.stroke();
+    }
+    if (wordGuessState.wrongGuesses >= 3) {
+        // Top beam
+        ctx.beginPath();
+        ctx.moveTo(30, 20);
+        ctx.lineTo(120, 20);
+        ctx.stroke();
+    }
+    if (wordGuessState.wrongGuesses >= 4) {
+        // Noose
+        ctx.beginPath();
+        ctx.moveTo(120, 20);
+        ctx.lineTo(120, 50);
+        ctx.stroke();
+    }
+    if (wordGuessState.wrongGuesses >= 5) {
+        // Head
+        ctx.beginPath();
+        ctx.arc(120, 70, 20, 0, Math.PI * 2);
+        ctx.stroke();
+    }
+    if (wordGuessState.wrongGuesses >= 6) {
+        // Body and limbs
+        ctx.beginPath();
+        ctx.moveTo(120, 90);
+        ctx.lineTo(120, 180);
+        ctx.moveTo(120, 120);
+        ctx.lineTo(90, 140);
+        ctx.moveTo(120, 120);
+        ctx.lineTo(150, 140);
+        ctx.moveTo(120, 180);
+        ctx.lineTo(90, 210);
+        ctx.moveTo(120, 180);
+        ctx.lineTo(150, 210);
+        ctx.stroke();
+    }
+}
+
+function giveWordHint() {
+    if (wordGuessState.gameOver) return;
+    
+    const unguessedLetters = wordGuessState.currentWord.split('')
+        .filter(letter => !wordGuessState.guessedLetters.includes(letter));
+    
+    if (unguessedLetters.length > 0) {
+        const hintLetter = unguessedLetters[Math.floor(Math.random() * unguessedLetters.length)];
+        guessLetter(hintLetter);
+        wordGuessState.score -= 5; // Penalty for using hint
+        updateWordGuessDisplay();
+    }
+}
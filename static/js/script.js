@@ -2,6 +2,7 @@
 
 document.addEventListener('DOMContentLoaded', function() {
     // Initialize all interactive features
+    initUserFragment();
     initNavigation();
     initAnimations();
     initInteractiveElements();
@@ -10,6 +11,22 @@ document.addEventListener('DOMContentLoaded', function() {
     console.log('Portfolio website loaded successfully! 🚀');
 });
 
+// Per-user navbar menu and flash messages (the page itself is the same for everyone)
+function initUserFragment() {
+    const userMenu = document.getElementById('userMenu');
+    if (!userMenu) return;
+    
+    fetch(userMenu.dataset.fragmentUrl, { credentials: 'same-origin' })
+        .then(response => response.ok ? response.json() : null)
+        .then(fragment => {
+            if (!fragment) return;
+            userMenu.innerHTML = fragment.nav;
+            const flashArea = document.getElementById('flashArea');
+            if (flashArea) flashArea.innerHTML = fragment.flashes;
+        })
+        .catch(e => console.log('Could not load the user menu:', e));
+}
+
 // Navigation Enhancement
 function initNavigation() {
     const navbar = document.querySelector('.navbar');
@@ -532,4 +549,23 @@ window.PortfolioJS = {
         }
     });
     
-})();
\ No newline at end of file
+})();
+
+// Submit a finished game's score to the server-side leaderboard
+window.ZjadowScores = {
+    submit: function(game, score) {
+        score = Math.floor(Number(score));
+        if (!Number.isFinite(score) || score <= 0) {
+            return;
+        }
+        fetch('/api/v1/scores', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ game: game, score: score }),
+            credentials: 'same-origin',
+            keepalive: true
+        }).catch(function() {
+            // Leaderboards are best effort; local high scores still work offline
+        });
+    }
+};
@@ -0,0 +1,175 @@
+"""
+Static file serving and response compression for ZjadowRealm
+
+Replaces Flask's default ``static`` view with a WhiteNoise-style server:
+files are indexed once at startup, gzip/brotli siblings written at build
+time (``precompress``) are picked by ``Accept-Encoding``, bodies go out
+through ``send_file`` (so gunicorn can use sendfile and Range requests work
+for the audio), and fingerprinted bundles are cached forever. Dynamic text
+responses above a size threshold are compressed on the fly.
+"""
+import gzip
+import mimetypes
+import os
+import re
+import threading
+
+from flask import abort, request, send_file
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Fingerprinted bundles (``name.<12 hex>.ext``) never change once written
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{12}\.\w+$')
+
+# Text formats worth compressing (images and audio are already compressed)
+COMPRESSIBLE_TYPES = {'text/html', 'text/css', 'text/plain', 'text/javascript',
+                      'application/javascript', 'application/json', 'image/svg+xml'}
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def precompress(path):
+    """Write ``path.gz`` (and ``path.br`` if brotli is installed) next to ``path``"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+    if brotli is not None:
+        variants.append(('.br', brotli.compress(data, mode=brotli.MODE_TEXT)))
+    for suffix, compressed in variants:
+        # Not worth serving if compression doesn't shrink the file
+        if len(compressed) >= len(data):
+            continue
+        tmp = f'{path}{suffix}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp, path + suffix)
+
+
+class StaticFile:
+    """A servable file and its precompressed variants"""
+
+    __slots__ = ('path', 'mimetype', 'variants')
+
+    def __init__(self, path):
+        self.path = path
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.variants = {encoding: path + suffix for encoding, suffix in ENCODINGS
+                         if os.path.isfile(path + suffix)}
+
+
+class StaticFiles:
+    """Static file server with precompressed variants and far-future caching"""
+
+    def __init__(self, app=None):
+        self.max_age = 86400
+        self.compress_min_size = 1024
+        self.compress_level = 6
+        self._files = {}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Index the static folder, take over the static view and hook compression"""
+        app.config.setdefault('STATIC_MAX_AGE', self.max_age)
+        app.config.setdefault('COMPRESS_MIN_SIZE', self.compress_min_size)
+        app.config.setdefault('COMPRESS_LEVEL', self.compress_level)
+        self.max_age = int(app.config['STATIC_MAX_AGE'])
+        self.compress_min_size = int(app.config['COMPRESS_MIN_SIZE'])
+        self.compress_level = int(app.config['COMPRESS_LEVEL'])
+        self.root = app.static_folder
+        self.scan()
+
+        app.view_functions['static'] = self.serve
+        app.after_request(self._compress)
+
+    def scan(self):
+        """(Re)build the index of servable files"""
+        files = {}
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.endswith(('.gz', '.br', '.tmp')):
+                    continue
+                path = os.path.join(directory, name)
+                files[os.path.relpath(path, self.root).replace(os.sep, '/')] = StaticFile(path)
+        with self._lock:
+            self._files = files
+
+    def _find(self, filename):
+        static_file = self._files.get(filename)
+        if static_file is not None:
+            return static_file
+        # Files written after startup (e.g. a rebuilt bundle) are picked up lazily
+        path = safe_join(self.root, filename)
+        if path is None or not os.path.isfile(path):
+            return None
+        static_file = StaticFile(path)
+        with self._lock:
+            self._files[filename] = static_file
+        return static_file
+
+    def serve(self, filename):
+        """View for ``/static/<path:filename>``"""
+        static_file = self._find(filename)
+        if static_file is None:
+            abort(404)
+
+        path, encoding = static_file.path, None
+        # Ranges refer to the identity body, so only whole-file requests get a variant
+        if static_file.variants and request.range is None:
+            accepted = request.accept_encodings
+            for candidate, _ in ENCODINGS:
+                if candidate in static_file.variants and accepted[candidate]:
+                    path, encoding = static_file.variants[candidate], candidate
+                    break
+
+        immutable = FINGERPRINTED.search(filename) is not None
+        response = send_file(path, mimetype=static_file.mimetype, conditional=True,
+                             max_age=IMMUTABLE_MAX_AGE if immutable else self.max_age)
+        response.cache_control.public = True
+        if immutable:
+            response.cache_control.immutable = True
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if static_file.variants:
+            response.vary.add('Accept-Encoding')
+        return response
+
+    def _compress(self, response):
+        """Compress large text responses the client can decode"""
+        if (response.status_code != 200 or response.direct_passthrough
+                or response.is_streamed or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_TYPES):
+            return response
+        data = response.get_data()
+        if len(data) < self.compress_min_size:
+            return response
+
+        accepted = request.accept_encodings
+        if brotli is not None and accepted['br']:
+            # Low quality keeps brotli cheaper than gzip -9 with a better ratio
+            body, encoding = brotli.compress(data, mode=brotli.MODE_TEXT, quality=4), 'br'
+        elif accepted['gzip']:
+            body, encoding = gzip.compress(data, compresslevel=self.compress_level), 'gzip'
+        else:
+            response.vary.add('Accept-Encoding')
+            return response
+
+        response.set_data(body)
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        # The encoded body differs byte-wise, so a strong ETag becomes weak
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+
+static_files = StaticFiles()
@@ -0,0 +1,161 @@
+"""
+Background jobs for ZjadowRealm
+
+Admin writes add ``Job`` rows in the same transaction as the change itself,
+so a saved item can never lose its follow-up work. The worker process
+(``flask --app app run-worker``, the ``worker`` entry in the Procfile)
+then refreshes the derived data:
+
+- jobs with a ``dedup_key`` are skipped while an identical job is still
+  pending, so saving the same item ten times re-indexes it once;
+- handlers registered with ``batch=True`` get every due job of their name
+  in one call (up to ``JOB_BATCH_SIZE``) and finish in one transaction;
+- failures are retried with exponential backoff up to ``JOB_MAX_ATTEMPTS``
+  times, then kept as ``failed`` with the error for inspection.
+
+Jobs are claimed with ``FOR UPDATE SKIP LOCKED`` on PostgreSQL, so several
+workers can share the queue. A job left ``running`` longer than
+``JOB_LEASE`` seconds (its worker died) is picked up again.
+"""
+import json
+import threading
+import traceback
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_
+
+from models import db, Job
+
+
+class TaskQueue:
+    """Database-backed job queue with a polling worker"""
+
+    def __init__(self, app=None):
+        self.batch_size = 100
+        self.max_attempts = 5
+        self.retry_delay = 10.0
+        self.poll_interval = 1.0
+        self.lease = 300
+        self._handlers = {}
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read queue settings from the app config"""
+        app.config.setdefault('JOB_BATCH_SIZE', self.batch_size)
+        app.config.setdefault('JOB_MAX_ATTEMPTS', self.max_attempts)
+        app.config.setdefault('JOB_RETRY_DELAY', self.retry_delay)
+        app.config.setdefault('JOB_POLL_INTERVAL', self.poll_interval)
+        app.config.setdefault('JOB_LEASE', self.lease)
+        self.batch_size = int(app.config['JOB_BATCH_SIZE'])
+        self.max_attempts = int(app.config['JOB_MAX_ATTEMPTS'])
+        self.retry_delay = float(app.config['JOB_RETRY_DELAY'])
+        self.poll_interval = float(app.config['JOB_POLL_INTERVAL'])
+        self.lease = int(app.config['JOB_LEASE'])
+        self.app = app
+
+    def task(self, name, batch=False):
+        """Register a handler; batch handlers receive a list of payloads"""
+        def decorator(func):
+            self._handlers[name] = (func, batch)
+            return func
+        return decorator
+
+    def enqueue(self, name, payload=None, dedup_key=None, delay=0):
+        """Add a job to the current transaction (the caller commits)"""
+        if dedup_key is not None:
+            pending = Job.query.filter_by(dedup_key=dedup_key, status='pending') \
+                .with_entities(Job.id).first()
+            if pending is not None:
+                return
+        db.session.add(Job(name=name, payload=json.dumps(payload or {}), dedup_key=dedup_key,
+                           run_at=datetime.utcnow() + timedelta(seconds=delay)))
+
+    def _claim(self):
+        now = datetime.utcnow()
+        due = or_(Job.status == 'pending',
+                  (Job.status == 'running') & (Job.locked_at < now - timedelta(seconds=self.lease)))
+        first = Job.query.filter(due, Job.run_at <= now).order_by(Job.run_at, Job.id).first()
+        if first is None:
+            db.session.rollback()
+            return []
+        _, batch = self._handlers.get(first.name, (None, False))
+        ids = db.session.query(Job.id).filter(due, Job.run_at <= now, Job.name == first.name) \
+            .order_by(Job.run_at, Job.id).limit(self.batch_size if batch else 1) \
+            .with_for_update(skip_locked=True)
+        token = uuid.uuid4().hex
+        # The status check is repeated so a job claimed meanwhile is left alone
+        Job.query.filter(Job.id.in_([row.id for row in ids]), due).update(
+            {'status': 'running', 'locked_by': token, 'locked_at': now,
+             'attempts': Job.attempts + 1}, synchronize_session=False)
+        db.session.commit()
+        return Job.query.filter_by(locked_by=token).order_by(Job.id).all()
+
+    def run_once(self):
+        """Claim and run one batch of due jobs; returns the number processed"""
+        jobs = self._claim()
+        if not jobs:
+            return 0
+        name = jobs[0].name
+        ids = [job.id for job in jobs]
+        try:
+            func, batch = self._handlers[name]
+            payloads = [json.loads(job.payload) for job in jobs]
+            if batch:
+                func(payloads)
+            else:
+                func(payloads[0])
+            Job.query.filter(Job.id.in_(ids)).delete(synchronize_session=False)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            error = traceback.format_exc(limit=5)
+            self.app.logger.warning('Job %s failed (ids %s):\n%s', name, ids, error)
+            now = datetime.utcnow()
+            for job in Job.query.filter(Job.id.in_(ids)):
+                job.last_error = error
+                job.locked_by = None
+                if job.attempts >= self.max_attempts:
+                    job.status = 'failed'
+                else:
+                    job.status = 'pending'
+                    job.run_at = now + timedelta(seconds=self.retry_delay * 2 ** (job.attempts - 1))
+            db.session.commit()
+        return len(jobs)
+
+    def work(self, stop=None):
+        """Process jobs until ``stop`` (a ``threading.Event``) is set"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception:
+                db.session.rollback()
+                self.app.logger.exception('Job worker error')
+                processed = 0
+            finally:
+                db.session.remove()
+            if not processed:
+                stop.wait(self.poll_interval)
+
+    def start_thread(self):
+        """Run a worker inside this process (local development)"""
+        def run():
+            with self.app.app_context():
+                self.work()
+        thread = threading.Thread(target=run, name='job-worker', daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        """Return job counts by status and the age of the oldest pending job"""
+        counts = dict(db.session.query(Job.status, func.count(Job.id)).group_by(Job.status).all())
+        oldest = db.session.query(func.min(Job.run_at)).filter(Job.status == 'pending').scalar()
+        age = (datetime.utcnow() - oldest).total_seconds() if oldest else 0
+        return {'pending': counts.get('pending', 0), 'running': counts.get('running', 0),
+                'failed': counts.get('failed', 0), 'oldest_pending_seconds': round(max(age, 0), 1)}
+
+
+task_queue = TaskQueue()
@@ -0,0 +1,43 @@
+// ZjadowRealm service worker: precaches the fingerprinted game bundles and
+// audio sprites so repeat visits load them without touching the network.
+const CACHE_PREFIX = 'zjadow-games-';
+const CACHE_NAME = CACHE_PREFIX + {{ version|tojson }};
+const PRECACHE_URLS = {{ urls|tojson }};
+const DIST_PREFIX = {{ dist_prefix|tojson }};
+
+self.addEventListener('install', event => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(PRECACHE_URLS))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', event => {
+    // Fingerprints changed: drop the caches of earlier builds
+    event.waitUntil(
+        caches.keys()
+            .then(names => Promise.all(names
+                .filter(name => name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME)
+                .map(name => caches.delete(name))))
+            .then(() => self.clients.claim())
+    );
+});
+
+self.addEventListener('fetch', event => {
+    const url = new URL(event.request.url);
+    if (event.request.method !== 'GET' || url.origin !== self.location.origin
+            || !url.pathname.startsWith(DIST_PREFIX)) {
+        return;
+    }
+    // Fingerprinted files never change, so the cache always wins
+    event.respondWith(
+        caches.open(CACHE_NAME).then(cache => cache.match(event.request).then(hit => {
+            if (hit) return hit;
+            return fetch(event.request).then(response => {
+                if (response.ok) cache.put(event.request, response.clone());
+                return response;
+            });
+        }))
+    );
+});
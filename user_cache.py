@@ -0,0 +1,97 @@
+"""
+In-process cache of user identities for ZjadowRealm
+
+Flask-Login calls ``load_user`` on every request, so without a cache each
+page view costs a primary-key lookup on the ``user`` table. The cache only
+keeps the fields needed for authentication and templates; anything that
+needs the full row (e.g. password changes) must load ``User`` explicitly.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from flask_login import UserMixin
+
+
+class CachedUser(UserMixin):
+    """Lightweight stand-in for ``User`` used as ``current_user``"""
+
+    __slots__ = ('id', 'username', 'is_admin', 'is_approved')
+
+    def __init__(self, id, username, is_admin, is_approved):
+        self.id = id
+        self.username = username
+        self.is_admin = bool(is_admin)
+        self.is_approved = bool(is_approved)
+
+    @classmethod
+    def from_user(cls, user):
+        """Build a cached identity from a ``User`` row"""
+        return cls(user.id, user.username, user.is_admin, user.is_approved)
+
+    def __repr__(self):
+        return f'<CachedUser {self.username}>'
+
+
+class UserIdentityCache:
+    """Thread-safe LRU cache of ``CachedUser`` entries with a TTL
+
+    Each gunicorn worker holds its own cache, so an invalidation only
+    reaches the worker that handled the admin action; the TTL bounds how
+    long the other workers can serve a stale identity.
+    """
+
+    def __init__(self, ttl=60, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id, loader):
+        """Return the identity for ``user_id``, calling ``loader`` on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        user = loader(user_id)
+        if user is None:
+            self.invalidate(user_id)
+            return None
+
+        identity = CachedUser.from_user(user)
+        with self._lock:
+            self._entries[user_id] = (now + self.ttl, identity)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return identity
+
+    def invalidate(self, user_id):
+        """Drop the cached entry for ``user_id`` if present"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+            }